@@ -0,0 +1,41 @@
+# Compares the pydantic serialization of blocks with the cached one, and validated decoding with trusted decoding, for a message
+# of 20 blocks.
+# Run: python -m benchmarks.blockkit_bench
+import json
+import timeit
+
+from kakaowork import ActionBlock, ButtonBlock, DescriptionBlock, HeaderBlock, TextBlock, Block, decode_blocks
+from kakaowork.utils import json_default
+
+NUMBER = 2000
+BLOCKS = [HeaderBlock(text='announcement')]
+for i in range(19):
+    if i % 2:
+        BLOCKS.append(DescriptionBlock(term=f'term{i}', content=TextBlock(text=f'content {i}')))
+    else:
+        BLOCKS.append(ActionBlock(elements=[ButtonBlock(text=f'button {i}', value=str(i)), ButtonBlock(text='cancel')]))
+DATA = json.loads(json.dumps(BLOCKS, default=json_default))
+
+
+def pydantic_dumps() -> str:
+    return json.dumps([block.dict(exclude_none=True) for block in BLOCKS])
+
+
+def cached_dumps() -> str:
+    return json.dumps(BLOCKS, default=json_default)
+
+
+if __name__ == '__main__':
+    assert pydantic_dumps() == cached_dumps()
+    for name, func in (
+        ('dict', pydantic_dumps),
+        ('to_dict', cached_dumps),
+        ('json', lambda: [block.json(exclude_none=True) for block in BLOCKS]),
+        ('str', lambda: [str(block) for block in BLOCKS]),
+        ('eq', lambda: [block == block for block in BLOCKS]),
+        ('new', lambda: [Block.new(block) for block in DATA]),
+        ('decode', lambda: decode_blocks(DATA)),
+        ('trusted', lambda: decode_blocks(DATA, trusted=True)),
+    ):
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f'{name:<10} {elapsed / NUMBER * 1e6:10.2f} us')
@@ -0,0 +1,44 @@
+# Compares building a 50-block modal by assigning properties one at a time with the bulk construction of BlockKitBuilder.
+# Run: python -m benchmarks.builder_bench
+import json
+import timeit
+from typing import Any, Dict
+
+from kakaowork import BlockKitBuilder
+
+NUMBER = 200
+DATA: Dict[str, Any] = {
+    'type': 'modal',
+    'title': 'survey',
+    'blocks': [],
+    'accept': 'submit',
+    'decline': 'cancel',
+    'value': 'survey_1',
+}
+for i in range(25):
+    DATA['blocks'].append({'type': 'label', 'text': f'question {i}', 'markdown': True})
+    DATA['blocks'].append({'type': 'input', 'name': f'answer_{i}', 'required': True, 'placeholder': 'answer'})
+JSON = json.dumps(DATA)
+
+
+def assign(data: Dict[str, Any]) -> BlockKitBuilder:
+    # The previous load(): every assignment revalidates the builder with the blocks assigned so far.
+    builder = BlockKitBuilder(type=data['type'])
+    for key, value in data.items():
+        if key == 'blocks':
+            builder.blocks = []
+            for block in value:
+                builder.add_block(block)
+        else:
+            setattr(builder, key, value)
+    return builder
+
+
+if __name__ == '__main__':
+    assert assign(DATA) == BlockKitBuilder.from_dict(DATA)
+    for name, func in (
+        ('setattr', lambda: assign(json.loads(JSON))),
+        ('from_json', lambda: BlockKitBuilder.from_json(JSON)),
+    ):
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f'{name:<10} {elapsed / NUMBER * 1e3:10.2f} ms')
@@ -0,0 +1,44 @@
+# Compares the stdlib and orjson codecs encoding a message request and decoding a user list response.
+# Run: python -m benchmarks.codec_bench
+import timeit
+
+from kakaowork import (
+    HeaderBlock,
+    TextBlock,
+    DividerBlock,
+    ButtonBlock,
+    ButtonActionType,
+    UserListResponse,
+)
+from kakaowork.codec import CODECS
+
+NUMBER = 2000
+
+payload = {
+    'conversation_id': 1,
+    'text': 'Payment notice',
+    'blocks': [
+        HeaderBlock(text='Payment notice'),
+        TextBlock(text='Dear kim, your payment of 1000 KRW is complete.'),
+        DividerBlock(),
+        ButtonBlock(text='Details', action_type=ButtonActionType.OPEN_SYSTEM_BROWSER, value='https://localhost/payments/kim'),
+    ],
+}
+
+user = ('{"id": "%d", "space_id": "1", "name": "kim", "display_name": "kim", "nickname": "kim", "department": "dev", "position": "dev", '
+        '"responsibility": "dev", "tels": [], "mobiles": [], "emails": ["kim@localhost"], "work_start_time": 1617889170, '
+        '"work_end_time": 1617892770, "vacation_start_time": null, "vacation_end_time": null, "avatar_url": null, "status": "activated", '
+        '"identifications": [{"type": "email", "value": "kim@localhost"}]}')
+response = ('{"success": true, "error": null, "cursor": null, "users": [%s]}' % ', '.join(user % i for i in range(100))).encode('utf-8')
+
+if __name__ == '__main__':
+    for name, codec_cls in CODECS.items():
+        try:
+            codec = codec_cls()
+        except ImportError as e:
+            print(f'{name:<8} skipped ({e})')
+            continue
+        encode = min(timeit.repeat(lambda: codec.encode(payload), number=NUMBER, repeat=5))
+        decode = min(timeit.repeat(lambda: codec.decode(response), number=NUMBER, repeat=5))
+        parse = min(timeit.repeat(lambda: codec.parse(UserListResponse, response), number=NUMBER // 10, repeat=5))
+        print(f'{name:<8} encode {encode / NUMBER * 1e6:8.2f} us  decode {decode / NUMBER * 1e6:8.2f} us  parse {parse / (NUMBER // 10) * 1e6:8.2f} us')
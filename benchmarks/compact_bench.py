@@ -0,0 +1,55 @@
+# Compares memory of a synthetic 100k-user directory held as UserField objects and as compact records.
+# Run: python -m benchmarks.compact_bench
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from kakaowork import UserField
+from kakaowork.compact import CompactUser, UserDirectory
+
+USERS = 100_000
+DEPARTMENTS = ['Engineering', 'Sales', 'Marketing', 'Finance', 'HR']
+POSITIONS = ['Staff', 'Manager', 'Director']
+
+
+def synthetic_user(i: int) -> Dict[str, Any]:
+    return {
+        'id': str(i),
+        'space_id': '1234',
+        'name': f'user{i}',
+        'display_name': f'user{i}',
+        'identifications': [{'type': 'email', 'value': f'user{i}@localhost'}],
+        'department': DEPARTMENTS[i % len(DEPARTMENTS)],
+        'position': POSITIONS[i % len(POSITIONS)],
+        'responsibility': 'Member',
+        'tels': [],
+        'mobiles': [f'010-0000-{i % 10000:04d}'],
+        'work_start_time': 1617840000,
+        'work_end_time': 1617872400,
+        'vacation_start_time': None,
+        'vacation_end_time': None,
+    }
+
+
+def measure(build: Callable[[List[Dict[str, Any]]], Any], users: List[Dict[str, Any]]) -> int:
+    # Strings are copied so that interning, not literal sharing of the synthetic data, dedupes them.
+    users = [{k: (''.join(v) if isinstance(v, str) else v) for k, v in user.items()} for user in users]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(users)
+    users.clear()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+if __name__ == '__main__':
+    users = [synthetic_user(i) for i in range(USERS)]
+    for name, build in (
+        ('UserField', lambda users: [UserField(**user) for user in users]),
+        ('UserDirectory', lambda users: UserDirectory(CompactUser.from_dict(user) for user in users)),
+    ):
+        print(f'{name:<14} {measure(build, users) / 1024 / 1024:8.1f} MiB')
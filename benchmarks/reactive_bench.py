@@ -0,0 +1,116 @@
+# Compares callback latency under concurrent load of the single-threaded http.server example and the asyncio ReactiveServer with sync and async handlers.
+# Run: python -m benchmarks.reactive_bench
+import json
+import time
+import asyncio
+import threading
+from collections import Counter
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from typing import Any, Counter as CounterType, List, Tuple
+
+from kakaowork import AsyncKakaowork, BaseReactiveActionHandler, BaseAsyncReactiveActionHandler, SubmitActionReactiveBody, ReactiveServer
+
+REQUESTS = 400
+CLIENTS = 50
+# A reply through the client, e.g. Messages.send, takes a round trip to the API server.
+HANDLER_SECONDS = 0.01
+
+MESSAGE = {'id': '1', 'text': 'msg', 'user_id': '1', 'conversation_id': 1, 'send_time': 1617889170, 'update_time': 1617889170}
+BODY = json.dumps({
+    'type': 'submit_action',
+    'action_time': '2021-01-01',
+    'message': MESSAGE,
+    'value': 'value',
+    'action_name': 'confirm',
+    'react_user_id': 1,
+}).encode('utf-8')
+REQUEST = b'POST /callback HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s' % (len(BODY), BODY)
+
+
+class Handler(BaseReactiveActionHandler):
+    def handle_submit(self, body: SubmitActionReactiveBody) -> bool:
+        time.sleep(HANDLER_SECONDS)
+        return True
+
+
+class AsyncHandler(BaseAsyncReactiveActionHandler):
+    async def handle_submit(self, body: SubmitActionReactiveBody) -> bool:
+        await asyncio.sleep(HANDLER_SECONDS)
+        return True
+
+
+handler = Handler()
+
+
+class HTTPRequestHandler(BaseHTTPRequestHandler):
+    # examples/reactive_handler.py before the built-in server
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = SubmitActionReactiveBody.parse_raw(self.rfile.read(length).decode('utf-8'))
+        handler.handle_submit(body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(HTTPServer):
+    request_queue_size = CLIENTS
+
+
+async def _call(address: Tuple[str, int]) -> Tuple[int, float]:
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(REQUEST)
+    status = int((await reader.readline()).split()[1])
+    await reader.read()
+    writer.close()
+    return status, time.perf_counter() - started
+
+
+async def _load(address: Tuple[str, int]) -> Tuple[List[float], CounterType[int], float]:
+    semaphore = asyncio.Semaphore(CLIENTS)
+
+    async def _client() -> Tuple[int, float]:
+        async with semaphore:
+            return await _call(address)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_client() for _ in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    return sorted(latency for status, latency in results if status == 200), Counter(status for status, _ in results), elapsed
+
+
+def _report(name: str, latencies: List[float], statuses: CounterType[int], elapsed: float) -> None:
+    p50 = latencies[len(latencies) // 2] * 1e3 if latencies else 0.0
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3 if latencies else 0.0
+    counts = ' '.join(f'{status}={count}' for status, count in sorted(statuses.items()))
+    print(f'{name:<28} p50 {p50:8.1f} ms  p99 {p99:8.1f} ms  {REQUESTS / elapsed:8.1f} req/s  {counts}')
+
+
+async def _reactive_server(name: str, action_handler: Any = handler, **kwargs) -> None:
+    async with ReactiveServer(action_handler=action_handler, **kwargs) as server:
+        await server.start('127.0.0.1', 0)
+        _report(name, *(await _load(server.address)))
+
+
+async def main() -> None:
+    server = _HTTPServer(('127.0.0.1', 0), HTTPRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        _report('http.server', *(await _load(server.server_address[:2])))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    await _reactive_server('ReactiveServer', concurrency=CLIENTS, queue_size=CLIENTS)
+    await _reactive_server('ReactiveServer (overloaded)', concurrency=8, queue_size=8)
+    await _reactive_server('ReactiveServer (async)', AsyncHandler(AsyncKakaowork(app_key='dummy')), concurrency=CLIENTS, queue_size=CLIENTS)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+# Compares building message blocks per recipient with rendering a precompiled template.
+# Run: python -m benchmarks.template_bench
+import timeit
+
+from kakaowork import (
+    BlockKitType,
+    BlockKitBuilder,
+    BlockKitPayload,
+    HeaderBlock,
+    TextBlock,
+    DividerBlock,
+    ButtonBlock,
+    ButtonActionType,
+)
+
+NUMBER = 2000
+
+
+def build_from_scratch(name: str, amount: int) -> bytes:
+    blocks = [
+        HeaderBlock(text='Payment notice'),
+        TextBlock(text=f'Dear {name}, your payment of {amount} KRW is complete.'),
+        DividerBlock(),
+        ButtonBlock(text='Details', action_type=ButtonActionType.OPEN_SYSTEM_BROWSER, value=f'https://localhost/payments/{name}'),
+    ]
+    return BlockKitPayload.encode(text=f'Payment notice for {name}', blocks=blocks).body(conversation_id=1)
+
+
+template = BlockKitBuilder(
+    type=BlockKitType.MESSAGE,
+    text='Payment notice for {name}',
+    blocks=[
+        HeaderBlock(text='Payment notice'),
+        TextBlock(text='Dear {name}, your payment of {amount} KRW is complete.'),
+        DividerBlock(),
+        ButtonBlock(text='Details', action_type=ButtonActionType.OPEN_SYSTEM_BROWSER, value='https://localhost/payments/{name}'),
+    ],
+).compile()
+
+
+def render_template(name: str, amount: int) -> bytes:
+    return template.render(name=name, amount=amount).body(conversation_id=1)
+
+
+if __name__ == '__main__':
+    assert build_from_scratch('kim', 1000) == render_template('kim', 1000)
+    for func in (build_from_scratch, render_template):
+        elapsed = min(timeit.repeat(lambda: func('kim', 1000), number=NUMBER, repeat=5))
+        print(f'{func.__name__:<20} {elapsed / NUMBER * 1e6:8.2f} us/message')
@@ -0,0 +1,36 @@
+# Compares the pytz conversion with the fixed-offset fast path of to_kst, in batch and in model construction.
+# Run: python -m benchmarks.timestamp_bench
+import timeit
+from datetime import datetime
+
+from pytz import utc
+
+from kakaowork import UserField
+from kakaowork.consts import KST
+from kakaowork.utils import to_kst, to_kst_many
+
+NUMBER = 20000
+TIMESTAMP = 1617889170
+PAGE = [TIMESTAMP + (i % 4) * 3600 for i in range(400)]  # 100 users with 4 timestamps each
+
+
+def pytz_to_kst(timestamp: int) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=utc).astimezone(KST)
+
+
+def build_user() -> UserField:
+    return UserField(id='1', space_id='1', name='kim', work_start_time=TIMESTAMP, work_end_time=TIMESTAMP, vacation_start_time=TIMESTAMP,
+                     vacation_end_time=TIMESTAMP)
+
+
+if __name__ == '__main__':
+    for name, func, number in (
+        ('pytz', lambda: pytz_to_kst(TIMESTAMP), NUMBER),
+        ('to_kst', lambda: to_kst(TIMESTAMP), NUMBER),
+        ('pytz (page)', lambda: [pytz_to_kst(ts) for ts in PAGE], NUMBER // 100),
+        ('to_kst (page)', lambda: [to_kst(ts) for ts in PAGE], NUMBER // 100),
+        ('to_kst_many (page)', lambda: to_kst_many(PAGE), NUMBER // 100),
+        ('UserField', build_user, NUMBER // 10),
+    ):
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name:<20} {elapsed / number * 1e6:10.2f} us')
@@ -0,0 +1,16 @@
+# Compares validated and trusted parsing of a user list response with 100 users.
+# Run: python -m benchmarks.trusted_bench
+import timeit
+
+from kakaowork import UserListResponse
+from kakaowork.codec import Codec
+from benchmarks.codec_bench import response
+
+NUMBER = 200
+
+if __name__ == '__main__':
+    validated, trusted = Codec(), Codec(trusted=True)
+    assert validated.parse(UserListResponse, response) == trusted.parse(UserListResponse, response)
+    for name, codec in (('validated', validated), ('trusted', trusted)):
+        elapsed = min(timeit.repeat(lambda: codec.parse(UserListResponse, response), number=NUMBER, repeat=5))
+        print(f'{name:<10} {elapsed / NUMBER * 1e6:10.2f} us/response')
@@ -0,0 +1,56 @@
+import asyncio
+
+from kakaowork import (
+    AsyncKakaowork as Kakaowork,
+    SubmitActionReactiveBody,
+    SubmitModalReactiveBody,
+    RequestModalReactiveBody,
+    RequestModalReactiveResponse,
+    ModalReactiveView,
+    LabelBlock,
+    InputBlock,
+    BaseAsyncReactiveActionHandler,
+    BaseAsyncReactiveModalHandler,
+    ReactiveServer,
+)
+
+LOG_CONVERSATION_ID = 1093137
+
+
+class ReactiveActionHandler(BaseAsyncReactiveActionHandler):
+    async def handle_submit(self, body: SubmitActionReactiveBody) -> bool:
+        if body.action_name != 'confirm':
+            return False
+        # The follow-up calls run concurrently over the connection pool of the shared client.
+        await asyncio.gather(
+            self.client.messages.send(conversation_id=body.message.conversation_id, text='Thanks for your response'),
+            self.client.messages.send(conversation_id=LOG_CONVERSATION_ID, text=f'{body.react_user_id} confirmed {body.value}'),
+        )
+        return True
+
+
+class ReactiveModalHandler(BaseAsyncReactiveModalHandler):
+    async def handle_request(self, body: RequestModalReactiveBody) -> RequestModalReactiveResponse:
+        return RequestModalReactiveResponse(view=ModalReactiveView(
+            title='Survey',
+            accept='Submit',
+            decline='Cancel',
+            value=body.value,
+            blocks=[LabelBlock(text='How was it?', markdown=False), InputBlock(name='answer', required=True)],
+        ))
+
+    async def handle_submit(self, body: SubmitModalReactiveBody) -> bool:
+        resp = await self.client.messages.send(conversation_id=body.message.conversation_id, text=body.actions['answer'])
+        return resp.success
+
+
+async def main():
+    client = Kakaowork(app_key='<your_app_key>')
+    server = ReactiveServer(action_handler=ReactiveActionHandler(client), modal_handler=ReactiveModalHandler(client))
+    async with server:
+        await server.start('0.0.0.0', 8000)
+        await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -23,6 +23,11 @@ from kakaowork.blockkit import (
     InputBlock,
     SelectBlock,
     BlockKitBuilder,
+    BlockKitPayload,
+    BlockKitTemplate,
+    register_block,
+    decode_block,
+    decode_blocks,
 )
 
 from kakaowork.consts import (
@@ -37,10 +42,14 @@ from kakaowork.consts import (
     BASE_PATH_BATCH,
 )
 
-from kakaowork.exceptions import (KakaoworkError, InvalidBlock, InvalidBlockType)
+from kakaowork.exceptions import (KakaoworkError, InvalidBlock, InvalidBlockType, PreflightError)
 
 from kakaowork.client import (Kakaowork, AsyncKakaowork)
 
+from kakaowork.codec import (Codec, OrjsonCodec)
+
+from kakaowork.preflight import (PreflightIssue, PreflightStats, Preflight)
+
 from kakaowork.models import (
     ErrorCode,
     ConversationType,
@@ -79,6 +88,66 @@ from kakaowork.models import (
 from kakaowork.reactive import (
     BaseReactiveActionHandler,
     BaseReactiveModalHandler,
+    BaseAsyncReactiveActionHandler,
+    BaseAsyncReactiveModalHandler,
+)
+
+from kakaowork.server import (ReactiveServerStats, ReactiveServer)
+
+from kakaowork.hierarchy import DepartmentTree
+
+from kakaowork.compact import (CompactUser, UserDirectory)
+
+from kakaowork.columnar import ColumnarAccumulator
+
+from kakaowork.templates import TemplateRegistry
+
+from kakaowork.broadcast import (
+    RecipientType,
+    BroadcastResult,
+    BroadcastProgress,
+    Broadcaster,
+    AsyncBroadcaster,
+)
+
+from kakaowork.outbox import (
+    OutboxStatus,
+    OutboxMessage,
+    Outbox,
+    OutboxWorker,
+    AsyncOutboxWorker,
+)
+
+from kakaowork.coalesce import (
+    CoalescerStats,
+    MessageCoalescer,
+    AsyncMessageCoalescer,
+)
+
+from kakaowork.batching import (
+    BatcherStats,
+    UsersBatcher,
+    AsyncUsersBatcher,
+)
+
+from kakaowork.chunking import (
+    ChunkLimit,
+    ChunkResult,
+    ChunkedResponse,
+    ChunkedConversationResponse,
+    Chunker,
+    AsyncChunker,
+)
+
+from kakaowork.dispatch import (
+    Dispatcher,
+    AsyncDispatcher,
+)
+
+from kakaowork.scheduler import (
+    TimerWheel,
+    Scheduler,
+    AsyncScheduler,
 )
 
 __version__ = '0.8.0'
@@ -0,0 +1,375 @@
+import asyncio
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+from typing import TYPE_CHECKING, Deque, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+
+from kakaowork.consts import Limit, StrEnum
+from kakaowork.models import BaseResponse, WorkTimeField, VacationTimeField
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+DEFAULT_WINDOW = 0.05
+
+TimeField = Union[WorkTimeField, VacationTimeField]
+
+K = TypeVar('K')
+B = TypeVar('B', bound='_Batch')
+
+
+class _TimeKind(StrEnum):
+    WORK = 'work'
+    VACATION = 'vacation'
+
+
+class BatcherStats(BaseModel):
+    """Counters of a users batcher."""
+    received: int = 0
+    api_calls: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        """Returns the number of API calls saved by batching."""
+        return self.received - self.api_calls
+
+
+class _Batch:
+    __slots__ = ('futures', 'handle')
+
+    def __init__(self) -> None:
+        self.futures: List[Union[Future, asyncio.Future]] = []
+        self.handle: Optional[Union[threading.Timer, asyncio.TimerHandle]] = None
+
+
+class _Batcher(Generic[K, B], metaclass=ABCMeta):
+    # Collects items into a batch per key until the window elapses. Taken batches of a key are queued and delivered
+    # one at a time in order by whoever took the first of them.
+    def __init__(self, *, window: float) -> None:
+        if window < 0:
+            raise ValueError("The 'window' should be greater than or equal to 0")
+        self.window = window
+        self._batches: Dict[K, B] = {}
+        self._queues: Dict[K, Deque[B]] = {}
+
+    def _enqueue(self, key: K, batch: B) -> bool:
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.append(batch)
+            return False
+        self._queues[key] = deque([batch])
+        return True
+
+    def _next(self, key: K) -> Optional[B]:
+        queue = self._queues[key]
+        if not queue:
+            del self._queues[key]
+            return None
+        return queue.popleft()
+
+    @staticmethod
+    def _resolve(batch: _Batch, resp: Optional[BaseResponse], error: Optional[BaseException]) -> None:
+        for future in batch.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(resp)
+
+
+class _SyncBatcher(_Batcher[K, B]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lock = threading.RLock()
+
+    def _open(self, key: K, batch: B) -> B:
+        self._batches[key] = batch
+        if self.window > 0:
+            batch.handle = threading.Timer(self.window, self._expire, args=(key, batch))
+            batch.handle.daemon = True
+            batch.handle.start()
+        return batch
+
+    def _take(self, key: K) -> bool:
+        # Returns whether the caller should drain the queue of the key outside the lock.
+        batch = self._batches.pop(key)
+        if isinstance(batch.handle, threading.Timer):
+            batch.handle.cancel()
+        return self._enqueue(key, batch)
+
+    def _flush(self, keys: Optional[Iterable[K]] = None) -> None:
+        with self._lock:
+            ready = [key for key in (list(self._batches) if keys is None else keys) if key in self._batches and self._take(key)]
+        for key in ready:
+            self._drain(key)
+
+    def _expire(self, key: K, batch: B) -> None:
+        with self._lock:
+            if self._batches.get(key) is not batch:
+                return
+            ready = self._take(key)
+        if ready:
+            self._drain(key)
+
+    def _drain(self, key: K) -> None:
+        while True:
+            with self._lock:
+                batch = self._next(key)
+            if batch is None:
+                return
+            self._deliver(key, batch)
+
+    @abstractmethod
+    def _deliver(self, key: K, batch: B) -> None:
+        raise NotImplementedError()
+
+
+class _AsyncBatcher(_Batcher[K, B]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._tasks: List[asyncio.Future] = []
+
+    def _open(self, key: K, batch: B) -> B:
+        self._batches[key] = batch
+        if self.window > 0:
+            batch.handle = asyncio.get_running_loop().call_later(self.window, self._expire, key, batch)
+        return batch
+
+    def _take(self, key: K) -> None:
+        batch = self._batches.pop(key)
+        if isinstance(batch.handle, asyncio.TimerHandle):
+            batch.handle.cancel()
+        if self._enqueue(key, batch):
+            self._tasks = [task for task in self._tasks if not task.done()]
+            self._tasks.append(asyncio.ensure_future(self._drain(key)))
+
+    async def _flush(self, keys: Optional[Iterable[K]] = None) -> None:
+        for key in list(self._batches) if keys is None else keys:
+            if key in self._batches:
+                self._take(key)
+        tasks, self._tasks = self._tasks, []
+        await asyncio.gather(*tasks)
+
+    def _expire(self, key: K, batch: B) -> None:
+        if self._batches.get(key) is batch:
+            self._take(key)
+
+    async def _drain(self, key: K) -> None:
+        batch = self._next(key)
+        while batch is not None:
+            await self._deliver(key, batch)
+            batch = self._next(key)
+
+    @abstractmethod
+    async def _deliver(self, key: K, batch: B) -> None:
+        raise NotImplementedError()
+
+
+class _UsersBatch(_Batch):
+    __slots__ = ('work_times', 'vacation_times')
+
+    def __init__(self) -> None:
+        super().__init__()
+        # The last item of a user wins within a batch, and a batch only holds items of its kind.
+        self.work_times: Dict[int, WorkTimeField] = {}
+        self.vacation_times: Dict[int, VacationTimeField] = {}
+
+    def __len__(self) -> int:
+        return len(self.work_times) + len(self.vacation_times)
+
+
+class _BaseUsersBatcher(_Batcher[_TimeKind, _UsersBatch]):
+    def __init__(self, *, window: float = DEFAULT_WINDOW, max_batch: int = Limit.MAX) -> None:
+        super().__init__(window=window)
+        if max_batch < 1:
+            raise ValueError("The 'max_batch' should be greater than or equal to 1")
+        self.max_batch = max_batch
+        self.stats = BatcherStats()
+
+    def _append(self, batch: _UsersBatch, item: TimeField, future: Union[Future, asyncio.Future]) -> None:
+        if isinstance(item, WorkTimeField):
+            batch.work_times[item.user_id] = item
+        else:
+            batch.vacation_times[item.user_id] = item
+        batch.futures.append(future)
+        self.stats.received += 1
+
+
+class UsersBatcher(_BaseUsersBatcher, _SyncBatcher[_TimeKind, _UsersBatch]):
+    """Merges single-user work/vacation time updates into ``Batch.Users`` calls, like a DataLoader.
+
+    Updates made within the window, or until ``max_batch`` users are collected, are sent in one request.
+    Each caller gets a future of the response of its batch. A later update of a user replaces the earlier one in the batch,
+    so the earlier update isn't sent and its future gets the response of the batch carrying the later one.
+    """
+    def __init__(self, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the batcher.
+
+        Args:
+            client: A Kakaowork client
+            kwargs: window and max_batch
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    def __enter__(self) -> 'UsersBatcher':
+        """Enter the batcher."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the batcher after flushing pending updates."""
+        self.close()
+
+    def set_work_time(self, *, user_id: int, work_start_time: datetime, work_end_time: datetime) -> Future:
+        """Add a work time update like ``Users.set_work_time``.
+
+        Args:
+            user_id: A user ID
+            work_start_time: A start time of work
+            work_end_time: An end time of work
+
+        Returns:
+            A future of the response of the batch
+        """
+        item = WorkTimeField(user_id=user_id, work_start_time=work_start_time, work_end_time=work_end_time)
+        return self._add(_TimeKind.WORK, item)
+
+    def set_vacation_time(self, *, user_id: int, vacation_start_time: datetime, vacation_end_time: datetime) -> Future:
+        """Add a vacation time update like ``Users.set_vacation_time``.
+
+        Args:
+            user_id: A user ID
+            vacation_start_time: A start time of vacation
+            vacation_end_time: An end time of vacation
+
+        Returns:
+            A future of the response of the batch
+        """
+        item = VacationTimeField(user_id=user_id, vacation_start_time=vacation_start_time, vacation_end_time=vacation_end_time)
+        return self._add(_TimeKind.VACATION, item)
+
+    def flush(self) -> None:
+        """Send pending updates now."""
+        self._flush()
+
+    def close(self) -> None:
+        """Flush pending updates."""
+        self.flush()
+
+    def _add(self, kind: _TimeKind, item: TimeField) -> Future:
+        future: Future = Future()
+        ready = False
+        with self._lock:
+            batch = self._batches.get(kind)
+            if batch is None:
+                batch = self._open(kind, _UsersBatch())
+            self._append(batch, item, future)
+            if len(batch) >= self.max_batch or self.window == 0:
+                ready = self._take(kind)
+        if ready:
+            self._drain(kind)
+        return future
+
+    def _deliver(self, kind: _TimeKind, batch: _UsersBatch) -> None:
+        resp: Optional[BaseResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            if kind == _TimeKind.WORK:
+                resp = self.client.batch.users.set_work_time(list(batch.work_times.values()))
+            else:
+                resp = self.client.batch.users.set_vacation_time(list(batch.vacation_times.values()))
+        except Exception as e:
+            error = e
+        with self._lock:
+            self.stats.api_calls += 1
+        self._resolve(batch, resp, error)
+
+
+class AsyncUsersBatcher(_BaseUsersBatcher, _AsyncBatcher[_TimeKind, _UsersBatch]):
+    """Merges single-user work/vacation time updates into async ``Batch.Users`` calls, like a DataLoader.
+
+    Updates made within the window, or until ``max_batch`` users are collected, are sent in one request.
+    Each caller gets an awaitable future of the response of its batch. A later update of a user replaces the earlier one in
+    the batch, so the earlier update isn't sent and its future gets the response of the batch carrying the later one.
+    """
+    def __init__(self, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the batcher.
+
+        Args:
+            client: An async Kakaowork client
+            kwargs: window and max_batch
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    async def __aenter__(self) -> 'AsyncUsersBatcher':
+        """Enter the batcher."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the batcher after flushing pending updates."""
+        await self.close()
+
+    def set_work_time(self, *, user_id: int, work_start_time: datetime, work_end_time: datetime) -> asyncio.Future:
+        """Add a work time update like ``Users.set_work_time``.
+
+        Args:
+            user_id: A user ID
+            work_start_time: A start time of work
+            work_end_time: An end time of work
+
+        Returns:
+            An awaitable future of the response of the batch
+        """
+        item = WorkTimeField(user_id=user_id, work_start_time=work_start_time, work_end_time=work_end_time)
+        return self._add(_TimeKind.WORK, item)
+
+    def set_vacation_time(self, *, user_id: int, vacation_start_time: datetime, vacation_end_time: datetime) -> asyncio.Future:
+        """Add a vacation time update like ``Users.set_vacation_time``.
+
+        Args:
+            user_id: A user ID
+            vacation_start_time: A start time of vacation
+            vacation_end_time: An end time of vacation
+
+        Returns:
+            An awaitable future of the response of the batch
+        """
+        item = VacationTimeField(user_id=user_id, vacation_start_time=vacation_start_time, vacation_end_time=vacation_end_time)
+        return self._add(_TimeKind.VACATION, item)
+
+    async def flush(self) -> None:
+        """Send pending updates now and wait for in-flight batches."""
+        await self._flush()
+
+    async def close(self) -> None:
+        """Flush pending updates."""
+        await self.flush()
+
+    def _add(self, kind: _TimeKind, item: TimeField) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        batch = self._batches.get(kind)
+        if batch is None:
+            batch = self._open(kind, _UsersBatch())
+        self._append(batch, item, future)
+        if len(batch) >= self.max_batch or self.window == 0:
+            self._take(kind)
+        return future
+
+    async def _deliver(self, kind: _TimeKind, batch: _UsersBatch) -> None:
+        resp: Optional[BaseResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            if kind == _TimeKind.WORK:
+                resp = await self.client.batch.users.set_work_time(list(batch.work_times.values()))
+            else:
+                resp = await self.client.batch.users.set_vacation_time(list(batch.vacation_times.values()))
+        except Exception as e:
+            error = e
+        self.stats.api_calls += 1
+        self._resolve(batch, resp, error)
@@ -1,8 +1,9 @@
 import json
 from enum import unique
+from string import Formatter
 from functools import reduce
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, Union, ClassVar, Iterable
+from typing import Any, Dict, List, Optional, Type, Union, ClassVar, Iterable, FrozenSet, Tuple
 
 from pydantic import (
     BaseModel,
@@ -13,6 +14,18 @@ from pydantic import (
 
 from kakaowork.consts import StrEnum
 from kakaowork.exceptions import InvalidBlock, InvalidBlockType
+from kakaowork.utils import json_default, drop_none
+
+# Property names whose lengths are limited by a class variable of the owner block.
+MAX_LEN_ATTRS: Dict[str, str] = {
+    'text': '_max_len_text',
+    'term': '_max_len_term',
+    'placeholder': '_max_len_placeholder',
+    'elements': '_max_len_elements',
+    'options': '_max_len_options',
+}
+# Property names which should not be empty.
+REQUIRED_KEYS: FrozenSet[str] = frozenset(['text', 'term', 'name', 'url'])
 
 
 @unique
@@ -32,32 +45,10 @@ class BlockType(StrEnum):
 
     @classmethod
     def block_cls(cls, type: Union[str, 'BlockType']) -> Type['Block']:
-        bt = cls(type) if isinstance(type, str) else type
-        if bt == cls.TEXT:
-            return TextBlock
-        elif bt == cls.IMAGE_LINK:
-            return ImageLinkBlock
-        elif bt == cls.BUTTON:
-            return ButtonBlock
-        elif bt == cls.DIVIDER:
-            return DividerBlock
-        elif bt == cls.HEADER:
-            return HeaderBlock
-        elif bt == cls.ACTION:
-            return ActionBlock
-        elif bt == cls.DESCRIPTION:
-            return DescriptionBlock
-        elif bt == cls.SECTION:
-            return SectionBlock
-        elif bt == cls.CONTEXT:
-            return ContextBlock
-        elif bt == cls.LABEL:
-            return LabelBlock
-        elif bt == cls.INPUT:
-            return InputBlock
-        elif bt == cls.SELECT:
-            return SelectBlock
-        raise InvalidBlockType()
+        block_cls = _block_classes.get(type)
+        if block_cls is None:
+            raise InvalidBlockType(f"Unknown block type: {type!r}")
+        return block_cls
 
 
 class TextInlineType(StrEnum):
@@ -151,12 +142,38 @@ class SelectBlockOption(BaseModel):
 class Block(BaseModel, ABC):
     type: BlockType
 
+    # Serialized fields are cached until a field is assigned. Lists and models are kept out of the cache and serialized on
+    # each call, so that nested blocks reuse their own caches and in-place changes of them are never missed.
+    _fragment: Optional[Dict[str, Any]] = None
+    _nested: Optional[Tuple[str, ...]] = None
+    _json: Optional[str] = None
+    _members: Optional[Tuple[Tuple[Optional[str], str], ...]] = None
+
     class Config:
         underscore_attrs_are_private = True
         validate_assignment = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._clear_cache()
+
     def __str__(self):
-        return self.json(exclude_none=True)
+        text = self._json
+        if text is None:
+            data = self._cached_fragment()
+            if not self._nested:
+                text = json.dumps(data)
+                object.__setattr__(self, '_json', text)
+            else:
+                # Nested values are encoded by themselves, so that the cached JSON of nested blocks is spliced into this one.
+                members = self._members
+                if members is None:
+                    members = tuple((name, json.dumps(name) + ': ') if name in self._nested else (None, json.dumps({name: value})[1:-1])
+                                    for name, value in data.items())
+                    object.__setattr__(self, '_members', members)
+                text = '{' + ', '.join(member if name is None else member + _encode(getattr(self, name)) for name, member in members) + '}'
+        return text
 
     def __repr__(self):
         return str(self)
@@ -170,14 +187,132 @@ class Block(BaseModel, ABC):
             return False
         return True
 
+    def copy(self, **kwargs: Any) -> Any:
+        # The private cache is copied too, which is stale once fields are included, excluded or updated.
+        block = super().copy(**kwargs)
+        block._clear_cache()
+        return block
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Same as `dict(exclude_none=True)`. The result may share the cached values, so it should not be modified.
+        fragment = self._cached_fragment()
+        if not self._nested:
+            return fragment
+        data = dict(fragment)
+        for name in self._nested:
+            data[name] = _serialize(getattr(self, name))
+        return data
+
+    def _cached_fragment(self) -> Dict[str, Any]:
+        fragment = self._fragment
+        if fragment is None:
+            fragment = {}
+            nested: List[str] = []
+            for name in self.__fields__:
+                # A copy with 'include' or 'exclude' lacks the other fields.
+                value = self.__dict__.get(name)
+                if value is None:
+                    continue
+                if isinstance(value, (BaseModel, list, tuple)):
+                    nested.append(name)
+                fragment[name] = value
+            object.__setattr__(self, '_fragment', fragment)
+            object.__setattr__(self, '_nested', tuple(nested))
+        return fragment
+
+    def _clear_cache(self) -> None:
+        object.__setattr__(self, '_fragment', None)
+        object.__setattr__(self, '_nested', None)
+        object.__setattr__(self, '_json', None)
+        object.__setattr__(self, '_members', None)
+
+    def frozen(self) -> 'Block':
+        # Returns an immutable copy of the block which is hashable by its structure. Nested models are frozen too.
+        cls = _frozen_cls(type(self))
+        values = {name: _freeze(value) for name, value in self.__dict__.items()}
+        return cls.construct(_fields_set=set(self.__fields_set__), **values)
+
     @classmethod
     def new(cls, value: Union[Dict, 'Block']) -> 'Block':
-        if isinstance(value, dict):
-            if 'type' not in value:
-                raise ValueError("There is no 'type' from the argument")
-            return BlockType.block_cls(value['type'])(**value)
+        return decode_block(value)
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, Block):
+        return value.to_dict()
+    elif isinstance(value, BaseModel):
+        return value.dict(exclude_none=True)
+    elif isinstance(value, (list, tuple)):
+        return [_serialize(v) for v in value]
+    return value
+
+
+def _encode(value: Any) -> str:
+    if isinstance(value, Block):
+        return str(value)
+    elif isinstance(value, (list, tuple)):
+        return '[' + ', '.join(_encode(v) for v in value) + ']'
+    return json.dumps(_serialize(value))
+
+
+class _FrozenBlockMixin:
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        value = self._hash  # type: ignore
+        if value is None:
+            value = hash(str(self))
+            object.__setattr__(self, '_hash', value)
         return value
 
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, _FrozenBlockMixin) and hash(self) != hash(value):
+            return False
+        return super().__eq__(value)
+
+    def frozen(self) -> Any:
+        return self
+
+    def copy(self, **kwargs: Any) -> Any:
+        block = super().copy(**kwargs)  # type: ignore
+        if kwargs.get('update'):
+            object.__setattr__(block, '__dict__', {name: _freeze(value) for name, value in block.__dict__.items()})
+        block._clear_cache()
+        return block
+
+    def _clear_cache(self) -> None:
+        super()._clear_cache()  # type: ignore
+        object.__setattr__(self, '_hash', None)
+
+
+_frozen_models: Dict[type, Any] = {}
+
+
+def _frozen_cls(model: Type[BaseModel]) -> Any:
+    cls = _frozen_models.get(model)
+    if cls is None:
+        namespace: Dict[str, Any] = {'__module__': model.__module__, 'Config': type('Config', (), {'allow_mutation': False})}
+        if issubclass(model, Block):
+            # The model metaclass sets '__hash__' of a model unless it is in the namespace.
+            namespace.update({'__annotations__': {'_hash': Optional[int]}, '_hash': None, '__hash__': _FrozenBlockMixin.__hash__})
+            bases: Tuple[type, ...] = (_FrozenBlockMixin, model)
+        else:
+            bases = (model, )
+        cls = _frozen_models[model] = type(model.__name__, bases, namespace)
+    return cls
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Block):
+        return value.frozen()
+    elif isinstance(value, BaseModel):
+        if not value.__config__.allow_mutation:
+            return value
+        return _frozen_cls(type(value)).construct(_fields_set=set(value.__fields_set__), **{k: _freeze(v) for k, v in value.__dict__.items()})
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class TextBlock(Block):
     _max_len_text: ClassVar[int] = 500
@@ -415,7 +550,55 @@ class SelectBlock(Block):
         return value
 
 
+# Block classes by the 'type' property. BlockType members hash like their values, so both are usable as keys.
+_block_classes: Dict[str, Type[Block]] = {
+    BlockType.TEXT: TextBlock,
+    BlockType.IMAGE_LINK: ImageLinkBlock,
+    BlockType.BUTTON: ButtonBlock,
+    BlockType.DIVIDER: DividerBlock,
+    BlockType.HEADER: HeaderBlock,
+    BlockType.ACTION: ActionBlock,
+    BlockType.DESCRIPTION: DescriptionBlock,
+    BlockType.SECTION: SectionBlock,
+    BlockType.CONTEXT: ContextBlock,
+    BlockType.LABEL: LabelBlock,
+    BlockType.INPUT: InputBlock,
+    BlockType.SELECT: SelectBlock,
+}
+
+
+def register_block(block_type: str, block_cls: Optional[Type[Block]] = None) -> Any:
+    # Registers a block class for a custom type. It can be used as a class decorator, e.g. `@register_block('custom')`.
+    def register(block_cls: Type[Block]) -> Type[Block]:
+        if not (isinstance(block_cls, type) and issubclass(block_cls, Block)):
+            raise TypeError(f"The block class should be a subclass of Block: {block_cls!r}")
+        _block_classes[block_type] = block_cls
+        return block_cls
+
+    return register if block_cls is None else register(block_cls)
+
+
+def decode_block(value: Union[Dict, Block], *, trusted: bool = False) -> Block:
+    # Trusted data such as server responses are built without validators.
+    if not isinstance(value, dict):
+        return value
+    if 'type' not in value:
+        raise ValueError("There is no 'type' from the argument")
+    block_cls = BlockType.block_cls(value['type'])
+    if trusted:
+        from kakaowork.trusted import construct
+        return construct(block_cls, value)
+    return block_cls(**value)
+
+
+def decode_blocks(values: Iterable[Union[Dict, Block]], *, trusted: bool = False) -> List[Block]:
+    return [decode_block(value, trusted=trusted) for value in values]
+
+
 class BlockKitBuilder(BaseModel):
+    _max_len_text: ClassVar[int] = 2000
+    _max_len_blocks: ClassVar[int] = 50
+
     type: BlockKitType
     blocks: List[Block] = []
     text: Optional[str] = None
@@ -450,22 +633,179 @@ class BlockKitBuilder(BaseModel):
         return values
 
     def add_block(self, block: Union[Block, dict]):
-        if isinstance(block, dict):
-            if 'type' not in block:
-                raise InvalidBlock()
-            block = BlockType.block_cls(block['type'])(**block)
-        self.blocks.append(block)
+        self.blocks.append(self._to_block(block))
+
+    def compile(self) -> 'BlockKitTemplate':
+        return BlockKitTemplate(self)
+
+    def freeze(self) -> 'BlockKitPayload':
+        if self.type != BlockKitType.MESSAGE:
+            raise ValueError("Only the message type can be frozen into a payload")
+        # A payload skips the preflight of the client, so it is checked once here.
+        from kakaowork.preflight import Preflight
+        issues = Preflight.issues(text=self.text, blocks=self.blocks)
+        if issues:
+            raise ValueError('; '.join(str(issue) for issue in issues))
+        return BlockKitPayload.encode(text=self.text, blocks=self.blocks or None)
 
     @classmethod
     def load(cls, path: str) -> 'BlockKitBuilder':
         with open(path, 'r') as f:
-            data = json.load(f)
-        self = cls(type=data['type'])
-        for key, value in data.items():
-            if key == 'blocks' and isinstance(value, Iterable):
-                self.blocks = []
-                for block in value:
-                    self.add_block(block)
-            else:
-                setattr(self, key, value)
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'BlockKitBuilder':
+        return cls.from_dict(json.loads(data))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BlockKitBuilder':
+        # Blocks are validated once each, and the other properties are validated together with the root validators once.
+        for name in data:
+            if name not in cls.__fields__:
+                raise ValueError(f'"{cls.__name__}" object has no field "{name}"')
+        values = {name: value for name, value in data.items() if name != 'blocks'}
+        blocks = data.get('blocks')
+        self = cls(**values)
+        if isinstance(blocks, (list, tuple)):
+            self.__dict__['blocks'] = [cls._to_block(block) for block in blocks]
+            self.__fields_set__.add('blocks')
+        elif blocks is not None:
+            self.blocks = blocks
         return self
+
+    @staticmethod
+    def _to_block(block: Union[Block, dict]) -> Block:
+        if isinstance(block, Block):
+            return block
+        if not isinstance(block, dict):
+            raise InvalidBlock(f'The block should be a Block or an object, not {type(block).__name__}')
+        if 'type' not in block:
+            raise InvalidBlock("There is no 'type' from the block")
+        return decode_block(block)
+
+
+class BlockKitPayload:
+    # Keeps the encoded JSON members of 'text' and 'blocks', so that only recipient fields are encoded per request.
+    __slots__ = ('_data', )
+    _data: bytes
+
+    def __init__(self, data: bytes) -> None:
+        object.__setattr__(self, '_data', data)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._data!r})'
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, BlockKitPayload):
+            return False
+        return self._data == value._data
+
+    def __hash__(self) -> int:
+        return hash(self._data)
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @classmethod
+    def encode(cls, *, text: Optional[str] = None, blocks: Optional[List[Block]] = None) -> 'BlockKitPayload':
+        members = json.dumps(drop_none({'text': text, 'blocks': blocks}), default=json_default)
+        return cls(members[1:-1].encode('utf-8'))
+
+    def body(self, **fields: Any) -> bytes:
+        head = json.dumps(drop_none(fields))[1:-1].encode('utf-8')
+        if head and self._data:
+            return b'{' + head + b', ' + self._data + b'}'
+        return b'{' + (head or self._data) + b'}'
+
+
+class _TemplateSlot:
+    __slots__ = ('fmt', 'names', 'required', 'max_len', 'key')
+
+    def __init__(self, fmt: str, names: FrozenSet[str], required: bool, max_len: Optional[int], key: str) -> None:
+        self.fmt = fmt
+        self.names = names
+        self.required = required
+        self.max_len = max_len
+        self.key = key
+
+    def render(self, values: Dict[str, Any]) -> str:
+        text = self.fmt.format_map(values)
+        if self.required and not text:
+            raise InvalidBlock(f"The '{self.key}' property should be exists")
+        if self.max_len is not None and len(text) > self.max_len:
+            raise InvalidBlock(f"The '{self.key}' property's length should be less than or equal to {self.max_len}")
+        return json.dumps(text)
+
+
+class BlockKitTemplate:
+    def __init__(self, builder: BlockKitBuilder) -> None:
+        if builder.type != BlockKitType.MESSAGE:
+            raise ValueError("Only the message type can be compiled into a template")
+        if len(builder.blocks) > builder._max_len_blocks:
+            raise ValueError(f"The 'blocks' property's length should be less than or equal to {builder._max_len_blocks}")
+        data = drop_none({
+            'text': builder.text,
+            'blocks': [block.to_dict() for block in builder.blocks],
+        })
+        slots: List[_TemplateSlot] = []
+        # Message-level strings are limited by the builder, and strings of blocks by their block classes.
+        skeleton = self._mark(data, BlockKitBuilder, 'message', slots)
+        # Each slot is replaced with a JSON-encoded sentinel, so the encoded skeleton splits into static parts around slots.
+        encoded = json.dumps(skeleton)[1:-1]
+        parts: List[str] = []
+        for i, _ in enumerate(slots):
+            head, encoded = encoded.split(json.dumps(self._sentinel(i)), 1)
+            parts.append(head)
+        parts.append(encoded)
+        self._slots: Tuple[_TemplateSlot, ...] = tuple(slots)
+        self._parts: Tuple[str, ...] = tuple(parts)
+        self._placeholders: FrozenSet[str] = frozenset(name for slot in slots for name in slot.names)
+
+    @property
+    def placeholders(self) -> FrozenSet[str]:
+        return self._placeholders
+
+    def render(self, **values: Any) -> BlockKitPayload:
+        missing = self._placeholders.difference(values)
+        if missing:
+            raise ValueError(f"Missing values for placeholders: {', '.join(sorted(missing))}")
+        parts = self._parts
+        out = [parts[0]]
+        for i, slot in enumerate(self._slots):
+            out.append(slot.render(values))
+            out.append(parts[i + 1])
+        return BlockKitPayload(''.join(out).encode('utf-8'))
+
+    @staticmethod
+    def _sentinel(index: int) -> str:
+        return f'\x00{index}\x00'
+
+    @classmethod
+    def _mark(cls, value: Any, owner: Optional[Type[BaseModel]], key: str, slots: List[_TemplateSlot]) -> Any:
+        if isinstance(value, dict):
+            if isinstance(value.get('type'), str) and value['type'] in _block_classes:
+                owner = _block_classes[value['type']]
+            return {k: cls._mark(v, owner, k, slots) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [cls._mark(v, owner, key, slots) for v in value]
+        elif isinstance(value, str):
+            # Every string follows str.format escaping, so '{{' and '}}' render as '{' and '}' with or without placeholders.
+            # A string which is not a valid format string, e.g. with a lone brace, is kept as a literal.
+            try:
+                fields = list(Formatter().parse(value))
+            except ValueError:
+                return value
+            names = frozenset(name.split('.')[0].split('[')[0] for _, name, _, _ in fields if name is not None)
+            if not names:
+                return ''.join(literal for literal, _, _, _ in fields)
+            if '' in names:
+                raise ValueError(f"Positional placeholders are not supported: {value!r}")
+            attr = MAX_LEN_ATTRS.get(key)
+            max_len = getattr(owner, attr, None) if owner is not None and attr is not None else None
+            slots.append(_TemplateSlot(value, names, key in REQUIRED_KEYS, max_len, key))
+            return cls._sentinel(len(slots) - 1)
+        return value
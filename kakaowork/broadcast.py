@@ -0,0 +1,312 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future, wait, as_completed, FIRST_COMPLETED
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+import urllib3
+import aiosonic.exceptions
+from pydantic import BaseModel, StrictInt, StrictStr
+
+from kakaowork.consts import StrEnum
+from kakaowork.models import ErrorCode, BaseResponse
+from kakaowork.blockkit import Block, BlockKitPayload
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 0.5
+
+RETRYABLE_ERROR_CODES = frozenset([ErrorCode.TOO_MANY_REQUESTS, ErrorCode.INTERNAL_SERVER_ERROR])
+
+Recipient = Union[int, str]
+
+
+class RecipientType(StrEnum):
+    """Recipient type of a broadcast."""
+    CONVERSATION = 'conversation'
+    USER = 'user'
+    EMAIL = 'email'
+
+
+class BroadcastResult(BaseModel):
+    """The delivery result of a recipient."""
+    recipient: Union[StrictInt, StrictStr]  # Not coerced, so that results match the recipients given.
+    success: bool
+    error_code: Optional[ErrorCode] = None
+    error_message: Optional[str] = None
+    attempts: int
+    latency: float
+
+
+class BroadcastProgress(BaseModel):
+    """The progress of a broadcast."""
+    total: Optional[int] = None
+    done: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Returns the number of recipients done per second."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Returns the estimated seconds until done, None if the total is unknown."""
+        if self.total is None:
+            return None
+        if self.done >= self.total:
+            return 0.0
+        if self.done == 0:
+            return None
+        return (self.total - self.done) * self.elapsed / self.done
+
+
+class _BaseBroadcaster:
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF,
+        on_progress: Optional[Callable[[BroadcastProgress], None]] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' should be greater than or equal to 1")
+        if max_attempts < 1:
+            raise ValueError("The 'max_attempts' should be greater than or equal to 1")
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.on_progress = on_progress
+        self._timer = time.perf_counter
+
+    @staticmethod
+    def _payload(text: Union[str, BlockKitPayload], blocks: Optional[List[Block]]) -> BlockKitPayload:
+        if isinstance(text, BlockKitPayload):
+            if blocks is not None:
+                raise ValueError("The 'blocks' can't be set with a payload.")
+            return text
+        return BlockKitPayload.encode(text=text, blocks=blocks)
+
+    def _progress(self, recipients: Iterable[Recipient]) -> BroadcastProgress:
+        return BroadcastProgress(total=len(recipients) if hasattr(recipients, '__len__') else None)  # type: ignore
+
+    def _report(self, progress: BroadcastProgress, result: BroadcastResult, started: float) -> None:
+        progress.done += 1
+        if result.success:
+            progress.succeeded += 1
+        else:
+            progress.failed += 1
+        progress.elapsed = self._timer() - started
+        if self.on_progress is not None:
+            self.on_progress(progress.copy())
+
+    # Exceptions of the transport which are retried. Others, such as a malformed recipient, fail on the first attempt.
+    _transport_errors: Tuple[Type[Exception], ...] = ()
+
+    def _retry_wait(self, attempts: int, resp: Optional[BaseResponse], error: Optional[Exception]) -> Optional[float]:
+        if attempts >= self.max_attempts:
+            return None
+        if error is not None:
+            retryable = isinstance(error, self._transport_errors)
+        else:
+            retryable = resp is not None and resp.error is not None and resp.error.code in RETRYABLE_ERROR_CODES
+        return self.backoff * (2**(attempts - 1)) if retryable else None
+
+    @staticmethod
+    def _result(recipient: Recipient, resp: Optional[BaseResponse], error: Optional[Exception], attempts: int, latency: float) -> BroadcastResult:
+        if resp is not None and resp.success:
+            return BroadcastResult(recipient=recipient, success=True, attempts=attempts, latency=latency)
+        if resp is not None and resp.error is not None:
+            return BroadcastResult(
+                recipient=recipient,
+                success=False,
+                error_code=resp.error.code,
+                error_message=resp.error.message,
+                attempts=attempts,
+                latency=latency,
+            )
+        return BroadcastResult(recipient=recipient, success=False, error_message=str(error) if error else None, attempts=attempts, latency=latency)
+
+
+class Broadcaster(_BaseBroadcaster):
+    """Sends a message to many recipients with bounded concurrency using a thread pool.
+
+    The message contents are encoded once, and requests share the rate limiter of the client.
+    """
+    _transport_errors = (urllib3.exceptions.HTTPError, OSError)
+
+    def __init__(self, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the broadcaster.
+
+        Args:
+            client: A Kakaowork client
+            kwargs: concurrency, max_attempts, backoff and on_progress
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    def send(
+        self,
+        recipients: Iterable[Recipient],
+        *,
+        text: Union[str, BlockKitPayload],
+        blocks: Optional[List[Block]] = None,
+        recipient_type: RecipientType = RecipientType.CONVERSATION,
+    ) -> Iterator[BroadcastResult]:
+        """Send a message to recipients.
+
+        Args:
+            recipients: Conversation IDs, user IDs or emails
+            text: A message text, or a payload frozen by `BlockKitBuilder.freeze`
+            blocks: Message blocks
+            recipient_type: The type of recipients
+
+        Returns:
+            An iterator of results in the order of completion
+        """
+        payload = self._payload(text, blocks)
+        progress = self._progress(recipients)
+        started = self._timer()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending: Set[Future] = set()
+            for recipient in recipients:
+                if len(pending) >= self.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        self._report(progress, result, started)
+                        yield result
+                pending.add(executor.submit(self._deliver, recipient, payload, RecipientType(recipient_type)))
+            for future in as_completed(pending):
+                result = future.result()
+                self._report(progress, result, started)
+                yield result
+
+    def _deliver(self, recipient: Recipient, payload: BlockKitPayload, recipient_type: RecipientType) -> BroadcastResult:
+        started = self._timer()
+        attempts = 0
+        conversation_id = recipient if recipient_type == RecipientType.CONVERSATION else None
+        while True:
+            attempts += 1
+            resp: Optional[BaseResponse] = None
+            error: Optional[Exception] = None
+            try:
+                if recipient_type == RecipientType.EMAIL:
+                    resp = self.client.messages._request('send_by_email', payload.body(email=recipient))
+                else:
+                    if conversation_id is None:
+                        opened = self.client.conversations.open(user_ids=[int(recipient)])
+                        if opened.success and opened.conversation:
+                            conversation_id = int(opened.conversation.id)
+                        else:
+                            resp = opened
+                    if conversation_id is not None:
+                        resp = self.client.messages._request('send', payload.body(conversation_id=conversation_id))
+            except Exception as e:
+                error = e
+            if resp is not None and resp.success:
+                break
+            wait_time = self._retry_wait(attempts, resp, error)
+            if wait_time is None:
+                break
+            time.sleep(wait_time)
+        return self._result(recipient, resp, error, attempts, self._timer() - started)
+
+
+class AsyncBroadcaster(_BaseBroadcaster):
+    """Sends a message to many recipients with bounded concurrency using asyncio tasks.
+
+    The message contents are encoded once, and requests share the rate limiter of the client.
+    """
+    _transport_errors = (
+        aiosonic.exceptions.BaseTimeout,
+        aiosonic.exceptions.ConnectionDisconnected,
+        aiosonic.exceptions.HttpParsingError,
+        asyncio.TimeoutError,
+        OSError,
+    )
+
+    def __init__(self, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the broadcaster.
+
+        Args:
+            client: An async Kakaowork client
+            kwargs: concurrency, max_attempts, backoff and on_progress
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    async def send(
+        self,
+        recipients: Iterable[Recipient],
+        *,
+        text: Union[str, BlockKitPayload],
+        blocks: Optional[List[Block]] = None,
+        recipient_type: RecipientType = RecipientType.CONVERSATION,
+    ) -> AsyncIterator[BroadcastResult]:
+        """Send a message to recipients.
+
+        Args:
+            recipients: Conversation IDs, user IDs or emails
+            text: A message text, or a payload frozen by `BlockKitBuilder.freeze`
+            blocks: Message blocks
+            recipient_type: The type of recipients
+
+        Returns:
+            An async iterator of results in the order of completion
+        """
+        payload = self._payload(text, blocks)
+        progress = self._progress(recipients)
+        started = self._timer()
+        pending: Set[asyncio.Future] = set()
+        try:
+            for recipient in recipients:
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        self._report(progress, result, started)
+                        yield result
+                pending.add(asyncio.ensure_future(self._deliver(recipient, payload, RecipientType(recipient_type))))
+            for future in asyncio.as_completed(pending):
+                result = await future
+                self._report(progress, result, started)
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _deliver(self, recipient: Recipient, payload: BlockKitPayload, recipient_type: RecipientType) -> BroadcastResult:
+        started = self._timer()
+        attempts = 0
+        conversation_id = recipient if recipient_type == RecipientType.CONVERSATION else None
+        while True:
+            attempts += 1
+            resp: Optional[BaseResponse] = None
+            error: Optional[Exception] = None
+            try:
+                if recipient_type == RecipientType.EMAIL:
+                    resp = await self.client.messages._request('send_by_email', payload.body(email=recipient))
+                else:
+                    if conversation_id is None:
+                        opened = await self.client.conversations.open(user_ids=[int(recipient)])
+                        if opened.success and opened.conversation:
+                            conversation_id = int(opened.conversation.id)
+                        else:
+                            resp = opened
+                    if conversation_id is not None:
+                        resp = await self.client.messages._request('send', payload.body(conversation_id=conversation_id))
+            except Exception as e:
+                error = e
+            if resp is not None and resp.success:
+                break
+            wait_time = self._retry_wait(attempts, resp, error)
+            if wait_time is None:
+                break
+            await asyncio.sleep(wait_time)
+        return self._result(recipient, resp, error, attempts, self._timer() - started)
@@ -0,0 +1,260 @@
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from kakaowork.consts import Limit
+from kakaowork.models import ErrorCode, ErrorField, BaseResponse, ConversationResponse, ConversationField, WorkTimeField, VacationTimeField
+from kakaowork.utils import json_default
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+T = TypeVar('T')
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_BYTES = 256 * 1024
+
+
+class ChunkLimit(BaseModel):
+    """Limits of a request to a list-taking endpoint."""
+    max_items: int = Limit.MAX
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+
+# The limit of every endpoint unless overridden by endpoint name, e.g. 'conversations.invite'. The API does not publish
+# per-endpoint list limits, so this is the maximum page size of the API and a conservative request size.
+DEFAULT_LIMIT = ChunkLimit()
+
+
+class ChunkResult(BaseModel):
+    """The result of a chunk."""
+    index: int
+    size: int
+    success: bool
+    error: Optional[ErrorField] = None
+
+
+class ChunkedResponse(BaseResponse):
+    """An aggregated response of chunked requests."""
+    chunks: List[ChunkResult] = []
+
+    @property
+    def failed_chunks(self) -> List[ChunkResult]:
+        """Returns the chunks which failed."""
+        return [chunk for chunk in self.chunks if not chunk.success]
+
+    def plain(self) -> str:
+        """Returns a plain text of the response."""
+        if self.success:
+            return f'OK ({len(self.chunks)} chunks)'
+        return '\n'.join([
+            super().plain(),
+            *[f'Chunk {chunk.index}:\t{chunk.error.code if chunk.error else "-"} ({chunk.size} items)' for chunk in self.failed_chunks],
+        ])
+
+
+class ChunkedConversationResponse(ChunkedResponse):
+    """An aggregated response of a chunked conversation open."""
+    conversation: Optional[ConversationField] = None
+
+
+def split_chunks(items: Sequence[T], limit: ChunkLimit, *, overhead: int = 64) -> List[List[T]]:
+    """Split items into chunks within the limit.
+
+    Args:
+        items: Items of a list-taking request
+        limit: The limit of the endpoint
+        overhead: Bytes reserved for the rest of the payload
+
+    Returns:
+        A list of chunks
+
+    Examples:
+        >>> split_chunks([1, 2, 3, 4, 5], ChunkLimit(max_items=2))
+        [[1, 2], [3, 4], [5]]
+        >>> split_chunks([111, 222, 333], ChunkLimit(max_bytes=74), overhead=64)
+        [[111, 222], [333]]
+    """
+    chunks: List[List[T]] = []
+    chunk: List[T] = []
+    size = overhead
+    for item in items:
+        item_size = _encoded_size(item) + 2  # A separator
+        if chunk and (len(chunk) >= limit.max_items or size + item_size > limit.max_bytes):
+            chunks.append(chunk)
+            chunk, size = [], overhead
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _encoded_size(item: Any) -> int:
+    if isinstance(item, int):
+        return len(str(item))
+    if isinstance(item, BaseModel):
+        item = item.dict(exclude_none=True)
+    return len(json.dumps(item, default=json_default).encode('utf-8'))
+
+
+def _aggregate(responses: List[BaseResponse], chunks: List[List[Any]], response_cls: type = ChunkedResponse, **fields: Any) -> Any:
+    results = [ChunkResult(index=i, size=len(chunk), success=resp.success, error=resp.error) for i, (resp, chunk) in enumerate(zip(responses, chunks))]
+    failed = [result for result in results if not result.success]
+    return response_cls(success=not failed, error=failed[0].error if failed else None, chunks=results, **fields)
+
+
+def _failure(error: Exception) -> BaseResponse:
+    return BaseResponse(success=False, error=ErrorField(code=ErrorCode.UNKNOWN, message=str(error)))
+
+
+class _BaseChunker:
+    def __init__(self, *, concurrency: int = DEFAULT_CONCURRENCY, limits: Optional[Dict[str, ChunkLimit]] = None) -> None:
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' should be greater than or equal to 1")
+        self.concurrency = concurrency
+        self.limits = dict(limits or {})
+
+    def _split(self, endpoint: str, items: Sequence[T]) -> List[List[T]]:
+        return split_chunks(items, self.limits.get(endpoint, DEFAULT_LIMIT))
+
+
+class Chunker(_BaseChunker):
+    """Splits oversized list-taking requests into chunks within the endpoint limits and submits them using a thread pool."""
+    def __init__(self, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the chunker.
+
+        Args:
+            client: A Kakaowork client
+            kwargs: concurrency and limits
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    def set_work_time(self, items: List[WorkTimeField]) -> ChunkedResponse:
+        """Set work times of users like ``Batch.Users.set_work_time``."""
+        chunks = self._split('batch.users.set_work_time', items)
+        return _aggregate(self._submit(self.client.batch.users.set_work_time, chunks), chunks)
+
+    def set_vacation_time(self, items: List[VacationTimeField]) -> ChunkedResponse:
+        """Set vacation times of users like ``Batch.Users.set_vacation_time``."""
+        chunks = self._split('batch.users.set_vacation_time', items)
+        return _aggregate(self._submit(self.client.batch.users.set_vacation_time, chunks), chunks)
+
+    def reset_work_time(self, *, user_ids: List[int]) -> ChunkedResponse:
+        """Reset work times of users like ``Batch.Users.reset_work_time``."""
+        chunks = self._split('batch.users.reset_work_time', user_ids)
+        return _aggregate(self._submit(lambda chunk: self.client.batch.users.reset_work_time(user_ids=chunk), chunks), chunks)
+
+    def reset_vacation_time(self, *, user_ids: List[int]) -> ChunkedResponse:
+        """Reset vacation times of users like ``Batch.Users.reset_vacation_time``."""
+        chunks = self._split('batch.users.reset_vacation_time', user_ids)
+        return _aggregate(self._submit(lambda chunk: self.client.batch.users.reset_vacation_time(user_ids=chunk), chunks), chunks)
+
+    def invite(self, *, conversation_id: int, user_ids: List[int]) -> ChunkedResponse:
+        """Invite users to a conversation like ``Conversations.invite``."""
+        chunks = self._split('conversations.invite', user_ids)
+        return _aggregate(self._submit(lambda chunk: self.client.conversations.invite(conversation_id=conversation_id, user_ids=chunk), chunks), chunks)
+
+    def kick(self, *, conversation_id: int, user_ids: List[int]) -> ChunkedResponse:
+        """Kick users from a conversation like ``Conversations.kick``."""
+        chunks = self._split('conversations.kick', user_ids)
+        return _aggregate(self._submit(lambda chunk: self.client.conversations.kick(conversation_id=conversation_id, user_ids=chunk), chunks), chunks)
+
+    def open(self, *, user_ids: List[int]) -> ChunkedConversationResponse:
+        """Open a conversation like ``Conversations.open``.
+
+        The conversation is opened with the first chunk, and the rest of users are invited to it.
+        """
+        opening, *rest = self._split('conversations.open', user_ids) or [[]]
+        opened: ConversationResponse = self._submit(lambda chunk: self.client.conversations.open(user_ids=chunk), [opening])[0]  # type: ignore
+        if not opened.success or opened.conversation is None:
+            return _aggregate([opened], [opening], ChunkedConversationResponse)
+        conversation_id = int(opened.conversation.id)
+        chunks = [chunk for each in rest for chunk in self._split('conversations.invite', each)]
+        responses = self._submit(lambda chunk: self.client.conversations.invite(conversation_id=conversation_id, user_ids=chunk), chunks)
+        return _aggregate([opened, *responses], [opening, *chunks], ChunkedConversationResponse, conversation=opened.conversation)
+
+    def _submit(self, func: Callable[[List[Any]], BaseResponse], chunks: List[List[Any]]) -> List[BaseResponse]:
+        def _call(chunk: List[Any]) -> BaseResponse:
+            try:
+                return func(chunk)
+            except Exception as e:
+                return _failure(e)
+
+        if len(chunks) <= 1:
+            return [_call(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+            return list(executor.map(_call, chunks))
+
+
+class AsyncChunker(_BaseChunker):
+    """Splits oversized list-taking requests into chunks within the endpoint limits and submits them concurrently."""
+    def __init__(self, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the chunker.
+
+        Args:
+            client: An async Kakaowork client
+            kwargs: concurrency and limits
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    async def set_work_time(self, items: List[WorkTimeField]) -> ChunkedResponse:
+        """Set work times of users like ``Batch.Users.set_work_time``."""
+        chunks = self._split('batch.users.set_work_time', items)
+        return _aggregate(await self._submit(self.client.batch.users.set_work_time, chunks), chunks)
+
+    async def set_vacation_time(self, items: List[VacationTimeField]) -> ChunkedResponse:
+        """Set vacation times of users like ``Batch.Users.set_vacation_time``."""
+        chunks = self._split('batch.users.set_vacation_time', items)
+        return _aggregate(await self._submit(self.client.batch.users.set_vacation_time, chunks), chunks)
+
+    async def reset_work_time(self, *, user_ids: List[int]) -> ChunkedResponse:
+        """Reset work times of users like ``Batch.Users.reset_work_time``."""
+        chunks = self._split('batch.users.reset_work_time', user_ids)
+        return _aggregate(await self._submit(lambda chunk: self.client.batch.users.reset_work_time(user_ids=chunk), chunks), chunks)
+
+    async def reset_vacation_time(self, *, user_ids: List[int]) -> ChunkedResponse:
+        """Reset vacation times of users like ``Batch.Users.reset_vacation_time``."""
+        chunks = self._split('batch.users.reset_vacation_time', user_ids)
+        return _aggregate(await self._submit(lambda chunk: self.client.batch.users.reset_vacation_time(user_ids=chunk), chunks), chunks)
+
+    async def invite(self, *, conversation_id: int, user_ids: List[int]) -> ChunkedResponse:
+        """Invite users to a conversation like ``Conversations.invite``."""
+        chunks = self._split('conversations.invite', user_ids)
+        return _aggregate(await self._submit(lambda chunk: self.client.conversations.invite(conversation_id=conversation_id, user_ids=chunk), chunks), chunks)
+
+    async def kick(self, *, conversation_id: int, user_ids: List[int]) -> ChunkedResponse:
+        """Kick users from a conversation like ``Conversations.kick``."""
+        chunks = self._split('conversations.kick', user_ids)
+        return _aggregate(await self._submit(lambda chunk: self.client.conversations.kick(conversation_id=conversation_id, user_ids=chunk), chunks), chunks)
+
+    async def open(self, *, user_ids: List[int]) -> ChunkedConversationResponse:
+        """Open a conversation like ``Conversations.open``.
+
+        The conversation is opened with the first chunk, and the rest of users are invited to it.
+        """
+        opening, *rest = self._split('conversations.open', user_ids) or [[]]
+        opened: ConversationResponse = (await self._submit(lambda chunk: self.client.conversations.open(user_ids=chunk), [opening]))[0]  # type: ignore
+        if not opened.success or opened.conversation is None:
+            return _aggregate([opened], [opening], ChunkedConversationResponse)
+        conversation_id = int(opened.conversation.id)
+        chunks = [chunk for each in rest for chunk in self._split('conversations.invite', each)]
+        responses = await self._submit(lambda chunk: self.client.conversations.invite(conversation_id=conversation_id, user_ids=chunk), chunks)
+        return _aggregate([opened, *responses], [opening, *chunks], ChunkedConversationResponse, conversation=opened.conversation)
+
+    async def _submit(self, func: Callable[[List[Any]], Awaitable[BaseResponse]], chunks: List[List[Any]]) -> List[BaseResponse]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _call(chunk: List[Any]) -> BaseResponse:
+            async with semaphore:
+                try:
+                    return await func(chunk)
+                except Exception as e:
+                    return _failure(e)
+
+        return list(await asyncio.gather(*[_call(chunk) for chunk in chunks]))
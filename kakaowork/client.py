@@ -1,8 +1,7 @@
-import json
 import time
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union, Iterable, Iterator, AsyncIterator, Callable
 
 import urllib3
 import aiosonic
@@ -31,9 +30,20 @@ from kakaowork.models import (
     SpaceResponse,
     BotResponse,
 )
-from kakaowork.blockkit import Block
-from kakaowork.utils import json_default, drop_none
+from kakaowork.blockkit import Block, BlockKitPayload
+from kakaowork.utils import drop_none
+from kakaowork.codec import Codec, get_codec
 from kakaowork.ratelimit import RateLimiter
+from kakaowork.preflight import Preflight
+from kakaowork.broadcast import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_ATTEMPTS,
+    RecipientType,
+    BroadcastResult,
+    BroadcastProgress,
+    Broadcaster,
+    AsyncBroadcaster,
+)
 
 
 class Kakaowork:
@@ -50,7 +60,7 @@ class Kakaowork:
                     fields={'user_id': user_id},
                 )
             self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(r.data)
+            return self.client.codec.parse(UserResponse, r.data)
 
         def find_by_email(self, email: str) -> UserResponse:
             with self.client.limiter:
@@ -60,7 +70,7 @@ class Kakaowork:
                     fields={'email': email},
                 )
             self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(r.data)
+            return self.client.codec.parse(UserResponse, r.data)
 
         def find_by_phone_number(self, phone_number: str) -> UserResponse:
             with self.client.limiter:
@@ -70,7 +80,7 @@ class Kakaowork:
                     fields={'phone_number': phone_number},
                 )
             self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(r.data)
+            return self.client.codec.parse(UserResponse, r.data)
 
         def list(self, *, cursor: Optional[str] = None, limit: Optional[int] = Limit.DEFAULT) -> UserListResponse:
             fields: Dict[str, Any] = {'cursor': cursor} if cursor else {'limit': str(limit)}
@@ -81,7 +91,7 @@ class Kakaowork:
                     fields=fields,
                 )
             self.client._respect_rate_limit(r)
-            return UserListResponse.parse_raw(r.data)
+            return self.client.codec.parse(UserListResponse, r.data)
 
         def set_work_time(self, *, user_id: int, work_start_time: datetime, work_end_time: datetime) -> BaseResponse:
             payload = {
@@ -93,10 +103,10 @@ class Kakaowork:
                 r = self.client.http.request(
                     'POST',
                     f'{self.client.base_url}{self.base_path}.set_work_time',
-                    body=json.dumps(payload).encode('utf-8'),
+                    body=self.client.codec.encode(payload),
                 )
             self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(r.data)
+            return self.client.codec.parse(BaseResponse, r.data)
 
         def set_vacation_time(self, *, user_id: int, vacation_start_time: datetime, vacation_end_time: datetime) -> BaseResponse:
             payload = {
@@ -108,10 +118,10 @@ class Kakaowork:
                 r = self.client.http.request(
                     'POST',
                     f'{self.client.base_url}{self.base_path}.set_vacation_time',
-                    body=json.dumps(payload).encode('utf-8'),
+                    body=self.client.codec.encode(payload),
                 )
             self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(r.data)
+            return self.client.codec.parse(BaseResponse, r.data)
 
     class Conversations:
         def __init__(self, client: 'Kakaowork', *, base_path: Optional[str] = BASE_PATH_CONVERSATIONS):
@@ -124,10 +134,10 @@ class Kakaowork:
                 r = self.client.http.request(
                     'POST',
                     f'{self.client.base_url}{self.base_path}.open',
-                    body=json.dumps(payload).encode('utf-8'),
+                    body=self.client.codec.encode(payload),
                 )
             self.client._respect_rate_limit(r)
-            return ConversationResponse.parse_raw(r.data)
+            return self.client.codec.parse(ConversationResponse, r.data)
 
         def list(self, *, cursor: Optional[str] = None, limit: Optional[int] = Limit.DEFAULT) -> ConversationListResponse:
             fields = {'cursor': cursor} if cursor else {'limit': str(limit)}
@@ -138,7 +148,7 @@ class Kakaowork:
                     fields=fields,
                 )
             self.client._respect_rate_limit(r)
-            return ConversationListResponse.parse_raw(r.data)
+            return self.client.codec.parse(ConversationListResponse, r.data)
 
         def users(self, *, conversation_id: int) -> UserListResponse:
             with self.client.limiter:
@@ -147,7 +157,7 @@ class Kakaowork:
                     f'{self.client.base_url}{self.base_path}/{conversation_id}/users',
                 )
             self.client._respect_rate_limit(r)
-            return UserListResponse.parse_raw(r.data)
+            return self.client.codec.parse(UserListResponse, r.data)
 
         def invite(self, *, conversation_id: int, user_ids: List[int]) -> BaseResponse:
             payload = {'user_ids': user_ids}
@@ -155,10 +165,10 @@ class Kakaowork:
                 r = self.client.http.request(
                     'POST',
                     f'{self.client.base_url}{self.base_path}/{conversation_id}/invite',
-                    body=json.dumps(payload).encode('utf-8'),
+                    body=self.client.codec.encode(payload),
                 )
             self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(r.data)
+            return self.client.codec.parse(BaseResponse, r.data)
 
         def kick(self, *, conversation_id: int, user_ids: List[int]) -> BaseResponse:
             payload = {'user_ids': user_ids}
@@ -166,63 +176,74 @@ class Kakaowork:
                 r = self.client.http.request(
                     'POST',
                     f'{self.client.base_url}{self.base_path}/{conversation_id}/kick',
-                    body=json.dumps(payload).encode('utf-8'),
+                    body=self.client.codec.encode(payload),
                 )
             self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(r.data)
+            return self.client.codec.parse(BaseResponse, r.data)
 
     class Messages:
         def __init__(self, client: 'Kakaowork', *, base_path: Optional[str] = BASE_PATH_MESSAGES):
             self.client = client
             self.base_path = base_path
 
-        def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> MessageResponse:
-            payload = drop_none({
-                'conversation_id': conversation_id,
-                'text': text,
-                'blocks': blocks,
-            })
-            with self.client.limiter:
-                r = self.client.http.request(
-                    'POST',
-                    f'{self.client.base_url}{self.base_path}.send',
-                    body=json.dumps(payload, default=json_default).encode('utf-8'),
-                )
-            self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(r.data)
-
-        def send_by(self, *, text: str, email: Optional[str] = None, key: Optional[str] = None, blocks: Optional[List[Block]] = None) -> MessageResponse:
-            if not (email or key):
-                raise ValueError("Either 'email' or 'key' must exist.")
-            payload = drop_none({
-                'email': email,
-                'key': key,
-                'text': text,
-                'blocks': blocks,
-            })
+        def _request(self, endpoint: str, body: bytes) -> MessageResponse:
             with self.client.limiter:
                 r = self.client.http.request(
                     'POST',
-                    f'{self.client.base_url}{self.base_path}.send_by',
-                    body=json.dumps(payload, default=json_default).encode('utf-8'),
+                    f'{self.client.base_url}{self.base_path}.{endpoint}',
+                    body=body,
                 )
             self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(r.data)
-
-        def send_by_email(self, email: str, *, text: str, blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return self.client.codec.parse(MessageResponse, r.data)
+
+        def _encode(self, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]], **fields: Any) -> bytes:
+            if isinstance(text, BlockKitPayload):
+                # Payloads are checked against the limits when they are frozen or rendered.
+                if blocks is not None:
+                    raise ValueError("The 'blocks' can't be set with a payload.")
+                return text.body(**fields)
+            if self.client.preflight is not None:
+                self.client.preflight.check(text=text, blocks=blocks)
             payload = drop_none({
-                'email': email,
+                **fields,
                 'text': text,
                 'blocks': blocks,
             })
-            with self.client.limiter:
-                r = self.client.http.request(
-                    'POST',
-                    f'{self.client.base_url}{self.base_path}.send_by_email',
-                    body=json.dumps(payload, default=json_default).encode('utf-8'),
-                )
-            self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(r.data)
+            return self.client.codec.encode(payload)
+
+        def send(self, *, conversation_id: int, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return self._request('send', self._encode(text, blocks, conversation_id=conversation_id))
+
+        def send_by(
+            self,
+            *,
+            text: Union[str, BlockKitPayload],
+            email: Optional[str] = None,
+            key: Optional[str] = None,
+            blocks: Optional[List[Block]] = None,
+        ) -> MessageResponse:
+            if not (email or key):
+                raise ValueError("Either 'email' or 'key' must exist.")
+            return self._request('send_by', self._encode(text, blocks, email=email, key=key))
+
+        def send_by_email(self, email: str, *, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return self._request('send_by_email', self._encode(text, blocks, email=email))
+
+        def broadcast(
+            self,
+            recipients: Iterable[Union[int, str]],
+            *,
+            text: Union[str, BlockKitPayload],
+            blocks: Optional[List[Block]] = None,
+            recipient_type: RecipientType = RecipientType.CONVERSATION,
+            concurrency: int = DEFAULT_CONCURRENCY,
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+            on_progress: Optional[Callable[[BroadcastProgress], None]] = None,
+        ) -> Iterator[BroadcastResult]:
+            if self.client.preflight is not None and not isinstance(text, BlockKitPayload):
+                self.client.preflight.check(text=text, blocks=blocks)
+            broadcaster = Broadcaster(self.client, concurrency=concurrency, max_attempts=max_attempts, on_progress=on_progress)
+            return broadcaster.send(recipients, text=text, blocks=blocks, recipient_type=recipient_type)
 
     class Departments:
         def __init__(self, client: 'Kakaowork', *, base_path: Optional[str] = BASE_PATH_DEPARTMENTS):
@@ -238,7 +259,7 @@ class Kakaowork:
                     fields=fields,
                 )
             self.client._respect_rate_limit(r)
-            return DepartmentListResponse.parse_raw(r.data)
+            return self.client.codec.parse(DepartmentListResponse, r.data)
 
     class Spaces:
         def __init__(self, client: 'Kakaowork', *, base_path: Optional[str] = BASE_PATH_SPACES):
@@ -252,7 +273,7 @@ class Kakaowork:
                     f'{self.client.base_url}{self.base_path}.info',
                 )
             self.client._respect_rate_limit(r)
-            return SpaceResponse.parse_raw(r.data)
+            return self.client.codec.parse(SpaceResponse, r.data)
 
     class Bots:
         def __init__(self, client: 'Kakaowork', *, base_path: Optional[str] = BASE_PATH_BOTS):
@@ -266,11 +287,23 @@ class Kakaowork:
                     f'{self.client.base_url}{self.base_path}.info',
                 )
             self.client._respect_rate_limit(r)
-            return BotResponse.parse_raw(r.data)
-
-    def __init__(self, *, app_key: str, base_url: Optional[str] = BASE_URL):
+            return self.client.codec.parse(BotResponse, r.data)
+
+    def __init__(
+        self,
+        *,
+        app_key: str,
+        base_url: Optional[str] = BASE_URL,
+        codec: Union[str, Codec] = 'json',
+        trusted: bool = False,
+        sample_rate: float = 0.0,
+        lazy: bool = False,
+        preflight: Union[bool, Preflight] = False,
+    ):
         self.app_key = app_key
         self.base_url = base_url
+        self.codec = get_codec(codec, trusted=trusted, sample_rate=sample_rate, lazy=lazy)
+        self.preflight = preflight if isinstance(preflight, Preflight) else (Preflight() if preflight else None)
         self.http = urllib3.PoolManager(headers=self.headers, retries=3, maxsize=5)
         self.limiter = RateLimiter(capacity=0, refill_rate=60.0)
 
@@ -302,10 +335,10 @@ class Kakaowork:
                     r = self.client.http.request(
                         'POST',
                         f'{self.client.base_url}{self.base_path}.set_work_time',
-                        body=json.dumps(payload, default=json_default).encode('utf-8'),
+                        body=self.client.codec.encode(payload),
                     )
                 self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(r.data)
+                return self.client.codec.parse(BaseResponse, r.data)
 
             def set_vacation_time(self, items: List[VacationTimeField]) -> BaseResponse:
                 payload = {
@@ -315,10 +348,10 @@ class Kakaowork:
                     r = self.client.http.request(
                         'POST',
                         f'{self.client.base_url}{self.base_path}.set_vacation_time',
-                        body=json.dumps(payload, default=json_default).encode('utf-8'),
+                        body=self.client.codec.encode(payload),
                     )
                 self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(r.data)
+                return self.client.codec.parse(BaseResponse, r.data)
 
             def reset_work_time(self, *, user_ids: List[int]) -> BaseResponse:
                 payload = {
@@ -328,10 +361,10 @@ class Kakaowork:
                     r = self.client.http.request(
                         'POST',
                         f'{self.client.base_url}{self.base_path}.reset_work_time',
-                        body=json.dumps(payload).encode('utf-8'),
+                        body=self.client.codec.encode(payload),
                     )
                 self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(r.data)
+                return self.client.codec.parse(BaseResponse, r.data)
 
             def reset_vacation_time(self, *, user_ids: List[int]) -> BaseResponse:
                 payload = {
@@ -341,10 +374,10 @@ class Kakaowork:
                     r = self.client.http.request(
                         'POST',
                         f'{self.client.base_url}{self.base_path}.reset_vacation_time',
-                        body=json.dumps(payload).encode('utf-8'),
+                        body=self.client.codec.encode(payload),
                     )
                 self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(r.data)
+                return self.client.codec.parse(BaseResponse, r.data)
 
         @property
         def users(self) -> Users:
@@ -401,7 +434,7 @@ class AsyncKakaowork:
                     params={'user_id': user_id},
                 )
             await self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(await r.content())
+            return self.client.codec.parse(UserResponse, await r.content())
 
         async def find_by_email(self, email: str) -> UserResponse:
             async with self.client.limiter:
@@ -412,7 +445,7 @@ class AsyncKakaowork:
                     params={'email': email},
                 )
             await self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(await r.content())
+            return self.client.codec.parse(UserResponse, await r.content())
 
         async def find_by_phone_number(self, phone_number: str) -> UserResponse:
             async with self.client.limiter:
@@ -423,7 +456,7 @@ class AsyncKakaowork:
                     params={'phone_number': phone_number},
                 )
             await self.client._respect_rate_limit(r)
-            return UserResponse.parse_raw(await r.content())
+            return self.client.codec.parse(UserResponse, await r.content())
 
         async def list(self, *, cursor: Optional[str] = None, limit: Optional[int] = Limit.DEFAULT) -> UserListResponse:
             params: Dict[str, Any] = {'cursor': cursor} if cursor else {'limit': str(limit)}
@@ -435,7 +468,7 @@ class AsyncKakaowork:
                     params=params,
                 )
             await self.client._respect_rate_limit(r)
-            return UserListResponse.parse_raw(await r.content())
+            return self.client.codec.parse(UserListResponse, await r.content())
 
         async def set_work_time(self, *, user_id: int, work_start_time: datetime, work_end_time: datetime) -> BaseResponse:
             payload = {
@@ -448,10 +481,10 @@ class AsyncKakaowork:
                     url=f'{self.client.base_url}{self.base_path}.set_work_time',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload).encode('utf-8'),
+                    data=self.client.codec.encode(payload),
                 )
             await self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(await r.content())
+            return self.client.codec.parse(BaseResponse, await r.content())
 
         async def set_vacation_time(self, *, user_id: int, vacation_start_time: datetime, vacation_end_time: datetime) -> BaseResponse:
             payload = {
@@ -464,10 +497,10 @@ class AsyncKakaowork:
                     url=f'{self.client.base_url}{self.base_path}.set_vacation_time',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload).encode('utf-8'),
+                    data=self.client.codec.encode(payload),
                 )
             await self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(await r.content())
+            return self.client.codec.parse(BaseResponse, await r.content())
 
     class Conversations:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_CONVERSATIONS):
@@ -481,10 +514,10 @@ class AsyncKakaowork:
                     url=f'{self.client.base_url}{self.base_path}.open',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload).encode('utf-8'),
+                    data=self.client.codec.encode(payload),
                 )
             await self.client._respect_rate_limit(r)
-            return ConversationResponse.parse_raw(await r.content())
+            return self.client.codec.parse(ConversationResponse, await r.content())
 
         async def list(self, *, cursor: Optional[str] = None, limit: Optional[int] = Limit.DEFAULT) -> ConversationListResponse:
             params = {'cursor': cursor} if cursor else {'limit': str(limit)}
@@ -496,7 +529,7 @@ class AsyncKakaowork:
                     params=params,
                 )
             await self.client._respect_rate_limit(r)
-            return ConversationListResponse.parse_raw(await r.content())
+            return self.client.codec.parse(ConversationListResponse, await r.content())
 
         async def users(self, *, conversation_id: int) -> UserListResponse:
             async with self.client.limiter:
@@ -506,7 +539,7 @@ class AsyncKakaowork:
                     headers=self.client.headers,
                 )
             await self.client._respect_rate_limit(r)
-            return UserListResponse.parse_raw(await r.content())
+            return self.client.codec.parse(UserListResponse, await r.content())
 
         async def invite(self, *, conversation_id: int, user_ids: List[int]) -> BaseResponse:
             payload = {'user_ids': user_ids}
@@ -515,10 +548,10 @@ class AsyncKakaowork:
                     url=f'{self.client.base_url}{self.base_path}/{conversation_id}/invite',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload).encode('utf-8'),
+                    data=self.client.codec.encode(payload),
                 )
             await self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(await r.content())
+            return self.client.codec.parse(BaseResponse, await r.content())
 
         async def kick(self, *, conversation_id: int, user_ids: List[int]) -> BaseResponse:
             payload = {'user_ids': user_ids}
@@ -527,66 +560,75 @@ class AsyncKakaowork:
                     url=f'{self.client.base_url}{self.base_path}/{conversation_id}/kick',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload).encode('utf-8'),
+                    data=self.client.codec.encode(payload),
                 )
             await self.client._respect_rate_limit(r)
-            return BaseResponse.parse_raw(await r.content())
+            return self.client.codec.parse(BaseResponse, await r.content())
 
     class Messages:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_MESSAGES):
             self.client = client
             self.base_path = base_path
 
-        async def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> MessageResponse:
-            payload = drop_none({
-                'conversation_id': conversation_id,
-                'text': text,
-                'blocks': blocks,
-            })
-            async with self.client.limiter:
-                r = await self.client.http.request(
-                    url=f'{self.client.base_url}{self.base_path}.send',
-                    method='POST',
-                    headers=self.client.headers,
-                    data=json.dumps(payload, default=json_default).encode('utf-8'),
-                )
-            await self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(await r.content())
-
-        async def send_by(self, *, text: str, email: Optional[str] = None, key: Optional[str] = None, blocks: Optional[List[Block]] = None) -> MessageResponse:
-            if not (email or key):
-                raise ValueError("Either 'email' or 'key' must exist.")
-            payload = drop_none({
-                'email': email,
-                'key': key,
-                'text': text,
-                'blocks': blocks,
-            })
+        async def _request(self, endpoint: str, body: bytes) -> MessageResponse:
             async with self.client.limiter:
                 r = await self.client.http.request(
-                    url=f'{self.client.base_url}{self.base_path}.send_by',
+                    url=f'{self.client.base_url}{self.base_path}.{endpoint}',
                     method='POST',
                     headers=self.client.headers,
-                    data=json.dumps(payload, default=json_default).encode('utf-8'),
+                    data=body,
                 )
             await self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(await r.content())
-
-        async def send_by_email(self, email: str, *, text: str, blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return self.client.codec.parse(MessageResponse, await r.content())
+
+        def _encode(self, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]], **fields: Any) -> bytes:
+            if isinstance(text, BlockKitPayload):
+                # Payloads are checked against the limits when they are frozen or rendered.
+                if blocks is not None:
+                    raise ValueError("The 'blocks' can't be set with a payload.")
+                return text.body(**fields)
+            if self.client.preflight is not None:
+                self.client.preflight.check(text=text, blocks=blocks)
             payload = drop_none({
-                'email': email,
+                **fields,
                 'text': text,
                 'blocks': blocks,
             })
-            async with self.client.limiter:
-                r = await self.client.http.request(
-                    url=f'{self.client.base_url}{self.base_path}.send_by_email',
-                    method='POST',
-                    headers=self.client.headers,
-                    data=json.dumps(payload, default=json_default).encode('utf-8'),
-                )
-            await self.client._respect_rate_limit(r)
-            return MessageResponse.parse_raw(await r.content())
+            return self.client.codec.encode(payload)
+
+        async def send(self, *, conversation_id: int, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return await self._request('send', self._encode(text, blocks, conversation_id=conversation_id))
+
+        async def send_by(
+            self,
+            *,
+            text: Union[str, BlockKitPayload],
+            email: Optional[str] = None,
+            key: Optional[str] = None,
+            blocks: Optional[List[Block]] = None,
+        ) -> MessageResponse:
+            if not (email or key):
+                raise ValueError("Either 'email' or 'key' must exist.")
+            return await self._request('send_by', self._encode(text, blocks, email=email, key=key))
+
+        async def send_by_email(self, email: str, *, text: Union[str, BlockKitPayload], blocks: Optional[List[Block]] = None) -> MessageResponse:
+            return await self._request('send_by_email', self._encode(text, blocks, email=email))
+
+        def broadcast(
+            self,
+            recipients: Iterable[Union[int, str]],
+            *,
+            text: Union[str, BlockKitPayload],
+            blocks: Optional[List[Block]] = None,
+            recipient_type: RecipientType = RecipientType.CONVERSATION,
+            concurrency: int = DEFAULT_CONCURRENCY,
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+            on_progress: Optional[Callable[[BroadcastProgress], None]] = None,
+        ) -> AsyncIterator[BroadcastResult]:
+            if self.client.preflight is not None and not isinstance(text, BlockKitPayload):
+                self.client.preflight.check(text=text, blocks=blocks)
+            broadcaster = AsyncBroadcaster(self.client, concurrency=concurrency, max_attempts=max_attempts, on_progress=on_progress)
+            return broadcaster.send(recipients, text=text, blocks=blocks, recipient_type=recipient_type)
 
     class Departments:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_DEPARTMENTS):
@@ -603,7 +645,7 @@ class AsyncKakaowork:
                     params=params,
                 )
             await self.client._respect_rate_limit(r)
-            return DepartmentListResponse.parse_raw(await r.content())
+            return self.client.codec.parse(DepartmentListResponse, await r.content())
 
     class Spaces:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_SPACES):
@@ -618,7 +660,7 @@ class AsyncKakaowork:
                     headers=self.client.headers,
                 )
             await self.client._respect_rate_limit(r)
-            return SpaceResponse.parse_raw(await r.content())
+            return self.client.codec.parse(SpaceResponse, await r.content())
 
     class Bots:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_BOTS):
@@ -633,7 +675,7 @@ class AsyncKakaowork:
                     headers=self.client.headers,
                 )
             await self.client._respect_rate_limit(r)
-            return BotResponse.parse_raw(await r.content())
+            return self.client.codec.parse(BotResponse, await r.content())
 
     class Batch:
         def __init__(self, client: 'AsyncKakaowork', *, base_path: Optional[str] = BASE_PATH_BATCH):
@@ -654,10 +696,10 @@ class AsyncKakaowork:
                         url=f'{self.client.base_url}{self.base_path}.set_work_time',
                         method='POST',
                         headers=self.client.headers,
-                        data=json.dumps(payload, default=json_default).encode('utf-8'),
+                        data=self.client.codec.encode(payload),
                     )
                 await self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(await r.content())
+                return self.client.codec.parse(BaseResponse, await r.content())
 
             async def set_vacation_time(self, items: List[VacationTimeField]) -> BaseResponse:
                 payload = {
@@ -668,10 +710,10 @@ class AsyncKakaowork:
                         url=f'{self.client.base_url}{self.base_path}.set_vacation_time',
                         method='POST',
                         headers=self.client.headers,
-                        data=json.dumps(payload, default=json_default).encode('utf-8'),
+                        data=self.client.codec.encode(payload),
                     )
                 await self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(await r.content())
+                return self.client.codec.parse(BaseResponse, await r.content())
 
             async def reset_work_time(self, *, user_ids: List[int]) -> BaseResponse:
                 payload = {
@@ -682,10 +724,10 @@ class AsyncKakaowork:
                         url=f'{self.client.base_url}{self.base_path}.reset_work_time',
                         method='POST',
                         headers=self.client.headers,
-                        data=json.dumps(payload).encode('utf-8'),
+                        data=self.client.codec.encode(payload),
                     )
                 await self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(await r.content())
+                return self.client.codec.parse(BaseResponse, await r.content())
 
             async def reset_vacation_time(self, *, user_ids: List[int]) -> BaseResponse:
                 payload = {
@@ -696,18 +738,30 @@ class AsyncKakaowork:
                         url=f'{self.client.base_url}{self.base_path}.reset_vacation_time',
                         method='POST',
                         headers=self.client.headers,
-                        data=json.dumps(payload).encode('utf-8'),
+                        data=self.client.codec.encode(payload),
                     )
                 await self.client._respect_rate_limit(r)
-                return BaseResponse.parse_raw(await r.content())
+                return self.client.codec.parse(BaseResponse, await r.content())
 
         @property
         def users(self) -> Users:
             return self.Users(self)
 
-    def __init__(self, *, app_key: str, base_url: Optional[str] = BASE_URL):
+    def __init__(
+        self,
+        *,
+        app_key: str,
+        base_url: Optional[str] = BASE_URL,
+        codec: Union[str, Codec] = 'json',
+        trusted: bool = False,
+        sample_rate: float = 0.0,
+        lazy: bool = False,
+        preflight: Union[bool, Preflight] = False,
+    ):
         self.app_key = app_key
         self.base_url = base_url
+        self.codec = get_codec(codec, trusted=trusted, sample_rate=sample_rate, lazy=lazy)
+        self.preflight = preflight if isinstance(preflight, Preflight) else (Preflight() if preflight else None)
         self.http = aiosonic.HTTPClient()
         self.limiter = RateLimiter(capacity=0, refill_rate=60.0)
 
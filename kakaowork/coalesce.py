@@ -0,0 +1,238 @@
+import asyncio
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+from kakaowork.models import MessageResponse
+from kakaowork.blockkit import Block, BlockKitBuilder
+from kakaowork.batching import _Batch, _Batcher, _SyncBatcher, _AsyncBatcher
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+DEFAULT_WINDOW = 1.0
+DEFAULT_MAX_MESSAGES = 20
+DEFAULT_SEPARATOR = '\n'
+
+FlushHook = Callable[[int, int, Optional[MessageResponse]], None]
+
+
+class CoalescerStats(BaseModel):
+    """Counters of a message coalescer."""
+    received: int = 0
+    api_calls: int = 0
+    failed_calls: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        """Returns the number of API calls saved by coalescing."""
+        return self.received - self.api_calls
+
+
+class _MessageBatch(_Batch):
+    __slots__ = ('texts', 'blocks', 'text_len')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.texts: List[str] = []
+        self.blocks: List[Block] = []
+        self.text_len = 0
+
+
+class _BaseCoalescer(_Batcher[int, _MessageBatch]):
+    def __init__(
+        self,
+        *,
+        window: float = DEFAULT_WINDOW,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        max_text_len: int = BlockKitBuilder._max_len_text,
+        max_blocks: int = BlockKitBuilder._max_len_blocks,
+        separator: str = DEFAULT_SEPARATOR,
+        on_flush: Optional[FlushHook] = None,
+    ) -> None:
+        super().__init__(window=window)
+        if max_messages < 1:
+            raise ValueError("The 'max_messages' should be greater than or equal to 1")
+        self.max_messages = max_messages
+        self.max_text_len = max_text_len
+        self.max_blocks = max_blocks
+        self.separator = separator
+        self.on_flush = on_flush
+        self.stats = CoalescerStats()
+
+    def _fits(self, batch: _MessageBatch, text: str, blocks: Optional[List[Block]]) -> bool:
+        if not batch.futures:
+            return True
+        if batch.text_len + len(self.separator) + len(text) > self.max_text_len:
+            return False
+        return len(batch.blocks) + len(blocks or []) <= self.max_blocks
+
+    def _append(self, batch: _MessageBatch, text: str, blocks: Optional[List[Block]], future: Union[Future, asyncio.Future]) -> None:
+        if batch.texts:
+            batch.text_len += len(self.separator)
+        batch.texts.append(text)
+        batch.text_len += len(text)
+        batch.blocks.extend(blocks or [])
+        batch.futures.append(future)
+        self.stats.received += 1
+
+    def _merge(self, batch: _MessageBatch) -> Dict:
+        return {
+            'text': self.separator.join(batch.texts),
+            'blocks': batch.blocks or None,
+        }
+
+    def _settle(self, conversation_id: int, batch: _MessageBatch, resp: Optional[MessageResponse], error: Optional[BaseException]) -> None:
+        self.stats.api_calls += 1
+        if resp is None or not resp.success:
+            self.stats.failed_calls += 1
+        self._resolve(batch, resp, error)
+        if self.on_flush is not None:
+            self.on_flush(conversation_id, len(batch.futures), resp)
+
+
+class MessageCoalescer(_BaseCoalescer, _SyncBatcher[int, _MessageBatch]):
+    """Merges messages sent to the same conversation within a time window into one ``Messages.send`` call.
+
+    Texts are joined with the separator and blocks are appended while the merged message stays within the limits.
+    A batch is sent when its window elapses, when it reaches ``max_messages``, or when the next message doesn't fit.
+    Batches of a conversation are sent one at a time in order, so a batch ready while another one is in flight is sent
+    by the thread delivering that one.
+    """
+    def __init__(self, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            client: A Kakaowork client
+            kwargs: window, max_messages, max_text_len, max_blocks, separator and on_flush
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    def __enter__(self) -> 'MessageCoalescer':
+        """Enter the coalescer."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the coalescer after flushing all batches."""
+        self.close()
+
+    def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> Future:
+        """Add a message to the batch of the conversation.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+
+        Returns:
+            A future of the response of the merged message
+        """
+        future: Future = Future()
+        ready = False
+        with self._lock:
+            batch = self._batches.get(conversation_id)
+            if batch is not None and not self._fits(batch, text, blocks):
+                ready = self._take(conversation_id)
+                batch = None
+            if batch is None:
+                batch = self._open(conversation_id, _MessageBatch())
+            self._append(batch, text, blocks, future)
+            if len(batch.futures) >= self.max_messages or self.window == 0:
+                ready = self._take(conversation_id) or ready
+        if ready:
+            self._drain(conversation_id)
+        return future
+
+    def flush(self, conversation_id: Optional[int] = None) -> None:
+        """Send pending batches now.
+
+        Args:
+            conversation_id: A conversation ID to flush, all conversations if not set
+        """
+        self._flush(None if conversation_id is None else [conversation_id])
+
+    def close(self) -> None:
+        """Flush all pending batches."""
+        self.flush()
+
+    def _deliver(self, conversation_id: int, batch: _MessageBatch) -> None:
+        resp: Optional[MessageResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            resp = self.client.messages.send(conversation_id=conversation_id, **self._merge(batch))
+        except Exception as e:
+            error = e
+        with self._lock:
+            self._settle(conversation_id, batch, resp, error)
+
+
+class AsyncMessageCoalescer(_BaseCoalescer, _AsyncBatcher[int, _MessageBatch]):
+    """Merges messages sent to the same conversation within a time window into one async ``Messages.send`` call.
+
+    Texts are joined with the separator and blocks are appended while the merged message stays within the limits.
+    A batch is sent when its window elapses, when it reaches ``max_messages``, or when the next message doesn't fit.
+    Batches of a conversation are sent one at a time in order.
+    """
+    def __init__(self, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            client: An async Kakaowork client
+            kwargs: window, max_messages, max_text_len, max_blocks, separator and on_flush
+        """
+        super().__init__(**kwargs)
+        self.client = client
+
+    async def __aenter__(self) -> 'AsyncMessageCoalescer':
+        """Enter the coalescer."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the coalescer after flushing all batches."""
+        await self.close()
+
+    def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> asyncio.Future:
+        """Add a message to the batch of the conversation.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+
+        Returns:
+            An awaitable future of the response of the merged message
+        """
+        future = asyncio.get_running_loop().create_future()
+        batch = self._batches.get(conversation_id)
+        if batch is not None and not self._fits(batch, text, blocks):
+            self._take(conversation_id)
+            batch = None
+        if batch is None:
+            batch = self._open(conversation_id, _MessageBatch())
+        self._append(batch, text, blocks, future)
+        if len(batch.futures) >= self.max_messages or self.window == 0:
+            self._take(conversation_id)
+        return future
+
+    async def flush(self, conversation_id: Optional[int] = None) -> None:
+        """Send pending batches now and wait for in-flight batches.
+
+        Args:
+            conversation_id: A conversation ID to flush, all conversations if not set
+        """
+        await self._flush(None if conversation_id is None else [conversation_id])
+
+    async def close(self) -> None:
+        """Flush all pending batches."""
+        await self.flush()
+
+    async def _deliver(self, conversation_id: int, batch: _MessageBatch) -> None:
+        resp: Optional[MessageResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            resp = await self.client.messages.send(conversation_id=conversation_id, **self._merge(batch))
+        except Exception as e:
+            error = e
+        self._settle(conversation_id, batch, resp, error)
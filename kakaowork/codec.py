@@ -0,0 +1,184 @@
+import json
+import random
+from datetime import datetime
+from typing import Any, Dict, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.utils import ROOT_KEY
+
+from kakaowork.blockkit import Block
+from kakaowork.utils import json_default
+from kakaowork.models import BaseResponse
+from kakaowork.trusted import construct
+from kakaowork.lazy import lazy_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+M = TypeVar('M', bound=BaseModel)
+
+
+class Codec:
+    """A JSON codec of request and response bodies."""
+    name = 'json'
+
+    def __init__(self, *, trusted: bool = False, sample_rate: float = 0.0, lazy: bool = False) -> None:
+        """Initialize the codec.
+
+        Args:
+            trusted: Build response models from trusted server data without validation
+            sample_rate: A fraction of trusted responses to validate fully, to detect schema drift
+            lazy: Parse only ``success`` and ``error`` of responses, and the rest on first access
+
+        Raises:
+            ValueError: If the 'sample_rate' is not between 0 and 1.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("The 'sample_rate' should be between 0 and 1")
+        self.trusted = trusted
+        self.sample_rate = sample_rate
+        self.lazy = lazy
+
+    def encode(self, value: Any) -> bytes:
+        """Returns the value encoded as JSON bytes.
+
+        Args:
+            value: A value to encode
+
+        Returns:
+            An encoded JSON
+
+        Examples:
+            >>> Codec().encode({'user_ids': [1, 2]})
+            b'{"user_ids": [1, 2]}'
+        """
+        return json.dumps(value, default=json_default).encode('utf-8')
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Returns the value decoded from JSON.
+
+        Args:
+            data: A JSON to decode
+
+        Returns:
+            A decoded value
+        """
+        return json.loads(data)
+
+    def parse(self, model: Type[M], data: Union[bytes, str]) -> M:
+        """Returns a model parsed from JSON, like ``BaseModel.parse_raw``.
+
+        A trusted codec skips validation except for the sampled fraction of responses, and a lazy codec defers parsing
+        nested models of responses until they are accessed.
+
+        Args:
+            model: A model class
+            data: A JSON to parse
+
+        Returns:
+            A model instance
+
+        Raises:
+            ValidationError: If the data is not a valid JSON or a valid model.
+        """
+        try:
+            obj = self.decode(data)
+        except (ValueError, TypeError) as e:
+            raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], model)
+        if self.lazy and issubclass(model, BaseResponse) and isinstance(obj, dict):
+            return lazy_response(model, obj, self._build, data)  # type: ignore
+        return self._build(model, obj)
+
+    def _build(self, model: Type[M], obj: Any) -> M:
+        if self.trusted and not (self.sample_rate and random.random() < self.sample_rate):
+            return construct(model, obj)
+        return model.parse_obj(obj)
+
+
+class OrjsonCodec(Codec):
+    """A JSON codec using orjson.
+
+    It encodes straight to bytes with native handling of ``Block`` and ``datetime``, and decodes bytes without an intermediate str.
+    The encoded JSON is compact, without whitespaces between items.
+    """
+    name = 'orjson'
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the codec.
+
+        Args:
+            kwargs: trusted, sample_rate and lazy
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError("The 'orjson' codec requires the orjson package")
+        super().__init__(**kwargs)
+
+    def encode(self, value: Any) -> bytes:
+        """Returns the value encoded as JSON bytes.
+
+        Args:
+            value: A value to encode
+
+        Returns:
+            An encoded JSON
+        """
+        return orjson.dumps(value, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Returns the value decoded from JSON.
+
+        Args:
+            data: A JSON to decode
+
+        Returns:
+            A decoded value
+        """
+        return orjson.loads(data)
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, Block):
+        return value.to_dict()
+    if isinstance(value, BaseModel):
+        return value.dict(exclude_none=True)
+    raise TypeError('not JSON serializable')
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    Codec.name: Codec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec: Union[str, Codec] = 'json', **kwargs: Any) -> Codec:
+    """Returns a codec by name.
+
+    Args:
+        codec: A codec instance, or one of 'json', 'orjson' and 'auto' which picks orjson if installed
+        kwargs: trusted, sample_rate and lazy for a new codec
+
+    Returns:
+        A codec instance
+
+    Raises:
+        ValueError: If the codec name is unknown.
+
+    Examples:
+        >>> get_codec('json').name
+        'json'
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec == 'auto':
+        codec = OrjsonCodec.name if orjson is not None else Codec.name
+    if codec not in CODECS:
+        raise ValueError(f'Unknown codec: {codec}')
+    return CODECS[codec](**kwargs)
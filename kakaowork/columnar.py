@@ -0,0 +1,182 @@
+import csv
+import json
+from datetime import datetime
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from kakaowork.lazy import raw_json
+from kakaowork.models import (
+    BaseResponse,
+    UserField,
+    ConversationField,
+    DepartmentField,
+    UserListResponse,
+    ConversationListResponse,
+    DepartmentListResponse,
+)
+
+ListResponse = Union[UserListResponse, ConversationListResponse, DepartmentListResponse]
+
+# Keys of the rows in list responses by the row model.
+ROW_KEYS: Dict[Type[BaseModel], str] = {
+    UserField: 'users',
+    ConversationField: 'conversations',
+    DepartmentField: 'departments',
+}
+
+
+class ColumnarAccumulator:
+    """Accumulates pages of a list response into column buffers for analytics.
+
+    Rows of decoded or raw pages are appended straight into per-column lists without building model objects; pages of
+    lazy responses (see the client ``lazy`` option) are read from their raw bytes. Timestamps are kept as epoch ints.
+    Columns export to NumPy arrays, an Arrow table or Parquet with the optional packages installed, or to CSV.
+
+    Examples:
+        >>> acc = ColumnarAccumulator(DepartmentField, columns=['id', 'name'])
+        >>> acc.append({'success': True, 'cursor': 'next', 'departments': [{'id': '1', 'name': 'dev'}, {'id': '2', 'name': 'ops'}]})
+        'next'
+        >>> acc.to_dict()
+        {'id': ['1', '2'], 'name': ['dev', 'ops']}
+    """
+    def __init__(self, model: Type[BaseModel], *, columns: Optional[Sequence[str]] = None) -> None:
+        """Initialize the accumulator.
+
+        Args:
+            model: A row model, one of UserField, ConversationField and DepartmentField
+            columns: Columns to keep, all fields of the model if not set
+
+        Raises:
+            ValueError: If the model or a column is not supported.
+        """
+        if model not in ROW_KEYS:
+            raise ValueError(f'Unsupported model: {model.__name__}')
+        unknown = set(columns or []) - set(model.__fields__)
+        if unknown:
+            raise ValueError(f'Unknown columns: {", ".join(sorted(unknown))}')
+        self.model = model
+        self.columns: List[str] = list(columns or model.__fields__)
+        self._key = ROW_KEYS[model]
+        self._buffers: Dict[str, List[Any]] = {column: [] for column in self.columns}
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self._buffers[self.columns[0]]) if self.columns else 0
+
+    def append(self, page: Union[ListResponse, Dict[str, Any], bytes, str]) -> Optional[str]:
+        """Append the rows of a page.
+
+        Args:
+            page: A list response, its decoded dict, or its raw JSON
+
+        Returns:
+            The cursor of the next page, None if it's the last page.
+        """
+        raw = raw_json(page) if isinstance(page, BaseResponse) else None
+        if isinstance(page, BaseModel) and raw is None:
+            self._extend_models(getattr(page, self._key) or [])
+            return getattr(page, 'cursor')
+        source: Any = page if raw is None else raw
+        obj: Dict[str, Any] = json.loads(source) if isinstance(source, (bytes, str)) else source
+        self.extend(obj.get(self._key) or [])
+        return obj.get('cursor')
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Append decoded rows.
+
+        Args:
+            rows: Dicts of rows
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        for column in self.columns:
+            self._buffers[column].extend([row.get(column) for row in rows])
+
+    def clear(self) -> None:
+        """Drop all rows."""
+        for buffer in self._buffers.values():
+            buffer.clear()
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Returns the columns as a dict of lists."""
+        return {column: list(buffer) for column, buffer in self._buffers.items()}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns the columns as NumPy arrays.
+
+        Columns of ints without missing values become int64 arrays, and the others object arrays.
+
+        Returns:
+            A dict of arrays
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        import numpy as np
+
+        arrays = {}
+        for column, buffer in self._buffers.items():
+            if buffer and all(isinstance(value, int) and not isinstance(value, bool) for value in buffer):
+                arrays[column] = np.array(buffer, dtype=np.int64)
+            else:
+                arrays[column] = np.array(buffer, dtype=object)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Returns the columns as an Arrow table.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow as pa
+
+        return pa.table(self._buffers)
+
+    def to_parquet(self, path: str, **kwargs: Any) -> None:
+        """Write the columns to a Parquet file.
+
+        Args:
+            path: A file path
+            kwargs: Options of ``pyarrow.parquet.write_table``
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+    def to_csv(self, file: Union[str, IO[str]]) -> None:
+        """Write the columns to a CSV file with a header.
+
+        Lists and dicts are written as JSON.
+
+        Args:
+            file: A file path or a text file object
+        """
+        if isinstance(file, str):
+            with open(file, 'w', newline='', encoding='utf-8') as f:
+                self._write_csv(f)
+        else:
+            self._write_csv(file)
+
+    def _write_csv(self, f: IO[str]) -> None:
+        writer = csv.writer(f)
+        writer.writerow(self.columns)
+        buffers = [self._buffers[column] for column in self.columns]
+        for row in zip(*buffers):
+            writer.writerow([json.dumps(value) if isinstance(value, (list, dict)) else value for value in row])
+
+    def _extend_models(self, rows: List[BaseModel]) -> None:
+        for column in self.columns:
+            self._buffers[column].extend(_plain(getattr(row, column)) for row in rows)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, BaseModel):
+        return value.dict(exclude_none=True)
+    if isinstance(value, list):
+        return [_plain(each) for each in value]
+    return value
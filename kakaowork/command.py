@@ -15,6 +15,7 @@ from kakaowork.models import (
 )
 from kakaowork.blockkit import Block, BlockType
 from kakaowork.utils import normalize_token, parse_kv_pairs
+from kakaowork.validator import validate_files
 
 
 def _command_aliases() -> Dict[str, str]:
@@ -86,12 +87,15 @@ def _echo(ctx: click.Context, resp: BaseResponse) -> None:
 
 BLOCKKIT = _BlockKitParamType()
 
+# Commands which do not call the API, so they need no app key.
+_OFFLINE_COMMANDS = frozenset(['validate'])
+
 
 @click.group(name='kakaowork', cls=_AliasedGroup, context_settings=dict(token_normalize_func=normalize_token), help='Kakaowork CLI using Client API')
 @click.pass_context
 @click.option('-k', '--app-key', default=os.environ.get('KAKAOWORK_APP_KEY'), help='Kakaowork app key. See https://docs.kakaoi.ai/kakao_work/botdevguide')
 def cli(ctx: click.Context, app_key: str):  # noqa: D103
-    if not app_key:
+    if not app_key and ctx.invoked_subcommand not in _OFFLINE_COMMANDS:
         click.echo(click.style('No app key! Please pass your app key using option(-k, --app-key) or environment variable($KAKAOWORK_APP_KEY)', fg='red'))
         ctx.exit(1)
     opts: _CLIOptions = ctx.ensure_object(_CLIOptions)
@@ -311,3 +315,23 @@ def bots_info(ctx: click.Context):  # noqa: D103
     client = Kakaowork(app_key=opts.app_key)
     r = client.bots.info()
     _echo(ctx, r)
+
+
+@cli.command(name='validate', help='Validates Block Kit payloads in JSON or JSONL files offline')
+@click.pass_context
+@click.argument('paths', nargs=-1, type=click.Path(exists=True), required=True)
+@click.option('-p', '--processes', type=click.IntRange(min=1), help='Number of worker processes. Defaults to the number of CPUs')
+@click.option('-q', '--quiet', is_flag=True, help='Only display files with issues')
+def validate(ctx: click.Context, paths: Tuple[str, ...], processes: Optional[int] = None, quiet: bool = False):  # noqa: D103
+    passed, failed = 0, 0
+    for report in validate_files(paths, processes=processes):
+        if report.success:
+            passed += 1
+            if not quiet:
+                click.echo(f'{report.path}: OK ({report.payloads} payloads)')
+        else:
+            failed += 1
+            for line in report.lines():
+                click.echo(click.style(line, fg='red'))
+    click.echo(click.style(f'{passed} passed, {failed} failed', fg='red' if failed else None))
+    ctx.exit(1 if failed else 0)
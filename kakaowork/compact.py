@@ -0,0 +1,276 @@
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from kakaowork.models import UserField, UserIdentificationField, UserListResponse
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _to_epoch(value: Optional[Union[datetime, int, str]]) -> Optional[int]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return int(value)
+
+
+def _to_tuple(values: Optional[Iterable[Any]]) -> Optional[Tuple]:
+    return None if values is None else tuple(values)
+
+
+class CompactUser:
+    """A memory-compact user record.
+
+    Records use ``__slots__`` instead of a per-instance ``__dict__``, intern repeated strings, keep timestamps as epoch ints and
+    lists as tuples. They convert to and from ``UserField`` on demand.
+
+    Examples:
+        >>> user = CompactUser.from_dict({'id': '1', 'space_id': '1', 'name': 'kim', 'work_start_time': 1617889170})
+        >>> user.work_start_time
+        1617889170
+        >>> user.to_field().work_start_time.isoformat()
+        '2021-04-08T22:39:30+09:00'
+    """
+    __slots__ = (
+        'id',
+        'space_id',
+        'name',
+        'display_name',
+        'identifications',
+        'nickname',
+        'avatar_url',
+        'department',
+        'position',
+        'responsibility',
+        'tels',
+        'mobiles',
+        'work_start_time',
+        'work_end_time',
+        'vacation_start_time',
+        'vacation_end_time',
+    )
+
+    id: str
+    space_id: str
+    name: str
+    display_name: Optional[str]
+    identifications: Optional[Tuple[Tuple[str, str], ...]]
+    nickname: Optional[str]
+    avatar_url: Optional[str]
+    department: Optional[str]
+    position: Optional[str]
+    responsibility: Optional[str]
+    tels: Optional[Tuple[str, ...]]
+    mobiles: Optional[Tuple[str, ...]]
+    work_start_time: Optional[int]
+    work_end_time: Optional[int]
+    vacation_start_time: Optional[int]
+    vacation_end_time: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        space_id: str,
+        name: str,
+        display_name: Optional[str] = None,
+        identifications: Optional[Iterable[Tuple[str, str]]] = None,
+        nickname: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+        department: Optional[str] = None,
+        position: Optional[str] = None,
+        responsibility: Optional[str] = None,
+        tels: Optional[Iterable[str]] = None,
+        mobiles: Optional[Iterable[str]] = None,
+        work_start_time: Optional[Union[datetime, int, str]] = None,
+        work_end_time: Optional[Union[datetime, int, str]] = None,
+        vacation_start_time: Optional[Union[datetime, int, str]] = None,
+        vacation_end_time: Optional[Union[datetime, int, str]] = None,
+    ) -> None:
+        """Initialize the record.
+
+        Args:
+            id: A user ID
+            space_id: A space ID
+            name: A name
+            display_name: A display name
+            identifications: Tuples of an identification type and value
+            nickname: A nickname
+            avatar_url: An avatar URL
+            department: A department name
+            position: A position
+            responsibility: A responsibility
+            tels: Telephone numbers
+            mobiles: Mobile phone numbers
+            work_start_time: A start time of work
+            work_end_time: An end time of work
+            vacation_start_time: A start time of vacation
+            vacation_end_time: An end time of vacation
+        """
+        # Values which repeat across users, such as the space and the department, are interned.
+        self.id = id
+        self.space_id = sys.intern(space_id)
+        self.name = name
+        self.display_name = display_name
+        self.identifications = None if identifications is None else tuple((sys.intern(type_), value) for type_, value in identifications)
+        self.nickname = nickname
+        self.avatar_url = avatar_url
+        self.department = _intern(department)
+        self.position = _intern(position)
+        self.responsibility = _intern(responsibility)
+        self.tels = _to_tuple(tels)
+        self.mobiles = _to_tuple(mobiles)
+        self.work_start_time = _to_epoch(work_start_time)
+        self.work_end_time = _to_epoch(work_end_time)
+        self.vacation_start_time = _to_epoch(vacation_start_time)
+        self.vacation_end_time = _to_epoch(vacation_end_time)
+
+    def __eq__(self, other: object) -> bool:
+        """Whether all fields are equal."""
+        if not isinstance(other, CompactUser):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __hash__(self) -> int:
+        """Returns a hash of all fields."""
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        """Returns a representation of the record."""
+        return f'CompactUser(id={self.id!r}, name={self.name!r})'
+
+    @classmethod
+    def from_field(cls, user: UserField) -> 'CompactUser':
+        """Returns a record from a ``UserField``.
+
+        Args:
+            user: A user field
+
+        Returns:
+            A compact user record
+        """
+        values = {name: getattr(user, name) for name in cls.__slots__}
+        if user.identifications is not None:
+            values['identifications'] = [(each.type, each.value) for each in user.identifications]
+        return cls(**values)
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any]) -> 'CompactUser':
+        """Returns a record from a user of a decoded response, without building a ``UserField``.
+
+        Args:
+            obj: A user dict
+
+        Returns:
+            A compact user record
+        """
+        values = {name: obj[name] for name in cls.__slots__ if name in obj}
+        if obj.get('identifications') is not None:
+            values['identifications'] = [(each['type'], each['value']) for each in obj['identifications']]
+        return cls(**values)
+
+    def to_field(self) -> UserField:
+        """Returns a ``UserField`` of the record."""
+        values = self.to_dict()
+        if self.identifications is not None:
+            values['identifications'] = [UserIdentificationField(type=type_, value=value) for type_, value in self.identifications]
+        return UserField(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a dict of the record like the user of a response, without none values."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        for name in ('tels', 'mobiles'):
+            if values[name] is not None:
+                values[name] = list(values[name])
+        if self.identifications is not None:
+            values['identifications'] = [{'type': type_, 'value': value} for type_, value in self.identifications]
+        return {k: v for k, v in values.items() if v is not None}
+
+    def _astuple(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+class UserDirectory:
+    """A memory-compact directory of users keyed by user ID.
+
+    Examples:
+        >>> directory = UserDirectory([UserField(id='1', space_id='1', name='kim')])
+        >>> len(directory)
+        1
+        >>> directory.get('1').name
+        'kim'
+    """
+    def __init__(self, users: Optional[Iterable[Union[UserField, CompactUser]]] = None) -> None:
+        """Initialize the directory.
+
+        Args:
+            users: Users to add
+        """
+        self._users: Dict[str, CompactUser] = {}
+        if users is not None:
+            self.update(users)
+
+    def __len__(self) -> int:
+        """Returns the number of users."""
+        return len(self._users)
+
+    def __contains__(self, user_id: object) -> bool:
+        """Whether the user exists."""
+        return user_id in self._users
+
+    def __iter__(self) -> Iterator[CompactUser]:
+        """Iterate users."""
+        return iter(list(self._users.values()))
+
+    def get(self, user_id: str) -> Optional[CompactUser]:
+        """Returns a user record.
+
+        Args:
+            user_id: A user ID
+
+        Returns:
+            A compact user record, None if not exists.
+        """
+        return self._users.get(user_id)
+
+    def get_field(self, user_id: str) -> Optional[UserField]:
+        """Returns a user as a ``UserField``.
+
+        Args:
+            user_id: A user ID
+
+        Returns:
+            A user field, None if not exists.
+        """
+        user = self._users.get(user_id)
+        return None if user is None else user.to_field()
+
+    def update(self, users: Union[UserListResponse, Iterable[Union[UserField, CompactUser, Dict[str, Any]]]]) -> None:
+        """Add or replace users.
+
+        Args:
+            users: A user list response, or users as fields, records or dicts of a decoded response
+        """
+        if isinstance(users, UserListResponse):
+            users = users.users or []
+        for user in users:
+            if isinstance(user, UserField):
+                user = CompactUser.from_field(user)
+            elif isinstance(user, dict):
+                user = CompactUser.from_dict(user)
+            self._users[user.id] = user
+
+    def remove(self, user_id: str) -> None:
+        """Remove a user if exists.
+
+        Args:
+            user_id: A user ID
+        """
+        self._users.pop(user_id, None)
+
+    def to_fields(self) -> List[UserField]:
+        """Returns all users as ``UserField``."""
+        return [user.to_field() for user in self._users.values()]
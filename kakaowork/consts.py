@@ -1,4 +1,5 @@
 from enum import Enum, IntEnum
+from datetime import timedelta, timezone as fixed_timezone
 
 from pytz import timezone
 
@@ -28,6 +29,9 @@ BASE_PATH_BOTS = '/v1/bots'
 BASE_PATH_BATCH = '/v1/batch'
 
 KST = timezone('Asia/Seoul')
+# KST has been UTC+9 without DST since 1989, so a fixed offset avoids pytz conversions for recent timestamps.
+KST_FIXED = fixed_timezone(timedelta(hours=9), 'KST')
+KST_FIXED_SINCE = 599583600  # 1989-01-01T00:00:00+09:00
 
 TRUE_STRS = ['true', 'y', 'yes']
 FALSE_STRS = ['false', 'n', 'no']
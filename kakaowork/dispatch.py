@@ -0,0 +1,203 @@
+import asyncio
+import threading
+from queue import Queue
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from kakaowork.models import MessageResponse
+from kakaowork.blockkit import Block
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+DEFAULT_CONCURRENCY = 8
+
+_Task = Tuple[int, Dict[str, Any], Union[Future, asyncio.Future]]
+
+
+class _BaseDispatcher:
+    def __init__(self, *, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' should be greater than or equal to 1")
+        self.concurrency = concurrency
+        self._closed = False
+
+    def shard(self, conversation_id: int) -> int:
+        """Returns the worker index of the conversation.
+
+        Args:
+            conversation_id: A conversation ID
+
+        Returns:
+            A worker index
+
+        Examples:
+            >>> _BaseDispatcher(concurrency=4).shard(10)
+            2
+        """
+        return int(conversation_id) % self.concurrency
+
+    def _check(self) -> None:
+        if self._closed:
+            raise RuntimeError('The dispatcher is closed')
+
+
+class Dispatcher(_BaseDispatcher):
+    """Sends messages in parallel across conversations and in order within a conversation.
+
+    Messages are sharded to worker threads by ``conversation_id``, so each conversation is strictly FIFO
+    while up to ``concurrency`` conversations are processed at the same time.
+    """
+    def __init__(self, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            client: A Kakaowork client
+            kwargs: concurrency
+        """
+        super().__init__(**kwargs)
+        self.client = client
+        self._lock = threading.Lock()
+        self._queues: List[Queue] = []
+        self._workers: List[threading.Thread] = []
+
+    def __enter__(self) -> 'Dispatcher':
+        """Enter the dispatcher."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the dispatcher after sending queued messages."""
+        self.close()
+
+    def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> Future:
+        """Queue a message to the worker of the conversation.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+
+        Returns:
+            A future of the response
+        """
+        future: Future = Future()
+        with self._lock:
+            self._check()
+            if not self._workers:
+                self._start()
+            self._queues[self.shard(conversation_id)].put((conversation_id, {'text': text, 'blocks': blocks}, future))
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the workers after sending queued messages.
+
+        Args:
+            wait: Wait for the workers to finish if True
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for queue in self._queues:
+                queue.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _start(self) -> None:
+        for i in range(self.concurrency):
+            queue: Queue = Queue()
+            worker = threading.Thread(target=self._run, args=(queue, ), name=f'kakaowork-dispatcher-{i}', daemon=True)
+            self._queues.append(queue)
+            self._workers.append(worker)
+            worker.start()
+
+    def _run(self, queue: Queue) -> None:
+        while True:
+            task: Optional[_Task] = queue.get()
+            if task is None:
+                return
+            conversation_id, fields, future = task
+            if not future.set_running_or_notify_cancel():  # type: ignore
+                continue
+            try:
+                future.set_result(self.client.messages.send(conversation_id=conversation_id, **fields))
+            except Exception as e:
+                future.set_exception(e)
+
+
+class AsyncDispatcher(_BaseDispatcher):
+    """Sends messages concurrently across conversations and in order within a conversation.
+
+    Messages are sharded to worker tasks by ``conversation_id``, so each conversation is strictly FIFO
+    while up to ``concurrency`` conversations are processed at the same time.
+    """
+    def __init__(self, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            client: An async Kakaowork client
+            kwargs: concurrency
+        """
+        super().__init__(**kwargs)
+        self.client = client
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Future] = []
+
+    async def __aenter__(self) -> 'AsyncDispatcher':
+        """Enter the dispatcher."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the dispatcher after sending queued messages."""
+        await self.close()
+
+    def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None) -> asyncio.Future:
+        """Queue a message to the worker of the conversation.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+
+        Returns:
+            An awaitable future of the response
+        """
+        self._check()
+        if not self._workers:
+            self._start()
+        future = asyncio.get_running_loop().create_future()
+        self._queues[self.shard(conversation_id)].put_nowait((conversation_id, {'text': text, 'blocks': blocks}, future))
+        return future
+
+    async def close(self) -> None:
+        """Stop the workers after sending queued messages."""
+        if self._closed:
+            return
+        self._closed = True
+        for queue in self._queues:
+            queue.put_nowait(None)
+        await asyncio.gather(*self._workers)
+
+    def _start(self) -> None:
+        for _ in range(self.concurrency):
+            queue: asyncio.Queue = asyncio.Queue()
+            self._queues.append(queue)
+            self._workers.append(asyncio.ensure_future(self._run(queue)))
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            task: Optional[_Task] = await queue.get()
+            if task is None:
+                return
+            conversation_id, fields, future = task
+            if future.done():
+                continue
+            try:
+                resp: MessageResponse = await self.client.messages.send(conversation_id=conversation_id, **fields)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(resp)
@@ -1,3 +1,6 @@
+from typing import Any, List
+
+
 class KakaoworkError(Exception):
     """Kakaowork base error."""
 
@@ -8,3 +11,18 @@ class InvalidBlockType(KakaoworkError):
 
 class InvalidBlock(KakaoworkError):
     """Invalid block."""
+
+
+class PreflightError(KakaoworkError):
+    """Request rejected before sending since it violates the API limits."""
+
+    def __init__(self, code: Any, issues: List[Any]) -> None:
+        """Initialize the error.
+
+        Args:
+            code: The error code which the API would respond with
+            issues: Violations of the request
+        """
+        super().__init__('; '.join(str(issue) for issue in issues))
+        self.code = code
+        self.issues = issues
@@ -0,0 +1,197 @@
+from threading import RLock
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from kakaowork.models import DepartmentField, DepartmentListResponse
+
+ROOT_PARENT_IDS = ('', '0')
+
+
+class DepartmentTree:
+    """An index of departments that answers hierarchy queries.
+
+    The tree is built incrementally from ``Departments.list`` pages. Adding a department that already exists replaces
+    the old entry and re-links it under its (possibly new) parent, so refreshed pages can be fed in as they arrive.
+
+    Examples:
+        >>> tree = DepartmentTree()
+        >>> tree.update([
+        ...     DepartmentField(id='1', ids_path='1', parent_id='0', space_id='1', name='HQ', code='hq', user_count=1, users_ids=[10], leader_ids=[10]),
+        ...     DepartmentField(id='2', ids_path='1/2', parent_id='1', space_id='1', name='Dev', code='dev', user_count=2, users_ids=[20, 21]),
+        ... ])
+        >>> [d.id for d in tree.subtree('1')]
+        ['1', '2']
+        >>> sorted(tree.user_ids('1'))
+        [10, 20, 21]
+        >>> tree.leader_ids('2')
+        [10]
+    """
+    def __init__(self, departments: Optional[Iterable[DepartmentField]] = None) -> None:
+        """Initialize the department tree.
+
+        Args:
+            departments: Departments to index initially
+        """
+        self._lock = RLock()
+        self._nodes: Dict[str, DepartmentField] = {}
+        self._children: Dict[str, List[str]] = {}
+        if departments is not None:
+            self.update(departments)
+
+    def __len__(self) -> int:
+        """Returns the number of indexed departments."""
+        return len(self._nodes)
+
+    def __contains__(self, department_id: object) -> bool:
+        """Whether the department is indexed."""
+        return department_id in self._nodes
+
+    def __iter__(self) -> Iterator[DepartmentField]:
+        """Iterate all indexed departments."""
+        with self._lock:
+            return iter(list(self._nodes.values()))
+
+    def get(self, department_id: str) -> Optional[DepartmentField]:
+        """Returns the department if it is indexed.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            The department, None otherwise.
+        """
+        return self._nodes.get(department_id)
+
+    def update(self, departments: Union[DepartmentListResponse, Iterable[DepartmentField]]) -> None:
+        """Add or replace departments.
+
+        Args:
+            departments: A page of ``Departments.list`` or departments
+        """
+        if isinstance(departments, DepartmentListResponse):
+            departments = departments.departments or []
+        with self._lock:
+            for department in departments:
+                self._unlink(department.id)
+                self._nodes[department.id] = department
+                self._children.setdefault(department.parent_id, []).append(department.id)
+
+    def remove(self, department_id: str) -> None:
+        """Remove a department from the index. Its children stay indexed and become roots until re-linked.
+
+        Args:
+            department_id: A department ID
+        """
+        with self._lock:
+            self._unlink(department_id)
+            self._nodes.pop(department_id, None)
+
+    def clear(self) -> None:
+        """Remove all departments."""
+        with self._lock:
+            self._nodes.clear()
+            self._children.clear()
+
+    def roots(self) -> List[DepartmentField]:
+        """Returns departments without an indexed parent."""
+        with self._lock:
+            return [node for node in self._nodes.values() if node.parent_id in ROOT_PARENT_IDS or node.parent_id not in self._nodes]
+
+    def children(self, department_id: str) -> List[DepartmentField]:
+        """Returns the direct children of the department.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            A list of the child departments
+        """
+        with self._lock:
+            return [self._nodes[child_id] for child_id in self._children.get(department_id, [])]
+
+    def subtree(self, department_id: str) -> List[DepartmentField]:
+        """Returns the department and all of its descendants in breadth-first order.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            A list of departments, empty if the department is not indexed.
+        """
+        with self._lock:
+            if department_id not in self._nodes:
+                return []
+            out: List[DepartmentField] = []
+            seen: Set[str] = set()
+            queue = [department_id]
+            while queue:
+                next_queue: List[str] = []
+                for node_id in queue:
+                    if node_id in seen:  # Guard against a cycle in inconsistent pages
+                        continue
+                    seen.add(node_id)
+                    out.append(self._nodes[node_id])
+                    next_queue.extend(self._children.get(node_id, []))
+                queue = next_queue
+            return out
+
+    def ancestors(self, department_id: str) -> List[DepartmentField]:
+        """Returns the ancestors of the department from its parent up to the root.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            A list of departments, empty if the department is a root or not indexed.
+        """
+        with self._lock:
+            out: List[DepartmentField] = []
+            seen = {department_id}
+            node = self._nodes.get(department_id)
+            while node is not None and node.parent_id not in seen:
+                node = self._nodes.get(node.parent_id)
+                if node is None:
+                    break
+                seen.add(node.id)
+                out.append(node)
+            return out
+
+    def user_ids(self, department_id: str) -> Set[int]:
+        """Returns the IDs of every user in the subtree under the department.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            A set of user IDs
+        """
+        return {user_id for node in self.subtree(department_id) for user_id in (node.users_ids or [])}
+
+    def leader_ids(self, department_id: str) -> List[int]:
+        """Returns the leader IDs of the department and of its ancestors, nearest first and without duplicates.
+
+        Args:
+            department_id: A department ID
+
+        Returns:
+            A list of user IDs
+        """
+        with self._lock:
+            node = self._nodes.get(department_id)
+            if node is None:
+                return []
+            out: List[int] = []
+            for each in [node] + self.ancestors(department_id):
+                for leader_id in each.leader_ids or []:
+                    if leader_id not in out:
+                        out.append(leader_id)
+            return out
+
+    def _unlink(self, department_id: str) -> None:
+        old = self._nodes.get(department_id)
+        if old is None:
+            return
+        siblings = self._children.get(old.parent_id)
+        if siblings is not None:
+            siblings.remove(department_id)
+            if not siblings:
+                del self._children[old.parent_id]
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+
+from pydantic import ValidationError
+
+from kakaowork.models import BaseResponse
+
+R = TypeVar('R', bound=BaseResponse)
+
+Parser = Callable[[Type[Any], Any], Any]
+
+EAGER_FIELDS = ('success', 'error')
+
+_lazy_models: Dict[type, Any] = {}
+
+
+class _LazyResponseMixin:
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self.__fields__ and _materialize(self):  # type: ignore
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        _materialize(self)
+        return super()._iter(*args, **kwargs)  # type: ignore
+
+    def __repr_args__(self) -> Any:
+        _materialize(self)
+        return super().__repr_args__()  # type: ignore
+
+    def __getstate__(self) -> Any:
+        _materialize(self)
+        return super().__getstate__()  # type: ignore
+
+    def __reduce__(self) -> Any:
+        _materialize(self)
+        return (_restore, (_model_of(self), dict(self.__dict__), set(self.__fields_set__)))  # type: ignore
+
+
+def lazy_response(model: Type[R], obj: Dict[str, Any], parse: Parser, raw: Optional[Union[bytes, str]] = None) -> R:
+    """Returns a response which parses its nested models on first access.
+
+    Only the top-level ``success`` and ``error`` are parsed now. The rest is parsed by ``parse`` when any other field is
+    accessed, or when the response is serialized or compared.
+
+    Args:
+        model: A response class
+        obj: Decoded JSON data
+        parse: A function to parse the data into the response class
+        raw: The raw JSON
+
+    Returns:
+        A lazy instance of the response class
+
+    Raises:
+        ValidationError: If ``success`` or ``error`` is not valid.
+
+    Examples:
+        >>> from kakaowork.models import MessageResponse
+        >>> parse = lambda model, obj: model.parse_obj(obj)
+        >>> resp = lazy_response(MessageResponse, {'success': True, 'message': {'id': '1'}}, parse)
+        >>> resp.success
+        True
+        >>> isinstance(resp, MessageResponse)
+        True
+    """
+    cls: Any = _lazy_models.get(model)
+    if cls is None:
+        namespace = {'__slots__': ('_lazy_obj', '_lazy_parse', 'raw'), '__module__': model.__module__}
+        cls = _lazy_models[model] = type(model.__name__, (_LazyResponseMixin, model), namespace)
+    values: Dict[str, Any] = {}
+    for name in EAGER_FIELDS:
+        field = model.__fields__[name]
+        if field.alias in obj:
+            value, error = field.validate(obj[field.alias], {}, loc=field.alias, cls=model)  # type: ignore
+            if error:
+                raise ValidationError([error], model)
+            values[name] = value
+        else:
+            values[name] = field.get_default()
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__fields_set__', {name for name in EAGER_FIELDS if model.__fields__[name].alias in obj})
+    object.__setattr__(instance, '_lazy_obj', obj)
+    object.__setattr__(instance, '_lazy_parse', parse)
+    object.__setattr__(instance, 'raw', raw)
+    return instance
+
+
+def raw_json(resp: BaseResponse) -> Optional[Union[bytes, str]]:
+    """Returns the raw JSON of a lazy response.
+
+    Args:
+        resp: A response
+
+    Returns:
+        The raw JSON which the response was parsed from, None if it's not a lazy response or the JSON was not kept.
+
+    Examples:
+        >>> raw_json(lazy_response(BaseResponse, {'success': True}, None, b'{"success": true}'))
+        b'{"success": true}'
+        >>> raw_json(BaseResponse()) is None
+        True
+    """
+    return getattr(resp, 'raw', None) if isinstance(resp, _LazyResponseMixin) else None
+
+
+def _materialize(instance: Any) -> bool:
+    obj = getattr(instance, '_lazy_obj', None)
+    if obj is None:
+        return False
+    # The data is kept until the parse succeeds, so that a failed parse raises its error again on the next access.
+    parsed = instance._lazy_parse(_model_of(instance), obj)
+    instance.__dict__.update(parsed.__dict__)
+    object.__setattr__(instance, '__fields_set__', set(parsed.__fields_set__))
+    object.__setattr__(instance, '_lazy_obj', None)
+    return True
+
+
+def _model_of(instance: Any) -> type:
+    # A lazy class derives from the mixin and the response class.
+    return type(instance).__bases__[-1]
+
+
+def _restore(model: Type[R], values: Dict[str, Any], fields_set: set) -> R:
+    return model.construct(_fields_set=fields_set, **values)
@@ -5,7 +5,7 @@ from typing import Optional, Union, Any, Dict, List
 from pydantic import BaseModel, validator
 
 from kakaowork.consts import StrEnum
-from kakaowork.blockkit import Block
+from kakaowork.blockkit import Block, decode_blocks
 from kakaowork.utils import to_kst
 
 
@@ -147,7 +147,7 @@ class MessageField(BaseModel):
         if update_time:
             data['update_time'] = to_kst(update_time) if isinstance(update_time, (datetime, int)) else update_time
         if blocks is not None:
-            data['blocks'] = [Block.new(block) for block in blocks]
+            data['blocks'] = decode_blocks(blocks)
         super().__init__(**data)
 
 
@@ -318,7 +318,7 @@ class ModalReactiveView(BaseModel):
 
     def __init__(self, *, blocks: Optional[List[Union[Block, Dict]]] = None, **data) -> None:
         if blocks is not None:
-            data['blocks'] = [Block.new(block) for block in blocks]
+            data['blocks'] = decode_blocks(blocks)
         super().__init__(**data)
 
 
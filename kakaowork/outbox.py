@@ -0,0 +1,533 @@
+import json
+import time
+import random
+import sqlite3
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from kakaowork.consts import StrEnum
+from kakaowork.models import BaseResponse
+from kakaowork.blockkit import Block
+from kakaowork.broadcast import RETRYABLE_ERROR_CODES
+from kakaowork.utils import json_default, drop_none, run_in_executor
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 300.0
+DEFAULT_LEASE_TIMEOUT = 60.0
+DEFAULT_POLL_INTERVAL = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedupe_key TEXT UNIQUE,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    error_code TEXT,
+    error_message TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_status_available_at ON outbox (status, available_at);
+"""
+
+
+class OutboxStatus(StrEnum):
+    """Delivery status of an outbox message."""
+    PENDING = 'pending'
+    INFLIGHT = 'inflight'
+    SENT = 'sent'
+    FAILED = 'failed'
+
+
+class OutboxMessage(BaseModel):
+    """A message claimed from the outbox."""
+    id: int
+    endpoint: str
+    body: bytes
+    attempts: int
+    dedupe_key: Optional[str] = None
+
+
+class Outbox:
+    """A durable outbound message queue backed by SQLite.
+
+    Messages are stored with their encoded request bodies, so producers don't wait on the rate limit. Workers claim messages
+    with a lease; a message whose lease expires, e.g. after a crash, becomes available again, which gives at-least-once delivery.
+
+    Examples:
+        >>> outbox = Outbox(':memory:')
+        >>> outbox.send(conversation_id=1, text='hello', dedupe_key='greeting')
+        1
+        >>> outbox.send(conversation_id=1, text='hello', dedupe_key='greeting') is None
+        True
+        >>> outbox.stats()
+        {'pending': 1, 'inflight': 0, 'sent': 0, 'failed': 0}
+    """
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+    ) -> None:
+        """Initialize the outbox.
+
+        Args:
+            path: A path of the SQLite database file, or ':memory:'
+            max_attempts: Maximum number of delivery attempts before a message fails
+            backoff: Base seconds of the exponential backoff between attempts
+            max_backoff: Maximum seconds of the backoff
+            lease_timeout: Seconds until a claimed message becomes available again
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lease_timeout = lease_timeout
+        self._timer = time.time
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> 'Outbox':
+        """Enter the outbox."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the outbox."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def enqueue(self, endpoint: str, body: bytes, *, dedupe_key: Optional[str] = None, send_at: Optional[float] = None) -> Optional[int]:
+        """Enqueue an encoded request.
+
+        Args:
+            endpoint: A message endpoint, one of 'send', 'send_by' or 'send_by_email'
+            body: An encoded request body
+            dedupe_key: A key to drop duplicated messages
+            send_at: An unix timestamp not to deliver before
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        ids = self.enqueue_many([(endpoint, body, dedupe_key)], send_at=send_at)
+        return ids[0]
+
+    def enqueue_many(self, items: Iterable[Tuple[str, bytes, Optional[str]]], *, send_at: Optional[float] = None) -> List[Optional[int]]:
+        """Enqueue encoded requests in a transaction.
+
+        Args:
+            items: Tuples of an endpoint, an encoded request body and a dedupe key
+            send_at: An unix timestamp not to deliver before
+
+        Returns:
+            The message IDs, None for duplicated messages.
+        """
+        now = self._timer()
+        available_at = now if send_at is None else send_at
+        ids: List[Optional[int]] = []
+        with self._transaction() as conn:
+            for endpoint, body, dedupe_key in items:
+                cur = conn.execute(
+                    'INSERT OR IGNORE INTO outbox (dedupe_key, endpoint, body, status, available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (dedupe_key, endpoint, body, OutboxStatus.PENDING.value, available_at, now, now),
+                )
+                ids.append(cur.lastrowid if cur.rowcount else None)
+        return ids
+
+    def send(self, *, conversation_id: int, text: str, blocks: Optional[List[Block]] = None, **kwargs: Any) -> Optional[int]:
+        """Enqueue a message like ``Messages.send``.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+            kwargs: dedupe_key and send_at
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        return self.enqueue('send', self._encode(conversation_id=conversation_id, text=text, blocks=blocks), **kwargs)
+
+    def send_by(self,
+                *,
+                text: str,
+                email: Optional[str] = None,
+                key: Optional[str] = None,
+                blocks: Optional[List[Block]] = None,
+                **kwargs: Any) -> Optional[int]:
+        """Enqueue a message like ``Messages.send_by``.
+
+        Args:
+            text: A message text
+            email: An email of the user
+            key: A key of the user
+            blocks: Message blocks
+            kwargs: dedupe_key and send_at
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+
+        Raises:
+            ValueError: If neither 'email' nor 'key' exists.
+        """
+        if not (email or key):
+            raise ValueError("Either 'email' or 'key' must exist.")
+        return self.enqueue('send_by', self._encode(email=email, key=key, text=text, blocks=blocks), **kwargs)
+
+    def send_by_email(self, email: str, *, text: str, blocks: Optional[List[Block]] = None, **kwargs: Any) -> Optional[int]:
+        """Enqueue a message like ``Messages.send_by_email``.
+
+        Args:
+            email: An email of the user
+            text: A message text
+            blocks: Message blocks
+            kwargs: dedupe_key and send_at
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        return self.enqueue('send_by_email', self._encode(email=email, text=text, blocks=blocks), **kwargs)
+
+    def claim(self, limit: int = 1) -> List[OutboxMessage]:
+        """Lease messages available for delivery.
+
+        Args:
+            limit: Maximum number of messages
+
+        Returns:
+            A list of claimed messages
+        """
+        now = self._timer()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                'SELECT id, endpoint, body, attempts, dedupe_key FROM outbox WHERE status IN (?, ?) AND available_at <= ? ORDER BY available_at, id LIMIT ?',
+                (OutboxStatus.PENDING.value, OutboxStatus.INFLIGHT.value, now, limit),
+            ).fetchall()
+            return self._lease(conn, rows, now)
+
+    def claim_ids(self, ids: Iterable[int]) -> List[OutboxMessage]:
+        """Lease the given messages if they are available for delivery.
+
+        Args:
+            ids: Message IDs
+
+        Returns:
+            A list of claimed messages, without messages already sent, failed or leased.
+        """
+        now = self._timer()
+        with self._transaction() as conn:
+            rows = []
+            for id_ in ids:
+                rows.extend(
+                    conn.execute(
+                        'SELECT id, endpoint, body, attempts, dedupe_key FROM outbox WHERE id = ? AND status IN (?, ?) AND available_at <= ?',
+                        (id_, OutboxStatus.PENDING.value, OutboxStatus.INFLIGHT.value, now),
+                    ).fetchall())
+            return self._lease(conn, rows, now)
+
+    def available_until(self, until: float) -> List[Tuple[int, float]]:
+        """Returns messages to deliver before the unix timestamp.
+
+        Args:
+            until: An unix timestamp
+
+        Returns:
+            A list of tuples of a message ID and the unix timestamp when it becomes available
+        """
+        with self._lock:
+            return self._conn.execute(
+                'SELECT id, available_at FROM outbox WHERE status IN (?, ?) AND available_at < ? ORDER BY available_at, id',
+                (OutboxStatus.PENDING.value, OutboxStatus.INFLIGHT.value, until),
+            ).fetchall()
+
+    def _lease(self, conn: sqlite3.Connection, rows: List[Tuple], now: float) -> List[OutboxMessage]:
+        conn.executemany(
+            'UPDATE outbox SET status = ?, attempts = attempts + 1, available_at = ?, updated_at = ? WHERE id = ?',
+            [(OutboxStatus.INFLIGHT.value, now + self.lease_timeout, now, row[0]) for row in rows],
+        )
+        return [OutboxMessage(id=row[0], endpoint=row[1], body=row[2], attempts=row[3] + 1, dedupe_key=row[4]) for row in rows]
+
+    def ack(self, message: OutboxMessage) -> None:
+        """Mark the message as sent.
+
+        Args:
+            message: A claimed message
+        """
+        with self._transaction() as conn:
+            conn.execute('UPDATE outbox SET status = ?, error_code = NULL, error_message = NULL, updated_at = ? WHERE id = ?',
+                         (OutboxStatus.SENT.value, self._timer(), message.id))
+
+    def nack(self, message: OutboxMessage, *, error_code: Optional[str] = None, error_message: Optional[str] = None, retryable: bool = True) -> None:
+        """Reschedule the message with backoff, or mark it as failed.
+
+        Args:
+            message: A claimed message
+            error_code: An error code of the last attempt
+            error_message: An error message of the last attempt
+            retryable: Whether the message can be retried
+        """
+        now = self._timer()
+        if retryable and message.attempts < self.max_attempts:
+            delay = min(self.max_backoff, self.backoff * (2**(message.attempts - 1)))
+            status, available_at = OutboxStatus.PENDING, now + delay * random.uniform(0.5, 1.0)
+        else:
+            status, available_at = OutboxStatus.FAILED, now
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE outbox SET status = ?, available_at = ?, error_code = ?, error_message = ?, updated_at = ? WHERE id = ?',
+                (status.value, available_at, error_code, error_message, now, message.id),
+            )
+
+    def settle(self, message: OutboxMessage, resp: Optional[BaseResponse] = None, error: Optional[Exception] = None) -> None:
+        """Ack or nack the message from a delivery result.
+
+        Args:
+            message: A claimed message
+            resp: A response of the delivery
+            error: An exception raised by the delivery
+        """
+        if resp is not None and resp.success:
+            self.ack(message)
+        elif resp is not None and resp.error is not None:
+            self.nack(message, error_code=resp.error.code.value, error_message=resp.error.message, retryable=resp.error.code in RETRYABLE_ERROR_CODES)
+        else:
+            self.nack(message, error_message=str(error) if error else None)
+
+    def retry_failed(self) -> int:
+        """Make failed messages pending again.
+
+        Returns:
+            The number of messages to retry
+        """
+        now = self._timer()
+        with self._transaction() as conn:
+            cur = conn.execute('UPDATE outbox SET status = ?, attempts = 0, available_at = ?, updated_at = ? WHERE status = ?',
+                               (OutboxStatus.PENDING.value, now, now, OutboxStatus.FAILED.value))
+        return cur.rowcount
+
+    def purge(self, *, before: Optional[float] = None) -> int:
+        """Delete sent messages.
+
+        Args:
+            before: Delete messages sent before the unix timestamp, all sent messages if not set
+
+        Returns:
+            The number of deleted messages
+        """
+        with self._transaction() as conn:
+            cur = conn.execute('DELETE FROM outbox WHERE status = ? AND updated_at < ?', (OutboxStatus.SENT.value, self._timer() if before is None else before))
+        return cur.rowcount
+
+    def next_available_at(self) -> Optional[float]:
+        """Returns the unix timestamp when the next message becomes available, None if there is no message to deliver."""
+        with self._lock:
+            row = self._conn.execute('SELECT MIN(available_at) FROM outbox WHERE status IN (?, ?)',
+                                     (OutboxStatus.PENDING.value, OutboxStatus.INFLIGHT.value)).fetchone()
+        return row[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of messages by status."""
+        counts = {status.value: 0 for status in OutboxStatus}
+        with self._lock:
+            for status, count in self._conn.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status'):
+                counts[status] = count
+        return counts
+
+    @staticmethod
+    def _encode(**fields: Any) -> bytes:
+        return json.dumps(drop_none(fields), default=json_default).encode('utf-8')
+
+
+class OutboxWorker:
+    """Delivers outbox messages through a Kakaowork client using a pool of threads."""
+    def __init__(self, outbox: Outbox, client: 'Kakaowork', *, concurrency: int = 4, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Initialize the worker.
+
+        Args:
+            outbox: An outbox to drain
+            client: A Kakaowork client
+            concurrency: Number of delivery threads
+            poll_interval: Maximum seconds to wait when there is no message to deliver
+        """
+        self.outbox = outbox
+        self.client = client
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def deliver(self, message: OutboxMessage) -> bool:
+        """Deliver a claimed message and settle it.
+
+        Args:
+            message: A claimed message
+
+        Returns:
+            True if the message is sent, False otherwise.
+        """
+        resp: Optional[BaseResponse] = None
+        error: Optional[Exception] = None
+        try:
+            resp = self.client.messages._request(message.endpoint, message.body)
+        except Exception as e:
+            error = e
+        self.outbox.settle(message, resp, error)
+        return resp is not None and resp.success
+
+    def drain(self) -> int:
+        """Deliver messages available now in the calling thread.
+
+        Returns:
+            The number of sent messages
+        """
+        sent = 0
+        messages = self.outbox.claim()
+        while messages:
+            sent += sum(self.deliver(message) for message in messages)
+            messages = self.outbox.claim()
+        return sent
+
+    def start(self) -> None:
+        """Start delivery threads."""
+        self._stop.clear()
+        for i in range(self.concurrency - len(self._threads)):
+            thread = threading.Thread(target=self._run, name=f'kakaowork-outbox-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop delivery threads after their in-flight messages.
+
+        Args:
+            timeout: Maximum seconds to wait for each thread
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            messages = self.outbox.claim()
+            if not messages:
+                self._stop.wait(_idle_time(self.outbox, self.poll_interval))
+                continue
+            for message in messages:
+                self.deliver(message)
+
+
+class AsyncOutboxWorker:
+    """Delivers outbox messages through an async Kakaowork client using asyncio tasks.
+
+    Database calls run in the default executor of the event loop, so a locked database does not block other coroutines.
+    """
+    def __init__(self, outbox: Outbox, client: 'AsyncKakaowork', *, concurrency: int = 4, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Initialize the worker.
+
+        Args:
+            outbox: An outbox to drain
+            client: An async Kakaowork client
+            concurrency: Number of delivery tasks
+            poll_interval: Maximum seconds to wait when there is no message to deliver
+        """
+        self.outbox = outbox
+        self.client = client
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Future] = []
+
+    async def deliver(self, message: OutboxMessage) -> bool:
+        """Deliver a claimed message and settle it.
+
+        Args:
+            message: A claimed message
+
+        Returns:
+            True if the message is sent, False otherwise.
+        """
+        resp: Optional[BaseResponse] = None
+        error: Optional[Exception] = None
+        try:
+            resp = await self.client.messages._request(message.endpoint, message.body)
+        except Exception as e:
+            error = e
+        await run_in_executor(self.outbox.settle, message, resp, error)
+        return resp is not None and resp.success
+
+    async def drain(self) -> int:
+        """Deliver messages available now with bounded concurrency.
+
+        Returns:
+            The number of sent messages
+        """
+        sent = 0
+        messages = await run_in_executor(self.outbox.claim, self.concurrency)
+        while messages:
+            sent += sum(await asyncio.gather(*[self.deliver(message) for message in messages]))
+            messages = await run_in_executor(self.outbox.claim, self.concurrency)
+        return sent
+
+    def start(self) -> None:
+        """Start delivery tasks in the running event loop."""
+        self._stop = asyncio.Event()
+        for _ in range(self.concurrency - len(self._tasks)):
+            self._tasks.append(asyncio.ensure_future(self._run(self._stop)))
+
+    async def stop(self) -> None:
+        """Stop delivery tasks after their in-flight messages."""
+        if self._stop is not None:
+            self._stop.set()
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+
+    async def _run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            messages = await run_in_executor(self.outbox.claim)
+            if not messages:
+                try:
+                    await asyncio.wait_for(stop.wait(), await run_in_executor(_idle_time, self.outbox, self.poll_interval))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            for message in messages:
+                await self.deliver(message)
+
+
+def _idle_time(outbox: Outbox, poll_interval: float) -> float:
+    # Waits until the next message is due, e.g. a retry or an expired lease, but no longer than the poll interval.
+    next_at = outbox.next_available_at()
+    if next_at is None:
+        return poll_interval
+    return max(0.0, min(poll_interval, next_at - outbox._timer()))
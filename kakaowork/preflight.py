@@ -0,0 +1,145 @@
+import threading
+from typing import Any, Iterator, List, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from kakaowork.blockkit import MAX_LEN_ATTRS, REQUIRED_KEYS, Block, BlockKitBuilder, TextBlock
+from kakaowork.exceptions import KakaoworkError, PreflightError
+from kakaowork.models import ErrorCode
+
+
+class PreflightIssue(BaseModel):
+    """A violation of the API limits found before sending."""
+    code: ErrorCode
+    loc: str
+    message: str
+
+    def __str__(self) -> str:
+        return f'{self.loc}: {self.message}'
+
+
+class PreflightStats(BaseModel):
+    """Counters of preflight checks."""
+    checked: int = 0
+    avoided: int = 0
+
+
+class Preflight:
+    """Checks message requests locally against the known API limits.
+
+    The limits are the ones of `BlockKitBuilder` and of each block class. Blocks are checked by their current values, so
+    that changes which bypass validators, such as appending to a list property, are caught too. The same checks are used
+    by `BlockKitBuilder.freeze` and by the Block Kit validator.
+
+    Examples:
+        >>> preflight = Preflight()
+        >>> preflight.check(text='t' * 2001)
+        Traceback (most recent call last):
+            ...
+        kakaowork.exceptions.PreflightError: text: The 'text' property's length should be less than or equal to 2000
+        >>> preflight.stats
+        PreflightStats(checked=1, avoided=1)
+    """
+    def __init__(self) -> None:
+        """Initialize the preflight."""
+        self.stats = PreflightStats()
+        self._lock = threading.Lock()
+
+    def check(self, *, text: Optional[str] = None, blocks: Optional[List[Block]] = None) -> None:
+        """Check a message request.
+
+        Args:
+            text: A message text
+            blocks: Message blocks
+
+        Raises:
+            PreflightError: If the request violates the limits. It is counted as an avoided call.
+        """
+        issues = self.issues(text=text, blocks=blocks)
+        with self._lock:
+            self.stats.checked += 1
+            if issues:
+                self.stats.avoided += 1
+        if issues:
+            code = ErrorCode.TEXT_TOO_LONG if all(issue.code == ErrorCode.TEXT_TOO_LONG for issue in issues) else ErrorCode.INVALID_BLOCKS
+            raise PreflightError(code, issues)
+
+    @staticmethod
+    def issues(*, text: Optional[str] = None, blocks: Optional[List[Block]] = None) -> List[PreflightIssue]:
+        """Returns violations of a message request.
+
+        Args:
+            text: A message text
+            blocks: Message blocks. Decoded JSON objects are validated as blocks.
+
+        Returns:
+            Issues of the request, empty if it is valid
+        """
+        issues: List[PreflightIssue] = []
+        max_len_text = BlockKitBuilder._max_len_text
+        if text is not None and len(text) > max_len_text:
+            issues.append(PreflightIssue(code=ErrorCode.TEXT_TOO_LONG, loc='text', message=_too_long('text', max_len_text)))
+        if blocks is not None:
+            max_len_blocks = BlockKitBuilder._max_len_blocks
+            if len(blocks) > max_len_blocks:
+                issues.append(PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc='blocks', message=_too_long('blocks', max_len_blocks)))
+            for i, block in enumerate(blocks):
+                issues.extend(_block_issues(block, f'blocks.{i}'))
+        return issues
+
+
+def validation_issues(error: ValidationError, loc: str = '') -> Iterator[PreflightIssue]:
+    """Returns issues of a validation error.
+
+    Args:
+        error: A validation error of a model
+        loc: The location of the model
+
+    Returns:
+        An iterator of issues located under the location
+    """
+    for e in error.errors():
+        key = '.'.join(str(part) for part in e['loc'] if part != '__root__')
+        yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc='.'.join(part for part in (loc, key) if part), message=e['msg'])
+
+
+def _block_issues(block: Any, loc: str) -> Iterator[PreflightIssue]:
+    if not isinstance(block, Block):
+        try:
+            BlockKitBuilder._to_block(block)
+        except ValidationError as e:
+            yield from validation_issues(e, loc)
+        except (KakaoworkError, ValueError, TypeError) as e:
+            yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=loc, message=str(e))
+        return
+    cls = type(block)
+    for name in block.__fields__:
+        value = block.__dict__.get(name)
+        if value is None:
+            continue
+        key = f'{loc}.{name}'
+        attr = MAX_LEN_ATTRS.get(name)
+        max_len = getattr(cls, attr, None) if attr is not None else None
+        if isinstance(value, str):
+            if not value and name in REQUIRED_KEYS:
+                yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=key, message=f"The '{name}' property should be exists")
+            elif max_len is not None and len(value) > max_len:
+                yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=key, message=_too_long(name, max_len))
+        elif isinstance(value, Block):
+            yield from _block_issues(value, key)
+        elif isinstance(value, (list, tuple)):
+            if max_len is not None and not value:
+                yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=key, message=f"The '{name}' property should be exists")
+            elif max_len is not None and len(value) > max_len:
+                yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=key, message=_too_long(name, max_len))
+            for i, item in enumerate(value):
+                if isinstance(item, Block):
+                    yield from _block_issues(item, f'{key}.{i}')
+    if isinstance(block, TextBlock) and block.inlines:
+        if sum(len(inline.text) for inline in block.inlines) > block._max_len_text:
+            message = f"The 'inlines' property's all texts should be less than or equal to {block._max_len_text}"
+            yield PreflightIssue(code=ErrorCode.INVALID_BLOCKS, loc=f'{loc}.inlines', message=message)
+
+
+def _too_long(name: str, max_len: int) -> str:
+    return f"The '{name}' property's length should be less than or equal to {max_len}"
@@ -1,7 +1,11 @@
 from abc import ABCMeta, abstractmethod
+from typing import TYPE_CHECKING
 
 from kakaowork.models import SubmitActionReactiveBody, SubmitModalReactiveBody, RequestModalReactiveBody, RequestModalReactiveResponse
 
+if TYPE_CHECKING:
+    from kakaowork.client import AsyncKakaowork  # noqa
+
 
 class BaseReactiveActionHandler(metaclass=ABCMeta):
     """An abstract class for reactive action handler."""
@@ -43,3 +47,63 @@ class BaseReactiveModalHandler(metaclass=ABCMeta):
             True if this handler succeeds, False otherwise.
         """
         raise NotImplementedError()
+
+
+class _BaseAsyncReactiveHandler(metaclass=ABCMeta):
+    def __init__(self, client: 'AsyncKakaowork') -> None:
+        """Initialize the handler.
+
+        Args:
+            client: An async Kakaowork client. Handlers given the same client share its connection pool and rate limiter.
+        """
+        self.client = client
+
+
+class BaseAsyncReactiveActionHandler(_BaseAsyncReactiveHandler):
+    """An abstract class for async reactive action handler.
+
+    The handler runs on the event loop, so it can await the client and run follow-up API calls concurrently, e.g. with
+    `asyncio.gather`, without holding a thread.
+    """
+    @abstractmethod
+    async def handle_submit(self, body: SubmitActionReactiveBody) -> bool:
+        """An abstract coroutine for handling user's request from the KakaoWork server to your server.
+
+        Args:
+            body: The request body of user's submission.
+
+        Returns:
+            True if this handler succeeds, False otherwise.
+        """
+        raise NotImplementedError()
+
+
+class BaseAsyncReactiveModalHandler(_BaseAsyncReactiveHandler):
+    """An abstract class for async reactive modal handler.
+
+    The handler runs on the event loop, so it can await the client and run follow-up API calls concurrently, e.g. with
+    `asyncio.gather`, without holding a thread.
+    """
+    @abstractmethod
+    async def handle_request(self, body: RequestModalReactiveBody) -> RequestModalReactiveResponse:
+        """An abstract coroutine for handling a request to compose a modal from the KakaoWork server to your server.
+
+        Args:
+            body: The request body of user's modal action.
+
+        Returns:
+            A modal to show to the user.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def handle_submit(self, body: SubmitModalReactiveBody) -> bool:
+        """An abstract coroutine for handling user's request from the KakaoWork server to your server.
+
+        Args:
+            body: The request body of user's submission.
+
+        Returns:
+            True if this handler succeeds, False otherwise.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,343 @@
+import math
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, Set, Tuple, TypeVar, Union
+
+from kakaowork.blockkit import Block
+from kakaowork.outbox import Outbox, OutboxMessage, OutboxWorker, AsyncOutboxWorker
+from kakaowork.utils import run_in_executor
+
+if TYPE_CHECKING:
+    from kakaowork.client import Kakaowork, AsyncKakaowork  # noqa
+
+T = TypeVar('T')
+
+DEFAULT_TICK = 1.0
+DEFAULT_SLOTS = 600
+DEFAULT_CONCURRENCY = 4
+
+
+class TimerWheel(Generic[T]):
+    """A hashed timer wheel.
+
+    Scheduling is O(1), and advancing visits one slot per elapsed tick, so the cost of a tick depends only on the items due in it
+    as long as deadlines are within the horizon, ``tick * slots`` seconds.
+
+    Examples:
+        >>> wheel = TimerWheel(tick=1.0, slots=8, start=0.0)
+        >>> wheel.schedule(2.5, 'a')
+        >>> wheel.schedule(10.0, 'b')
+        >>> wheel.advance(3.0)
+        ['a']
+        >>> wheel.advance(10.0)
+        ['b']
+    """
+    def __init__(self, *, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS, start: Optional[float] = None) -> None:
+        """Initialize the wheel.
+
+        Args:
+            tick: Seconds of a tick
+            slots: Number of slots
+            start: An unix timestamp of the first tick, now if not set
+        """
+        if tick <= 0:
+            raise ValueError("The 'tick' should be greater than 0")
+        if slots < 1:
+            raise ValueError("The 'slots' should be greater than or equal to 1")
+        self.tick = tick
+        self.slots = slots
+        self._origin = time.time() if start is None else start
+        self._current = 0
+        self._buckets: List[List[Tuple[int, T]]] = [[] for _ in range(slots)]
+        self._overdue: List[T] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled items."""
+        return self._size
+
+    @property
+    def horizon(self) -> float:
+        """Returns seconds covered by a revolution of the wheel."""
+        return self.tick * self.slots
+
+    def schedule(self, deadline: float, item: T) -> None:
+        """Schedule an item.
+
+        Args:
+            deadline: An unix timestamp to release the item at
+            item: An item
+        """
+        ticks = math.ceil((deadline - self._origin) / self.tick)
+        if ticks <= self._current:
+            self._overdue.append(item)
+        else:
+            self._buckets[ticks % self.slots].append((ticks, item))
+        self._size += 1
+
+    def advance(self, now: float) -> List[T]:
+        """Advance the wheel and release due items.
+
+        Args:
+            now: An unix timestamp
+
+        Returns:
+            A list of due items in the order of deadlines
+        """
+        target = math.floor((now - self._origin) / self.tick)
+        due, self._overdue = self._overdue, []
+        for ticks in range(self._current + 1, min(target, self._current + self.slots) + 1):
+            bucket = self._buckets[ticks % self.slots]
+            if not bucket:
+                continue
+            kept = [entry for entry in bucket if entry[0] > target]
+            if len(kept) < len(bucket):
+                due.extend(item for ticks_, item in sorted((entry for entry in bucket if entry[0] <= target), key=lambda entry: entry[0]))
+                self._buckets[ticks % self.slots] = kept
+        self._current = max(self._current, target)
+        self._size -= len(due)
+        return due
+
+
+class _BaseScheduler:
+    def __init__(self, outbox: Outbox, *, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' should be greater than or equal to 1")
+        self.outbox = outbox
+        self.concurrency = concurrency
+        self.wheel: TimerWheel[int] = TimerWheel(tick=tick, slots=slots, start=outbox._timer())
+        self._lock = threading.RLock()
+        self._scheduled: Set[int] = set()
+        self._next_refill = -math.inf
+
+    def send(self,
+             *,
+             conversation_id: int,
+             text: str,
+             blocks: Optional[List[Block]] = None,
+             send_at: Optional[Union[datetime, float]] = None,
+             **kwargs: Any) -> Optional[int]:
+        """Schedule a message like ``Messages.send``.
+
+        Args:
+            conversation_id: A conversation ID
+            text: A message text
+            blocks: Message blocks
+            send_at: A datetime or an unix timestamp to send at, now if not set
+            kwargs: dedupe_key
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        timestamp = _timestamp(send_at)
+        return self._track(self.outbox.send(conversation_id=conversation_id, text=text, blocks=blocks, send_at=timestamp, **kwargs), timestamp)
+
+    def send_by(self,
+                *,
+                text: str,
+                email: Optional[str] = None,
+                key: Optional[str] = None,
+                blocks: Optional[List[Block]] = None,
+                send_at: Optional[Union[datetime, float]] = None,
+                **kwargs: Any) -> Optional[int]:
+        """Schedule a message like ``Messages.send_by``.
+
+        Args:
+            text: A message text
+            email: An email of the user
+            key: A key of the user
+            blocks: Message blocks
+            send_at: A datetime or an unix timestamp to send at, now if not set
+            kwargs: dedupe_key
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        timestamp = _timestamp(send_at)
+        return self._track(self.outbox.send_by(text=text, email=email, key=key, blocks=blocks, send_at=timestamp, **kwargs), timestamp)
+
+    def send_by_email(self,
+                      email: str,
+                      *,
+                      text: str,
+                      blocks: Optional[List[Block]] = None,
+                      send_at: Optional[Union[datetime, float]] = None,
+                      **kwargs: Any) -> Optional[int]:
+        """Schedule a message like ``Messages.send_by_email``.
+
+        Args:
+            email: An email of the user
+            text: A message text
+            blocks: Message blocks
+            send_at: A datetime or an unix timestamp to send at, now if not set
+            kwargs: dedupe_key
+
+        Returns:
+            The message ID, None if a message with the same dedupe key exists.
+        """
+        timestamp = _timestamp(send_at)
+        return self._track(self.outbox.send_by_email(email, text=text, blocks=blocks, send_at=timestamp, **kwargs), timestamp)
+
+    def _track(self, id_: Optional[int], send_at: Optional[float]) -> Optional[int]:
+        # Messages beyond the horizon stay only in the outbox until a refill loads them.
+        if id_ is None:
+            return None
+        deadline = self.outbox._timer() if send_at is None else send_at
+        with self._lock:
+            if deadline < self._next_refill + self.wheel.horizon / 2 and id_ not in self._scheduled:
+                self._scheduled.add(id_)
+                self.wheel.schedule(deadline, id_)
+        return id_
+
+    def _due(self) -> List[OutboxMessage]:
+        now = self.outbox._timer()
+        with self._lock:
+            if now >= self._next_refill:
+                self._refill(now)
+            ids = self.wheel.advance(now)
+            self._scheduled.difference_update(ids)
+        return self.outbox.claim_ids(ids) if ids else []
+
+    def _refill(self, now: float) -> None:
+        # Load messages due within the horizon, including retries and messages enqueued by others.
+        self._next_refill = now + self.wheel.horizon / 2
+        for id_, available_at in self.outbox.available_until(now + self.wheel.horizon):
+            if id_ not in self._scheduled:
+                self._scheduled.add(id_)
+                self.wheel.schedule(available_at, id_)
+
+    def _settled(self, results: List[bool]) -> int:
+        if not all(results):
+            # Retried messages are rescheduled by the outbox, so reload them on the next tick.
+            with self._lock:
+                self._next_refill = -math.inf
+        return sum(results)
+
+
+class Scheduler(_BaseScheduler):
+    """Sends messages at scheduled times through a Kakaowork client.
+
+    Scheduled messages are persisted in an outbox, and only those due within the horizon of the timer wheel are kept in memory.
+    Due messages are released into the rate-limited client on each tick by a pool of threads.
+
+    Examples:
+        >>> from datetime import timedelta
+        >>> from kakaowork import Kakaowork
+        >>> scheduler = Scheduler(Outbox(':memory:'), Kakaowork(app_key='dummy'))
+        >>> scheduler.send(conversation_id=1, text='Good morning', send_at=datetime.now() + timedelta(hours=1))
+        1
+    """
+    def __init__(self, outbox: Outbox, client: 'Kakaowork', **kwargs) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            outbox: An outbox to persist scheduled messages
+            client: A Kakaowork client
+            kwargs: tick, slots and concurrency
+        """
+        super().__init__(outbox, **kwargs)
+        self.worker = OutboxWorker(outbox, client)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_pending(self) -> int:
+        """Send due messages in the calling thread.
+
+        Returns:
+            The number of sent messages
+        """
+        messages = self._due()
+        if not messages:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(messages))) as executor:
+            return self._settled(list(executor.map(self.worker.deliver, messages)))
+
+    def start(self) -> None:
+        """Start the scheduler thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='kakaowork-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.wheel.tick)
+
+
+class AsyncScheduler(_BaseScheduler):
+    """Sends messages at scheduled times through an async Kakaowork client.
+
+    Scheduled messages are persisted in an outbox, and only those due within the horizon of the timer wheel are kept in memory.
+    Due messages are released into the rate-limited client on each tick by asyncio tasks. Database calls run in the default
+    executor of the event loop.
+    """
+    def __init__(self, outbox: Outbox, client: 'AsyncKakaowork', **kwargs) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            outbox: An outbox to persist scheduled messages
+            client: An async Kakaowork client
+            kwargs: tick, slots and concurrency
+        """
+        super().__init__(outbox, **kwargs)
+        self.worker = AsyncOutboxWorker(outbox, client)
+        self._stop: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Future] = None
+
+    async def run_pending(self) -> int:
+        """Send due messages with bounded concurrency.
+
+        Returns:
+            The number of sent messages
+        """
+        messages = await run_in_executor(self._due)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _deliver(message: OutboxMessage) -> bool:
+            async with semaphore:
+                return await self.worker.deliver(message)
+
+        return self._settled(list(await asyncio.gather(*[_deliver(message) for message in messages])))
+
+    def start(self) -> None:
+        """Start the scheduler task in the running event loop."""
+        if self._task is not None:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run(self._stop))
+
+    async def stop(self) -> None:
+        """Stop the scheduler task."""
+        if self._stop is not None:
+            self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            await self.run_pending()
+            try:
+                await asyncio.wait_for(stop.wait(), self.wheel.tick)
+            except asyncio.TimeoutError:
+                pass
+
+
+def _timestamp(send_at: Optional[Union[datetime, float]]) -> Optional[float]:
+    return send_at.timestamp() if isinstance(send_at, datetime) else send_at
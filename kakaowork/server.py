@@ -0,0 +1,336 @@
+import json
+import signal
+import asyncio
+from http import HTTPStatus
+from asyncio.base_events import Server
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from kakaowork.models import (
+    ReactiveType,
+    BaseReactiveBody,
+    SubmitActionReactiveBody,
+    SubmitModalReactiveBody,
+    RequestModalReactiveBody,
+)
+from kakaowork.reactive import (
+    BaseReactiveActionHandler,
+    BaseReactiveModalHandler,
+    BaseAsyncReactiveActionHandler,
+    BaseAsyncReactiveModalHandler,
+)
+
+DEFAULT_HOST = '0.0.0.0'
+DEFAULT_PORT = 8000
+DEFAULT_CONCURRENCY = 16
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_SHUTDOWN_TIMEOUT = 10.0
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+DEFAULT_RETRY_AFTER = 1
+
+_BODY_TYPES: Dict[ReactiveType, Type[BaseReactiveBody]] = {
+    ReactiveType.SUBMIT_ACTION: SubmitActionReactiveBody,
+    ReactiveType.REQUEST_MODAL: RequestModalReactiveBody,
+    ReactiveType.SUBMIT_MODAL: SubmitModalReactiveBody,
+}
+
+_Response = Tuple[int, bytes]
+_ActionHandler = Union[BaseReactiveActionHandler, BaseAsyncReactiveActionHandler]
+_ModalHandler = Union[BaseReactiveModalHandler, BaseAsyncReactiveModalHandler]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ReactiveServerStats(BaseModel):
+    """Counters of a reactive server."""
+    handled: int = 0
+    rejected: int = 0
+    failed: int = 0
+
+
+class ReactiveServer:
+    """Serves reactive callbacks of the KakaoWork server over HTTP with asyncio.
+
+    A callback is dispatched to a handler by its ``type``: ``submit_action`` to the action handler, ``request_modal`` and
+    ``submission`` to the modal handler. Up to ``concurrency`` callbacks are handled at the same time, and up to
+    ``queue_size`` more callbacks wait. Async handlers run on the event loop and sync handlers in a thread pool.
+    Callbacks beyond that are answered with ``503 Service Unavailable`` right after their headers are read. On close, the
+    server stops accepting connections, drops idle keep-alive connections and waits for the callbacks in flight.
+
+    Examples:
+        >>> class Handler(BaseReactiveActionHandler):
+        ...     def handle_submit(self, body):
+        ...         return body.action_name == 'confirm'
+        >>> server = ReactiveServer(action_handler=Handler())
+        >>> message = {'id': '1', 'text': 'text', 'user_id': '1', 'conversation_id': 1, 'send_time': 1617889170, 'update_time': 1617889170}
+        >>> body = {'type': 'submit_action', 'action_time': '', 'message': message, 'value': '', 'action_name': 'confirm', 'react_user_id': 1}
+        >>> asyncio.run(server.dispatch(json.dumps(body).encode()))
+        (200, b'{}')
+    """
+    def __init__(
+        self,
+        *,
+        action_handler: Optional[_ActionHandler] = None,
+        modal_handler: Optional[_ModalHandler] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            action_handler: A handler of submitted actions
+            modal_handler: A handler of modal requests and submitted modals
+            concurrency: The maximum number of callbacks handled at the same time
+            queue_size: The maximum number of callbacks waiting to be handled
+            timeout: Maximum seconds to read a request, also the idle timeout of a keep-alive connection
+            max_body_size: The maximum size of a request body in bytes
+        """
+        if concurrency < 1:
+            raise ValueError("The 'concurrency' should be greater than or equal to 1")
+        if queue_size < 0:
+            raise ValueError("The 'queue_size' should be greater than or equal to 0")
+        self.action_handler = action_handler
+        self.modal_handler = modal_handler
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.max_body_size = max_body_size
+        self.stats = ReactiveServerStats()
+        self._pending = 0
+        self._closing = False
+        self._server: Optional[Server] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._connections: Set[asyncio.Future] = set()
+        self._busy: Set[asyncio.Future] = set()
+
+    async def __aenter__(self) -> 'ReactiveServer':
+        """Enter the server."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the server after the callbacks in flight are handled."""
+        await self.close()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The host and port which the server listens on."""
+        if self._server is None or not self._server.sockets:
+            raise RuntimeError('The server is not started')
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def pending(self) -> int:
+        """The number of callbacks being handled or waiting to be handled."""
+        return self._pending
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **kwargs) -> None:
+        """Start listening.
+
+        Args:
+            host: A host to bind
+            port: A port to bind, or 0 for any free port
+            kwargs: Other arguments of `asyncio.start_server`, e.g. ssl or backlog
+        """
+        if self._server is not None:
+            raise RuntimeError('The server is already started')
+        self._closing = False
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='kakaowork-reactive')
+        self._server = await asyncio.start_server(self._serve, host, port, **kwargs)
+
+    async def close(self, timeout: Optional[float] = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Stop accepting connections and wait for the callbacks in flight.
+
+        Args:
+            timeout: Maximum seconds to wait for the callbacks in flight. Connections still busy after that are aborted.
+        """
+        server = self._server
+        if server is None:
+            return
+        self._closing = True
+        server.close()
+        for task in self._connections - self._busy:
+            task.cancel()
+        if self._connections:
+            _, pending = await asyncio.wait(list(self._connections), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        await server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._server = None
+        self._executor = None
+
+    def run(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **kwargs) -> None:
+        """Serve until SIGINT or SIGTERM, then shut down gracefully.
+
+        Args:
+            host: A host to bind
+            port: A port to bind
+            kwargs: Other arguments of `asyncio.start_server`
+        """
+        try:
+            asyncio.run(self._run(host, port, **kwargs))
+        except KeyboardInterrupt:
+            pass
+
+    async def dispatch(self, data: bytes) -> _Response:
+        """Dispatch a callback to the handler of its type.
+
+        Args:
+            data: A request body
+
+        Returns:
+            An HTTP status code and a response body
+        """
+        try:
+            obj = json.loads(data)
+            body = _BODY_TYPES[ReactiveType(obj['type'])].parse_obj(obj)
+        except (ValueError, KeyError, TypeError) as e:
+            return _error(HTTPStatus.BAD_REQUEST, str(e))
+
+        func = self._handler_func(body)
+        if func is None:
+            return _error(HTTPStatus.NOT_FOUND, f'There is no handler of {body.type.value}')
+        self.stats.handled += 1
+        try:
+            result = await self._call(func, body)
+        except Exception as e:
+            self.stats.failed += 1
+            return _error(HTTPStatus.INTERNAL_SERVER_ERROR, f'{type(e).__name__}: {e}')
+        if isinstance(result, BaseModel):
+            return int(HTTPStatus.OK), result.json(exclude_none=True).encode('utf-8')
+        if not result:
+            return _error(HTTPStatus.BAD_REQUEST, 'The handler declined the callback')
+        return int(HTTPStatus.OK), b'{}'
+
+    def _handler_func(self, body: BaseReactiveBody) -> Optional[Callable[[Any], Any]]:
+        if body.type == ReactiveType.SUBMIT_ACTION:
+            return self.action_handler.handle_submit if self.action_handler is not None else None
+        if self.modal_handler is None:
+            return None
+        if body.type == ReactiveType.REQUEST_MODAL:
+            return self.modal_handler.handle_request
+        return self.modal_handler.handle_submit
+
+    async def _call(self, func: Callable[[Any], Any], body: BaseReactiveBody) -> Any:
+        if asyncio.iscoroutinefunction(func):
+            return await func(body)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, body)
+
+    async def _run(self, host: str, port: int, **kwargs) -> None:
+        await self.start(host, port, **kwargs)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stop.set)
+            except (NotImplementedError, RuntimeError):  # Windows or not the main thread
+                pass
+        try:
+            await stop.wait()
+        finally:
+            await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            keep_alive = True
+            while keep_alive and not self._closing:
+                try:
+                    method, headers = await asyncio.wait_for(self._read_head(reader), self.timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except _HTTPError as e:
+                    await _write(writer, _error(e.status, str(e)), keep_alive=False)
+                    return
+                self._busy.add(task)
+                try:
+                    resp, keep_alive = await self._respond(reader, method, headers)
+                    keep_alive = keep_alive and not self._closing
+                    await _write(writer, resp, keep_alive=keep_alive)
+                finally:
+                    self._busy.discard(task)
+        except (asyncio.CancelledError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            self._connections.discard(task)
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[str, Dict[str, str]]:
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, 'The request header is too large')
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, _, version = lines[0].split(' ', 2)
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, value = line.split(':', 1)
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, 'The request is malformed')
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0' and connection != 'keep-alive':
+            headers['connection'] = 'close'
+        return method, headers
+
+    async def _respond(self, reader: asyncio.StreamReader, method: str, headers: Dict[str, str]) -> Tuple[_Response, bool]:
+        # Returns a response and whether the connection can be kept. The body is left unread if the connection is closed.
+        if method != 'POST':
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, 'Only POST is allowed'), False
+        if 'transfer-encoding' in headers or 'content-length' not in headers:
+            return _error(HTTPStatus.LENGTH_REQUIRED, 'The request should have Content-Length'), False
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            return _error(HTTPStatus.BAD_REQUEST, 'The Content-Length is invalid'), False
+        if length < 0 or length > self.max_body_size:
+            return _error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'The request body is too large'), False
+        if self._pending >= self.concurrency + self.queue_size:
+            self.stats.rejected += 1
+            return _error(HTTPStatus.SERVICE_UNAVAILABLE, 'The server is overloaded'), False
+
+        assert self._semaphore is not None
+        self._pending += 1
+        try:
+            data = await asyncio.wait_for(reader.readexactly(length), self.timeout)
+            async with self._semaphore:
+                resp = await self.dispatch(data)
+        finally:
+            self._pending -= 1
+        return resp, headers.get('connection', '').lower() != 'close'
+
+
+def _error(status: HTTPStatus, message: str) -> _Response:
+    return int(status), json.dumps({'error': message}).encode('utf-8')
+
+
+async def _write(writer: asyncio.StreamWriter, resp: _Response, *, keep_alive: bool) -> None:
+    status, body = resp
+    lines = [
+        f'HTTP/1.1 {status} {HTTPStatus(status).phrase}',
+        'Content-Type: application/json',
+        f'Content-Length: {len(body)}',
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        lines.append(f'Retry-After: {DEFAULT_RETRY_AFTER}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
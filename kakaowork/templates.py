@@ -0,0 +1,228 @@
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from kakaowork.blockkit import BlockKitBuilder, BlockKitPayload
+
+DEFAULT_SUFFIX = '.json'
+DEFAULT_WATCH_INTERVAL = 1.0
+
+
+class _TemplateEntry:
+    __slots__ = ('path', 'stamp', 'builder', 'payload', 'error')
+
+    def __init__(self, path: str, stamp: Tuple[int, int], builder: BlockKitBuilder) -> None:
+        self.path = path
+        self.stamp = stamp
+        self.builder = builder
+        self.payload: Optional[BlockKitPayload] = None
+        # The error of the latest version of the file which failed to load, kept until a version loads.
+        self.error: Optional[Exception] = None
+
+
+class TemplateRegistry:
+    """Keeps validated Block Kit builders loaded from a directory of JSON files.
+
+    A template is named by its path relative to the directory without the suffix, e.g. ``hr/welcome`` for
+    ``hr/welcome.json``. A file is loaded again only when its modification time or size changes. Lookups are safe from any
+    thread, and a watcher thread can pick up changes in the background instead of checking the file on each lookup.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     with open(os.path.join(directory, 'welcome.json'), 'w') as f:
+        ...         _ = f.write('{"type": "message", "text": "Welcome"}')
+        ...     registry = TemplateRegistry(directory)
+        ...     registry.payload('welcome').body(conversation_id=1)
+        b'{"conversation_id": 1, "text": "Welcome"}'
+    """
+    def __init__(self, directory: str, *, suffix: str = DEFAULT_SUFFIX, check_mtime: bool = True) -> None:
+        """Initialize the registry and load all templates in the directory.
+
+        Args:
+            directory: A directory of Block Kit JSON files
+            suffix: The suffix of template files
+            check_mtime: Whether to check the modification time of a file on each lookup. Not checked while watching.
+        """
+        self.directory = directory
+        self.suffix = suffix
+        self.check_mtime = check_mtime
+        self.errors: Dict[str, Exception] = {}
+        self._entries: Dict[str, _TemplateEntry] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh()
+
+    def __enter__(self) -> 'TemplateRegistry':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    @property
+    def watching(self) -> bool:
+        """Whether the watcher thread is running."""
+        return self._thread is not None
+
+    def get(self, name: str) -> BlockKitBuilder:
+        """Returns the builder of a template.
+
+        The builder is shared between callers, so it should be copied before being modified.
+
+        Args:
+            name: A template name
+
+        Returns:
+            A validated builder
+
+        Raises:
+            KeyError: If there is no such template.
+        """
+        return self._entry(name).builder
+
+    def payload(self, name: str) -> BlockKitPayload:
+        """Returns the frozen payload of a message template.
+
+        Args:
+            name: A template name
+
+        Returns:
+            A payload which is encoded once per version of the file
+
+        Raises:
+            KeyError: If there is no such template.
+            ValueError: If the template is not a message.
+        """
+        entry = self._entry(name)
+        payload = entry.payload
+        if payload is None:
+            payload = entry.payload = entry.builder.freeze()
+        return payload
+
+    def refresh(self) -> List[str]:
+        """Scan the directory, load new or changed files and drop removed ones.
+
+        A file which fails to load keeps its previous version, if any, and its error is kept in ``errors``.
+
+        Returns:
+            Names of templates which are loaded, changed or removed
+        """
+        with self._lock:
+            changed: List[str] = []
+            entries: Dict[str, _TemplateEntry] = {}
+            errors: Dict[str, Exception] = {}
+            for name, path in self._scan():
+                entry = self._entries.get(name)
+                try:
+                    stamp = self._stamp(path)
+                except OSError as e:
+                    errors[name] = e
+                else:
+                    if entry is None or entry.stamp != stamp:
+                        try:
+                            entry = self._load(path, stamp)
+                            changed.append(name)
+                        except Exception as e:
+                            errors[name] = e
+                            if entry is not None:
+                                self._fail(entry, stamp, e)
+                    elif entry.error is not None:
+                        errors[name] = entry.error
+                if entry is not None:
+                    entries[name] = entry
+            changed.extend(name for name in self._entries if name not in entries)
+            self._entries = entries
+            self.errors = errors
+            return changed
+
+    def start(self, interval: float = DEFAULT_WATCH_INTERVAL) -> None:
+        """Start a thread which refreshes the templates periodically.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval, ), name='kakaowork-templates', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the watcher thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.refresh()
+
+    def _entry(self, name: str) -> _TemplateEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            if name in self.errors:
+                raise KeyError(name) from self.errors[name]
+            raise KeyError(name)
+        if self.check_mtime and self._thread is None:
+            entry = self._check(name, entry)
+        return entry
+
+    def _check(self, name: str, entry: _TemplateEntry) -> _TemplateEntry:
+        try:
+            stamp = self._stamp(entry.path)
+        except FileNotFoundError:
+            return entry
+        if stamp == entry.stamp:
+            return entry
+        with self._lock:
+            current = self._entries.get(name, entry)
+            if current.stamp != stamp:
+                try:
+                    current = self._entries[name] = self._load(entry.path, stamp)
+                except Exception as e:
+                    self.errors[name] = e
+                    self._fail(current, stamp, e)
+                else:
+                    self.errors.pop(name, None)
+            return current
+
+    @staticmethod
+    def _fail(entry: _TemplateEntry, stamp: Tuple[int, int], error: Exception) -> None:
+        # Keeps the previous version and the error until the file changes again.
+        entry.stamp = stamp
+        entry.error = error
+
+    def _scan(self) -> Iterator[Tuple[str, str]]:
+        for root, dirs, files in os.walk(self.directory):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.endswith(self.suffix):
+                    path = os.path.join(root, filename)
+                    name = os.path.relpath(path, self.directory)[:-len(self.suffix)]
+                    yield name.replace(os.sep, '/'), path
+
+    @staticmethod
+    def _stamp(path: str) -> Tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _load(path: str, stamp: Tuple[int, int]) -> _TemplateEntry:
+        return _TemplateEntry(path, stamp, BlockKitBuilder.load(path))
@@ -0,0 +1,122 @@
+from datetime import datetime
+from functools import lru_cache
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.datetime_parse import parse_datetime
+
+from kakaowork.blockkit import Block, decode_block
+from kakaowork.utils import to_kst
+
+M = TypeVar('M', bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+Decoder = Callable[[Any], BaseModel]
+
+_decoders: Dict[type, Decoder] = {}
+
+
+def construct(model: Type[M], obj: Any) -> M:
+    """Build a model from trusted data without validation.
+
+    Decoders are compiled once per model from its fields. Nested models, enums and lists are converted, and timestamps become
+    KST datetimes like the validated models, but types are not checked or coerced.
+
+    Args:
+        model: A model class
+        obj: Decoded JSON data
+
+    Returns:
+        A model instance
+
+    Examples:
+        >>> from kakaowork.models import ConversationResponse
+        >>> resp = construct(ConversationResponse, {'success': True, 'conversation': {'id': '1', 'type': 'dm', 'users_count': 2}})
+        >>> resp.conversation.type
+        <ConversationType.DM: 'dm'>
+    """
+    decoder = _decoders.get(model)
+    if decoder is None:
+        decoder = _decoders[model] = _compile(model)
+    return decoder(obj)  # type: ignore
+
+
+def _compile(model: Type[BaseModel]) -> Decoder:
+    converters: List[Tuple[str, str, Optional[Converter]]] = [(field.alias, name, _field_converter(field)) for name, field in model.__fields__.items()]
+    defaults = {name: field.default for name, field in model.__fields__.items() if not field.required}
+    private = bool(model.__private_attributes__)
+    if any(not _is_immutable(value) for value in defaults.values()):
+        # Rare models which need default factories go through construct().
+        def build(values: Dict[str, Any]) -> BaseModel:
+            return model.construct(_fields_set=set(values), **values)
+    else:
+        def build(values: Dict[str, Any]) -> BaseModel:
+            instance = model.__new__(model)
+            object.__setattr__(instance, '__dict__', {**defaults, **values})
+            object.__setattr__(instance, '__fields_set__', set(values))
+            if private:
+                instance._init_private_attributes()
+            return instance
+
+    def decode(obj: Any) -> BaseModel:
+        if not isinstance(obj, dict):
+            return model.parse_obj(obj)
+        values: Dict[str, Any] = {}
+        for alias, name, convert in converters:
+            if alias in obj:
+                value = obj[alias]
+                values[name] = value if value is None or convert is None else convert(value)
+        return build(values)
+
+    return decode
+
+
+def _field_converter(field: ModelField) -> Optional[Converter]:
+    convert = _type_converter(field.type_)
+    if convert is None:
+        return None
+    if field.shape == SHAPE_SINGLETON:
+        return convert
+    if field.shape == SHAPE_LIST:
+        return lambda values: [convert(value) for value in values]  # type: ignore
+    return None
+
+
+def _type_converter(type_: Any) -> Optional[Converter]:
+    if not isinstance(type_, type):
+        return None
+    if issubclass(type_, datetime):
+        return _to_datetime
+    if issubclass(type_, Block):
+        return _to_block
+    if issubclass(type_, BaseModel):
+        return lambda value: construct(type_, value)
+    if issubclass(type_, Enum):
+        return type_
+    return None
+
+
+def _to_block(value: Any) -> Block:
+    return decode_block(value, trusted=True)
+
+
+def _is_immutable(value: Any) -> bool:
+    return value is None or isinstance(value, (bool, int, float, str, bytes, Enum))
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_to_kst(timestamp: int) -> datetime:
+    # Timestamps such as work times repeat across users, and datetimes are immutable.
+    return to_kst(timestamp)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, int):
+        return _timestamp_to_kst(value)
+    if isinstance(value, datetime):
+        return to_kst(value)
+    return parse_datetime(value)
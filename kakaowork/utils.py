@@ -1,10 +1,17 @@
+import asyncio
+import functools
 from shlex import shlex
-from datetime import datetime
-from typing import Union, Any, Dict
+from datetime import datetime, timedelta
+from typing import Union, Any, Callable, Dict, Iterable, List, TypeVar
 
 from pytz import utc
 
-from kakaowork.consts import KST, BOOL_STRS, TRUE_STRS
+from kakaowork.consts import KST, KST_FIXED, KST_FIXED_SINCE, BOOL_STRS, TRUE_STRS
+
+T = TypeVar('T')
+
+_KST_EPOCH = datetime(1970, 1, 1, 9, tzinfo=KST_FIXED)
+_KST_FIXED_SINCE = _KST_EPOCH + timedelta(seconds=KST_FIXED_SINCE)
 
 
 def is_bool(text: Union[str, bytes]) -> bool:
@@ -99,6 +106,8 @@ def text2bool(text: Union[str, bytes]) -> bool:
 def to_kst(timestamp: Union[int, datetime]) -> datetime:
     """Returns KST(Korea Standard Time) from timestamp.
 
+    Timestamps since 1989, when KST has no DST, use a fixed offset tzinfo. Older ones are converted by pytz.
+
     Args:
         timestamp: an unix timestamp or a datetime instance
 
@@ -107,19 +116,54 @@ def to_kst(timestamp: Union[int, datetime]) -> datetime:
 
     Raises:
         ValueError: If the 'timestamp' is not one of int or datetime type.
+
+    Examples:
+        >>> to_kst(1617889170).isoformat()
+        '2021-04-08T22:39:30+09:00'
     """
     if isinstance(timestamp, int):
+        if timestamp >= KST_FIXED_SINCE:
+            return _KST_EPOCH + timedelta(seconds=timestamp)
         return datetime.fromtimestamp(timestamp, tz=utc).astimezone(KST)
     elif isinstance(timestamp, datetime):
         # If the timestamp is naive then just replace tzinfo to KST
         # ref: https://docs.python.org/3/library/datetime.html#determining-if-an-object-is-aware-or-naive
         if timestamp.tzinfo is None or timestamp.tzinfo.utcoffset(timestamp) is None:
+            if timestamp >= _KST_FIXED_SINCE.replace(tzinfo=None):
+                return timestamp.replace(tzinfo=KST_FIXED)
             return KST.localize(timestamp)
+        elif timestamp >= _KST_FIXED_SINCE:
+            return timestamp.astimezone(KST_FIXED)
         else:
             return timestamp.astimezone(KST)
     raise ValueError('Unsupported timestamp type')
 
 
+def to_kst_many(timestamps: Iterable[int]) -> List[datetime]:
+    """Returns KST(Korea Standard Time) from unix timestamps in batch.
+
+    Repeated timestamps, like work times shared by users, are converted once.
+
+    Args:
+        timestamps: unix timestamps
+
+    Returns:
+        a list of KST timezone datetime instances
+
+    Examples:
+        >>> [dt.hour for dt in to_kst_many([1617889170, 1617889170, 1617892770])]
+        [22, 22, 23]
+    """
+    converted: Dict[int, datetime] = {}
+    results = []
+    for timestamp in timestamps:
+        dt = converted.get(timestamp)
+        if dt is None:
+            dt = converted[timestamp] = to_kst(timestamp)
+        results.append(dt)
+    return results
+
+
 def normalize_token(token: str) -> str:
     """Returns normalized token.
 
@@ -187,7 +231,7 @@ def json_default(value: Any) -> Any:
     from kakaowork.blockkit import Block
 
     if isinstance(value, Block):
-        return value.dict(exclude_none=True)
+        return value.to_dict()
     elif isinstance(value, datetime):
         return int(value.timestamp())
     raise TypeError('not JSON serializable')
@@ -207,3 +251,20 @@ def drop_none(value: Dict) -> Dict:
         {'key': 'value'}
     """
     return {k: v for k, v in value.items() if v is not None}
+
+
+async def run_in_executor(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking function in the default executor of the running event loop.
+
+    Args:
+        func: A blocking function such as a database call
+        args: Arguments of the function
+
+    Returns:
+        The return value of the function
+
+    Examples:
+        >>> asyncio.run(run_in_executor(sum, [1, 2]))
+        3
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
@@ -0,0 +1,174 @@
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from kakaowork.blockkit import BlockKitBuilder, BlockKitType
+from kakaowork.exceptions import KakaoworkError
+from kakaowork.preflight import Preflight, PreflightIssue, validation_issues
+
+DEFAULT_CHUNKSIZE = 4
+SUFFIXES = ('.json', '.jsonl')
+
+# Recipient fields of a request body which are not a part of the Block Kit.
+_RECIPIENT_FIELDS = frozenset(['conversation_id', 'email', 'key'])
+
+
+class BlockKitIssue(BaseModel):
+    """A problem of a Block Kit payload."""
+    line: Optional[int] = None
+    index: Optional[int] = None
+    loc: str = ''
+    message: str
+
+    def __str__(self) -> str:
+        where = ': '.join(str(part) for part in (self.line, self.loc) if part)
+        return f'{where}: {self.message}' if where else self.message
+
+
+class ValidationReport(BaseModel):
+    """The validation result of a file."""
+    path: str
+    payloads: int = 0
+    issues: List[BlockKitIssue] = []
+
+    @property
+    def success(self) -> bool:
+        """Whether all payloads in the file are valid."""
+        return not self.issues
+
+    def lines(self) -> Iterator[str]:
+        """Returns compact lines of the issues prefixed by the path, and by the index of the payload in a list."""
+        for issue in self.issues:
+            where = self.path if issue.index is None else f'{self.path}[{issue.index}]'
+            yield f'{where}:{issue}'
+
+
+def validate_blockkit(data: Any) -> List[BlockKitIssue]:
+    """Validate a Block Kit payload against the limits of blocks and messages.
+
+    A payload is the JSON of a `BlockKitBuilder`. Recipient fields of a request body such as ``conversation_id`` are allowed.
+    The limits are checked by `Preflight.issues`.
+
+    Args:
+        data: A decoded Block Kit payload
+
+    Returns:
+        Issues of the payload, empty if it is valid
+
+    Examples:
+        >>> [str(issue) for issue in validate_blockkit({'type': 'message', 'text': 'msg', 'blocks': [{'type': 'header', 'text': ''}]})]
+        ["blocks.0.text: The 'text' property should be exists"]
+    """
+    if not isinstance(data, dict):
+        return [BlockKitIssue(message='The payload should be an object')]
+    issues: List[BlockKitIssue] = []
+    blocks = data.get('blocks')
+    values = {name: value for name, value in data.items() if name != 'blocks' and name not in _RECIPIENT_FIELDS}
+    try:
+        builder: Optional[BlockKitBuilder] = BlockKitBuilder.from_dict(values)
+    except ValidationError as e:
+        builder = None
+        issues.extend(map(_issue, validation_issues(e)))
+    except (KakaoworkError, ValueError) as e:
+        builder = None
+        issues.append(BlockKitIssue(message=str(e)))
+
+    if blocks is not None and not isinstance(blocks, list):
+        issues.append(BlockKitIssue(loc='blocks', message='The blocks should be a list'))
+        blocks = None
+    text = builder.text if builder is not None and builder.type == BlockKitType.MESSAGE else None
+    issues.extend(map(_issue, Preflight.issues(text=text, blocks=blocks)))
+    return issues
+
+
+def validate_file(path: str) -> ValidationReport:
+    """Validate Block Kit payloads in a file.
+
+    A ``.jsonl`` file has a payload per line, and other files have a payload or a list of payloads. Issues of a JSONL file
+    carry the line number, and issues of a list carry the 0-based index of the payload.
+
+    Args:
+        path: A file path
+
+    Returns:
+        The report of the file
+    """
+    report = ValidationReport(path=path)
+    try:
+        for line, index, data, error in _payloads(path):
+            report.payloads += 1
+            for issue in ([BlockKitIssue(message=error)] if error else validate_blockkit(data)):
+                issue.line = line
+                issue.index = index
+                report.issues.append(issue)
+    except (OSError, ValueError) as e:
+        report.issues.append(BlockKitIssue(message=f'{type(e).__name__}: {e}'))
+    return report
+
+
+def validate_files(paths: Iterable[str], *, processes: Optional[int] = None, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[ValidationReport]:
+    """Validate files in a process pool.
+
+    Reports are yielded in the order of the paths, as soon as each one is ready.
+
+    Args:
+        paths: File paths. Directories are searched for JSON and JSONL files recursively.
+        processes: The number of worker processes. The number of CPUs if None, and no pool is used if 1.
+        chunksize: The number of files sent to a worker at once
+
+    Returns:
+        An iterator of reports
+    """
+    files = expand_paths(paths)
+    if processes == 1:
+        yield from map(validate_file, files)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        yield from executor.map(validate_file, files, chunksize=chunksize)
+
+
+def expand_paths(paths: Iterable[str]) -> Iterator[str]:
+    """Returns file paths, replacing directories with the JSON and JSONL files in them.
+
+    Args:
+        paths: File or directory paths
+
+    Returns:
+        An iterator of file paths
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.endswith(SUFFIXES):
+                    yield os.path.join(root, filename)
+
+
+def _payloads(path: str) -> Iterator[Tuple[Optional[int], Optional[int], Any, Optional[str]]]:
+    # Yields payloads with their line numbers and indexes, and errors of the lines which are not JSON.
+    with open(path, 'r') as f:
+        if path.endswith('.jsonl'):
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield lineno, None, json.loads(line), None
+                except ValueError as e:
+                    yield lineno, None, None, f'Invalid JSON: {e}'
+            return
+        data = json.load(f)
+    if isinstance(data, list):
+        for index, value in enumerate(data):
+            yield None, index, value, None
+    else:
+        yield None, None, data, None
+
+
+def _issue(issue: PreflightIssue) -> BlockKitIssue:
+    return BlockKitIssue(loc=issue.loc, message=issue.message)
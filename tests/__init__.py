@@ -1,5 +1,10 @@
 import asyncio
 
+import urllib3
+import aiosonic
+
+SUCCESS_JSON = '{"success": true, "error": null}'
+
 
 class Clock:
     def __init__(self):
@@ -25,3 +30,18 @@ def _async_return(value):
         return f
     else:
         return value
+
+
+def _response(body: str = SUCCESS_JSON) -> urllib3.HTTPResponse:
+    return urllib3.HTTPResponse(body=body, status=200, headers={'ratelimit-limit': '0'})
+
+
+def _http_response(body: str = SUCCESS_JSON) -> aiosonic.HttpResponse:
+    resp = aiosonic.HttpResponse()
+    resp.body = body.encode('utf-8')
+    resp.response_initial = {'version': 1.1, 'code': 200, 'reason': 'OK'}
+    return resp
+
+
+def _async_response(body: str = SUCCESS_JSON):
+    return _async_return(_http_response(body))
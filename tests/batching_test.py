@@ -0,0 +1,145 @@
+import json
+import threading
+from datetime import datetime
+
+import pytest
+import urllib3
+from pytz import utc
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.batching import BatcherStats, UsersBatcher, AsyncUsersBatcher
+from tests import _response, _async_response
+
+START = datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc)
+END = datetime(2021, 4, 8, 14, 39, 30, tzinfo=utc)
+
+
+class TestUsersBatcher:
+    def test_invalid_options(self):
+        client = Kakaowork(app_key='dummy')
+        with pytest.raises(ValueError):
+            UsersBatcher(client, window=-1.0)
+        with pytest.raises(ValueError):
+            UsersBatcher(client, max_batch=0)
+
+    def test_flush(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        with UsersBatcher(client, window=60.0) as batcher:
+            f1 = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+            f2 = batcher.set_work_time(user_id=2, work_start_time=START, work_end_time=END)
+            f3 = batcher.set_vacation_time(user_id=1, vacation_start_time=START, vacation_end_time=END)
+            req.assert_not_called()
+
+        assert req.call_count == 2
+        req.assert_any_call(
+            'POST',
+            'https://api.kakaowork.com/v1/batch/users.set_work_time',
+            body=(b'{"user_work_times": [{"user_id": 1, "work_start_time": 1617889170, "work_end_time": 1617892770}, '
+                  b'{"user_id": 2, "work_start_time": 1617889170, "work_end_time": 1617892770}]}'),
+        )
+        req.assert_any_call(
+            'POST',
+            'https://api.kakaowork.com/v1/batch/users.set_vacation_time',
+            body=b'{"user_vacation_times": [{"user_id": 1, "vacation_start_time": 1617889170, "vacation_end_time": 1617892770}]}',
+        )
+        assert f1.result() is f2.result()
+        assert f3.result().success is True
+        assert batcher.stats == BatcherStats(received=3, api_calls=2)
+        assert batcher.stats.saved_calls == 1
+
+    def test_last_update_wins(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        with UsersBatcher(client, window=60.0) as batcher:
+            f1 = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=START)
+            f2 = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+
+        req.assert_called_once()
+        items = json.loads(req.call_args.kwargs['body'])['user_work_times']
+        assert items == [{'user_id': 1, 'work_start_time': 1617889170, 'work_end_time': 1617892770}]
+        assert f1.result() is f2.result()
+
+    def test_max_batch(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        batcher = UsersBatcher(client, window=60.0, max_batch=2)
+        batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+        future = batcher.set_work_time(user_id=2, work_start_time=START, work_end_time=END)
+
+        assert future.done()
+        assert len(json.loads(req.call_args.kwargs['body'])['user_work_times']) == 2
+
+    def test_window(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        batcher = UsersBatcher(client, window=0.01)
+        future = batcher.set_vacation_time(user_id=1, vacation_start_time=START, vacation_end_time=END)
+        assert future.result(timeout=5).success is True
+
+    def test_order(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        entered, proceed = threading.Event(), threading.Event()
+        bodies = []
+
+        def _request(*args, **kwargs):
+            bodies.append(json.loads(kwargs['body'])['user_work_times'][0]['work_end_time'])
+            entered.set()
+            proceed.wait(5)
+            return _response()
+
+        mocker.patch('urllib3.PoolManager.request', side_effect=_request)
+        batcher = UsersBatcher(client, window=0)
+        thread = threading.Thread(target=batcher.set_work_time, kwargs={'user_id': 1, 'work_start_time': START, 'work_end_time': START})
+        thread.start()
+        assert entered.wait(5)
+
+        future = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+        assert not future.done()
+
+        proceed.set()
+        thread.join(5)
+        assert future.result(timeout=5).success is True
+        assert bodies == [1617889170, 1617892770]
+
+    def test_failure(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=urllib3.exceptions.HTTPError('boom'))
+
+        batcher = UsersBatcher(client, window=0)
+        future = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            future.result()
+
+
+class TestAsyncUsersBatcher:
+    @pytest.mark.asyncio
+    async def test_flush(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        async with AsyncUsersBatcher(client, window=60.0) as batcher:
+            f1 = batcher.set_work_time(user_id=1, work_start_time=START, work_end_time=END)
+            f2 = batcher.set_work_time(user_id=2, work_start_time=START, work_end_time=END)
+            req.assert_not_called()
+
+        assert (await f1) is (await f2)
+        assert req.call_count == 1
+        assert len(json.loads(req.call_args.kwargs['data'])['user_work_times']) == 2
+
+    @pytest.mark.asyncio
+    async def test_window_and_max_batch(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        batcher = AsyncUsersBatcher(client, window=0.01, max_batch=2)
+        futures = [batcher.set_vacation_time(user_id=i, vacation_start_time=START, vacation_end_time=END) for i in range(3)]
+        await futures[0]
+        await futures[2]
+        assert req.call_count == 2
+        assert batcher.stats.saved_calls == 1
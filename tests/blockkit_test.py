@@ -29,8 +29,15 @@ from kakaowork.blockkit import (
     SelectBlockOption,
     SelectBlock,
     BlockKitBuilder,
+    BlockKitPayload,
+    BlockKitTemplate,
+    Block,
+    register_block,
+    decode_block,
+    decode_blocks,
 )
 from kakaowork.exceptions import InvalidBlock, InvalidBlockType
+from kakaowork.utils import json_default
 
 
 class TestTextInlineColor:
@@ -119,6 +126,154 @@ class TestHeaderStyle:
         assert HeaderStyle('#####') is HeaderStyle.BLUE
 
 
+class TestBlock:
+    @pytest.mark.parametrize(
+        'block',
+        [
+            TextBlock(text='msg', inlines=[TextInline(type=TextInlineType.STYLED, text='msg', bold=True)]),
+            ButtonBlock(text='msg', action_type=ButtonActionType.SUBMIT_ACTION, value='1'),
+            DividerBlock(),
+            ActionBlock(elements=[ButtonBlock(text='msg'), ButtonBlock(text='msg', style=ButtonStyle.DANGER)]),
+            SectionBlock(content=TextBlock(text='msg'), accessory=ImageLinkBlock(url='http://localhost/image.png')),
+            SelectBlock(name='name', options=[SelectBlockOption(text='text', value='value')]),
+        ],
+    )
+    def test_to_dict(self, block):
+        assert block.to_dict() == block.dict(exclude_none=True)
+        assert str(block) == block.json(exclude_none=True)
+
+    def test_cache(self):
+        block = ButtonBlock(text='msg')
+        assert block.to_dict() is block.to_dict()
+        assert str(block) is str(block)
+
+        block.text = 'changed'
+        assert block.to_dict() == {'type': 'button', 'text': 'changed', 'style': 'default'}
+        assert str(block) == '{"type": "button", "text": "changed", "style": "default"}'
+        with pytest.raises(ValidationError):
+            block.text = ''
+        assert block.to_dict()['text'] == 'changed'
+
+        copied = block.copy(update={'text': 'copied'})
+        assert copied.to_dict()['text'] == 'copied'
+        assert block.to_dict()['text'] == 'changed'
+
+        excluded = block.copy(exclude={'style'})
+        assert excluded.to_dict() == excluded.dict(exclude_none=True) == {'type': 'button', 'text': 'changed'}
+        assert str(excluded) == '{"type": "button", "text": "changed"}'
+        assert json_default(excluded) == {'type': 'button', 'text': 'changed'}
+        included = block.copy(include={'type', 'text'})
+        assert included.to_dict() == {'type': 'button', 'text': 'changed'}
+        assert str(included) == '{"type": "button", "text": "changed"}'
+
+    def test_nested_cache(self):
+        block = ActionBlock(elements=[ButtonBlock(text='msg')])
+        assert block.to_dict()['elements'][0] is block.elements[0].to_dict()
+
+        block.elements[0].text = 'changed'
+        assert str(block) == '{"type": "action", "elements": [{"type": "button", "text": "changed", "style": "default"}]}'
+        block.elements.append(ButtonBlock(text='added'))
+        assert [element['text'] for element in block.to_dict()['elements']] == ['changed', 'added']
+
+        block = DescriptionBlock(term='term', content=TextBlock(text='msg'))
+        block.content.text = 'changed'
+        assert block.to_dict()['content'] == {'type': 'text', 'text': 'changed'}
+        assert block == DescriptionBlock(term='term', content=TextBlock(text='changed'))
+
+    def test_frozen(self):
+        block = ActionBlock(elements=[ButtonBlock(text='msg')])
+        frozen = block.frozen()
+        assert isinstance(frozen, ActionBlock)
+        assert frozen.frozen() is frozen
+        assert frozen == block and block == frozen
+        assert str(frozen) == str(block)
+        assert frozen.to_dict() == block.to_dict()
+        assert hash(frozen) == hash(ActionBlock(elements=[ButtonBlock(text='msg')]).frozen())
+        assert hash(frozen) != hash(ActionBlock(elements=[ButtonBlock(text='other')]).frozen())
+        assert len({frozen, block.frozen(), DividerBlock().frozen()}) == 2
+        with pytest.raises(TypeError):
+            hash(block)
+
+        with pytest.raises(TypeError):
+            frozen.elements = []
+        with pytest.raises(TypeError):
+            frozen.elements[0].text = 'changed'
+        with pytest.raises(AttributeError):
+            frozen.elements.append(ButtonBlock(text='msg'))  # type: ignore
+        block.elements[0].text = 'changed'
+        assert frozen.elements[0].text == 'msg'
+
+        copied = frozen.copy(update={'elements': [ButtonBlock(text='copied')]})
+        assert hash(copied) != hash(frozen)
+        with pytest.raises(TypeError):
+            copied.elements[0].text = 'changed'
+
+        button = ButtonBlock(text='msg').frozen()
+        hash(button)
+        excluded = button.copy(exclude={'style'})
+        assert str(excluded) == '{"type": "button", "text": "msg"}'
+        assert hash(excluded) != hash(button)
+        assert str(button.copy(include={'type', 'text'})) == '{"type": "button", "text": "msg"}'
+
+    def test_frozen_nested_models(self):
+        frozen = TextBlock(text='msg', inlines=[TextInline(type=TextInlineType.STYLED, text='msg')]).frozen()
+        assert isinstance(frozen.inlines[0], TextInline)
+        with pytest.raises(TypeError):
+            frozen.inlines[0].text = 'changed'
+        assert BlockKitPayload.encode(blocks=[frozen]).data == b'"blocks": [{"type": "text", "text": "msg", "inlines": [{"type": "styled", "text": "msg"}]}]'
+
+
+class TestDecodeBlocks:
+    blocks = [
+        {'type': 'header', 'text': 'msg', 'style': 'red'},
+        {'type': 'action', 'elements': [{'type': 'button', 'text': 'msg', 'value': '1'}]},
+        {'type': 'description', 'term': 'term', 'content': {'type': 'text', 'text': 'msg'}},
+    ]
+
+    @pytest.mark.parametrize('trusted', [False, True])
+    def test_decode_blocks(self, trusted):
+        blocks = decode_blocks(self.blocks, trusted=trusted)
+        assert blocks == [
+            HeaderBlock(text='msg', style=HeaderStyle.RED),
+            ActionBlock(elements=[ButtonBlock(text='msg', value='1')]),
+            DescriptionBlock(term='term', content=TextBlock(text='msg')),
+        ]
+        assert blocks[1].elements[0].style is ButtonStyle.DEFAULT
+        assert blocks[2].content.type is BlockType.TEXT
+        assert [block.to_dict() for block in blocks] == [block.dict(exclude_none=True) for block in blocks]
+
+    def test_trusted(self):
+        value = {'type': 'button', 'text': 'm' * 30}
+        with pytest.raises(ValidationError):
+            decode_block(value)
+        assert decode_block(value, trusted=True).text == 'm' * 30
+
+    def test_invalid(self):
+        divider = DividerBlock()
+        assert decode_block(divider) is divider
+        with pytest.raises(ValueError):
+            decode_block({'text': 'msg'})
+        with pytest.raises(InvalidBlockType):
+            decode_blocks([{'type': '####'}])
+        with pytest.raises(InvalidBlockType):
+            BlockType.block_cls('####')
+        assert BlockType.block_cls(BlockType.TEXT) is BlockType.block_cls('text') is TextBlock
+
+    def test_register_block(self, mocker: MockerFixture):
+        mocker.patch.dict('kakaowork.blockkit._block_classes')
+
+        @register_block('custom')
+        class CustomBlock(Block):
+            type: str = 'custom'  # type: ignore
+            name: str
+
+        assert BlockType.block_cls('custom') is CustomBlock
+        assert decode_blocks([{'type': 'custom', 'name': 'msg'}]) == [CustomBlock(name='msg')]
+        assert str(decode_block({'type': 'custom', 'name': 'msg'}, trusted=True)) == '{"type": "custom", "name": "msg"}'
+        with pytest.raises(TypeError):
+            register_block('custom', TextInline)  # type: ignore
+
+
 class TestTextBlock:
     def test_properties(self):
         text = 'hello'
@@ -859,3 +1014,161 @@ class TestBlockKitBuilder:
         assert builder.type == BlockKitType.MESSAGE
         assert builder.text == 'hello'
         assert builder.blocks == [TextBlock(text='block', markdown=False)]
+
+    def test_from_dict(self):
+        data = {
+            'type': 'modal',
+            'title': 'title',
+            'accept': 'accept',
+            'decline': 'decline',
+            'value': 'value',
+            'blocks': [{'type': 'label', 'text': 'msg', 'markdown': False}, DividerBlock()],
+        }
+        builder = BlockKitBuilder.from_dict(data)
+        assert builder == BlockKitBuilder(type=BlockKitType.MODAL, title='title', accept='accept', decline='decline', value='value',
+                                          blocks=[LabelBlock(text='msg', markdown=False), DividerBlock()])
+        assert builder.__fields_set__ == set(data)
+        assert BlockKitBuilder.from_json(json.dumps({'type': 'message', 'text': 'msg'})).blocks == []
+
+    @pytest.mark.parametrize(
+        'data,raises',
+        [
+            ({'text': 'msg'}, pytest.raises(ValidationError)),
+            ({'type': 'modal', 'text': 'msg'}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'unknown': 'msg'}, pytest.raises(ValueError)),
+            ({'type': 'message', 'blocks': [{'text': 'msg'}]}, pytest.raises(InvalidBlock)),
+            ({'type': 'message', 'blocks': [{'type': 'text', 'text': ''}]}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'blocks': 1}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'blocks': 'abc'}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'blocks': b'abc'}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'blocks': {'type': 'divider'}}, pytest.raises(ValidationError)),
+            ({'type': 'message', 'blocks': [1, None]}, pytest.raises(InvalidBlock)),
+            ({'type': 'message', 'blocks': ['divider']}, pytest.raises(InvalidBlock)),
+        ],
+    )
+    def test_from_dict_with_invalid_data(self, data, raises):
+        with raises:
+            BlockKitBuilder.from_dict(data)
+
+    def test_freeze(self):
+        builder = BlockKitBuilder(type=BlockKitType.MESSAGE, text='msg', blocks=[DividerBlock()])
+        payload = builder.freeze()
+        assert payload == BlockKitPayload.encode(text='msg', blocks=[DividerBlock()])
+        assert BlockKitBuilder(type=BlockKitType.MESSAGE, text='msg').freeze().data == b'"text": "msg"'
+
+        builder.blocks.append(DividerBlock())
+        assert payload.data == b'"text": "msg", "blocks": [{"type": "divider"}]'
+
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MODAL, title='title').freeze()
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MESSAGE, text='m' * 2001).freeze()
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MESSAGE, blocks=[DividerBlock()] * 51).freeze()
+        action = ActionBlock(elements=[ButtonBlock(text='msg')])
+        action.elements.extend([ButtonBlock(text='msg')] * 3)
+        with pytest.raises(ValueError, match="blocks.0.elements: The 'elements' property's length"):
+            BlockKitBuilder(type=BlockKitType.MESSAGE, blocks=[action]).freeze()
+
+
+class TestBlockKitPayload:
+    def test_encode(self):
+        payload = BlockKitPayload.encode(text='msg', blocks=[DividerBlock()])
+        assert payload.data == b'"text": "msg", "blocks": [{"type": "divider"}]'
+        assert payload == BlockKitPayload.encode(text='msg', blocks=[DividerBlock()])
+        assert hash(payload) == hash(payload.data)
+        assert BlockKitPayload.encode().data == b''
+
+        with pytest.raises(AttributeError):
+            payload.data = b''  # type: ignore
+
+    def test_body(self):
+        payload = BlockKitPayload.encode(text='msg')
+        assert payload.body(conversation_id=1) == b'{"conversation_id": 1, "text": "msg"}'
+        assert payload.body(email='nobody@localhost', key=None) == b'{"email": "nobody@localhost", "text": "msg"}'
+        assert payload.body() == b'{"text": "msg"}'
+        assert BlockKitPayload.encode().body(conversation_id=1) == b'{"conversation_id": 1}'
+
+
+class TestBlockKitTemplate:
+    builder = BlockKitBuilder(
+        type=BlockKitType.MESSAGE,
+        text='Hello {name}',
+        blocks=[
+            HeaderBlock(text='{title}'),
+            TextBlock(text='{name} has {count} {{items}}'),
+            DividerBlock(),
+            ButtonBlock(text='Open', value='{url}'),
+        ],
+    )
+
+    def test_compile(self):
+        template = self.builder.compile()
+        assert isinstance(template, BlockKitTemplate)
+        assert template.placeholders == frozenset(['name', 'title', 'count', 'url'])
+
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MODAL, title='{title}').compile()
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MESSAGE, text='Hello {}').compile()
+        with pytest.raises(ValueError):
+            BlockKitBuilder(type=BlockKitType.MESSAGE, blocks=[DividerBlock()] * 51).compile()
+
+    def test_render(self):
+        template = self.builder.compile()
+        payload = template.render(name='Kim "K"', title='News', count=3, url='')
+
+        assert isinstance(payload, BlockKitPayload)
+        assert json.loads(payload.body(conversation_id=1)) == {
+            'conversation_id': 1,
+            'text': 'Hello Kim "K"',
+            'blocks': [
+                {'type': 'header', 'text': 'News', 'style': 'blue'},
+                {'type': 'text', 'text': 'Kim "K" has 3 {items}'},
+                {'type': 'divider'},
+                {'type': 'button', 'text': 'Open', 'style': 'default', 'value': ''},
+            ],
+        }
+        assert payload == BlockKitPayload.encode(
+            text='Hello Kim "K"',
+            blocks=[
+                HeaderBlock(text='News'),
+                TextBlock(text='Kim "K" has 3 {items}'),
+                DividerBlock(),
+                ButtonBlock(text='Open', value=''),
+            ],
+        )
+
+    def test_render_with_braces(self):
+        builder = BlockKitBuilder(
+            type=BlockKitType.MESSAGE,
+            text='use {{braces}}',
+            blocks=[
+                TextBlock(text='{name} uses {{braces}}'),
+                TextBlock(text='{"key": 1'),
+                TextBlock(text='}'),
+            ],
+        )
+        template = builder.compile()
+        assert template.placeholders == frozenset(['name'])
+        assert json.loads(template.render(name='Kim').body(conversation_id=1)) == {
+            'conversation_id': 1,
+            'text': 'use {braces}',
+            'blocks': [
+                {'type': 'text', 'text': 'Kim uses {braces}'},
+                {'type': 'text', 'text': '{"key": 1'},
+                {'type': 'text', 'text': '}'},
+            ],
+        }
+
+    def test_render_with_invalid_values(self):
+        template = self.builder.compile()
+
+        with pytest.raises(ValueError):
+            template.render(name='Kim', title='News')
+        with pytest.raises(InvalidBlock):
+            template.render(name='Kim', title='x' * (HeaderBlock._max_len_text + 1), count=1, url='')
+        with pytest.raises(InvalidBlock):
+            template.render(name='Kim', title='', count=1, url='')
+        with pytest.raises(InvalidBlock, match="The 'text' property's length should be less than or equal to 2000"):
+            template.render(name='x' * BlockKitBuilder._max_len_text, title='News', count=1, url='')
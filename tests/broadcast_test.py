@@ -0,0 +1,180 @@
+import json
+from typing import List
+
+import pytest
+import urllib3
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.blockkit import TextBlock, BlockKitType, BlockKitBuilder
+from kakaowork.models import ErrorCode
+from kakaowork.broadcast import RecipientType, BroadcastResult, BroadcastProgress, Broadcaster, AsyncBroadcaster
+from tests import _async_return, _response, _async_response
+
+SUCCESS_JSON = ('{"success": true, "error": null, '
+                '"message": {"id": "1", "text": "msg", "user_id": "1", "conversation_id": 1, "send_time": 1617889170, "update_time": 1617889170}}')
+CONVERSATION_JSON = '{"success": true, "error": null, "conversation": {"id": "7", "type": "dm", "users_count": 2}}'
+NOT_FOUND_JSON = '{"success": false, "error": {"code": "conversation_not_found", "message": "not found"}}'
+TOO_MANY_JSON = '{"success": false, "error": {"code": "too_many_requests", "message": "slow down"}}'
+
+
+class TestBroadcastResult:
+    def test_recipient(self):
+        assert BroadcastResult(recipient='123', success=True, attempts=1, latency=0.0).recipient == '123'
+        assert BroadcastResult(recipient=123, success=True, attempts=1, latency=0.0).recipient == 123
+
+
+class TestBroadcastProgress:
+    def test_eta(self):
+        assert BroadcastProgress().eta is None
+        assert BroadcastProgress(total=10).eta is None
+        assert BroadcastProgress(total=10, done=5, elapsed=2.0).eta == 2.0
+        assert BroadcastProgress(total=10, done=10, elapsed=2.0).eta == 0.0
+        assert BroadcastProgress(total=10, done=5, elapsed=2.0).rate == 2.5
+
+
+class TestBroadcaster:
+    def test_invalid_options(self):
+        client = Kakaowork(app_key='dummy')
+        with pytest.raises(ValueError):
+            Broadcaster(client, concurrency=0)
+        with pytest.raises(ValueError):
+            Broadcaster(client, max_attempts=0)
+
+    def test_send_to_conversations(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(SUCCESS_JSON))
+        progresses: List[BroadcastProgress] = []
+
+        results = list(client.messages.broadcast([1, 2, 3], text='msg', blocks=[TextBlock(text='hello')], concurrency=2, on_progress=progresses.append))
+
+        assert sorted(r.recipient for r in results) == [1, 2, 3]
+        assert all(r.success and r.attempts == 1 and r.latency >= 0.0 for r in results)
+        bodies = sorted((json.loads(call.kwargs['body']) for call in req.call_args_list), key=lambda body: body['conversation_id'])
+        assert bodies[0] == {'conversation_id': 1, 'text': 'msg', 'blocks': [{'type': 'text', 'text': 'hello'}]}
+        assert [p.done for p in progresses] == [1, 2, 3]
+        assert progresses[-1].succeeded == 3 and progresses[-1].eta == 0.0
+
+    def test_send_frozen_payload(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(SUCCESS_JSON))
+        payload = BlockKitBuilder(type=BlockKitType.MESSAGE, text='msg', blocks=[TextBlock(text='hello')]).freeze()
+
+        assert all(r.success for r in client.messages.broadcast(['nobody@localhost'], text=payload, recipient_type=RecipientType.EMAIL))
+        req.assert_called_once_with(
+            'POST',
+            'https://api.kakaowork.com/v1/messages.send_by_email',
+            body=b'{"email": "nobody@localhost", "text": "msg", "blocks": [{"type": "text", "text": "hello"}]}',
+        )
+        with pytest.raises(ValueError):
+            list(client.messages.broadcast([1], text=payload, blocks=[]))
+
+    def test_send_to_users(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=[_response(CONVERSATION_JSON), _response(SUCCESS_JSON)])
+
+        results = list(client.messages.broadcast([10], text='msg', recipient_type=RecipientType.USER))
+
+        assert results[0].success is True
+        assert req.call_args_list[0].args[1] == 'https://api.kakaowork.com/v1/conversations.open'
+        assert req.call_args_list[1].kwargs['body'] == b'{"conversation_id": 7, "text": "msg"}'
+
+    def test_send_by_emails_with_failure(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(NOT_FOUND_JSON))
+
+        results = list(client.messages.broadcast(['nobody@localhost'], text='msg', recipient_type=RecipientType.EMAIL))
+
+        req.assert_called_once_with('POST', 'https://api.kakaowork.com/v1/messages.send_by_email', body=b'{"email": "nobody@localhost", "text": "msg"}')
+        assert results[0].success is False
+        assert results[0].error_code == ErrorCode.CONVERSATION_NOT_FOUND
+        assert results[0].attempts == 1
+
+    def test_send_with_retries(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mock_sleep = mocker.patch('time.sleep', return_value=None)
+        mocker.patch('urllib3.PoolManager.request', side_effect=[_response(TOO_MANY_JSON), _response(TOO_MANY_JSON), _response(SUCCESS_JSON)])
+
+        results = list(Broadcaster(client, max_attempts=3, backoff=1.0).send([1], text='msg'))
+
+        assert results[0].success is True
+        assert results[0].attempts == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    def test_send_with_exception(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('time.sleep', return_value=None)
+        mocker.patch('urllib3.PoolManager.request', side_effect=urllib3.exceptions.HTTPError('boom'))
+
+        results = list(Broadcaster(client, max_attempts=2).send([1], text='msg'))
+
+        assert results[0].success is False
+        assert results[0].error_code is None
+        assert results[0].error_message == 'boom'
+        assert results[0].attempts == 2
+
+    def test_send_with_non_retryable_exception(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mock_sleep = mocker.patch('time.sleep', return_value=None)
+        req = mocker.patch('urllib3.PoolManager.request')
+
+        results = list(Broadcaster(client, max_attempts=3).send(['abc'], text='msg', recipient_type=RecipientType.USER))
+
+        assert results[0].success is False
+        assert results[0].attempts == 1
+        assert results[0].error_message == "invalid literal for int() with base 10: 'abc'"
+        mock_sleep.assert_not_called()
+        req.assert_not_called()
+
+    def test_send_with_non_retryable_error_code(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mock_sleep = mocker.patch('time.sleep', return_value=None)
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(NOT_FOUND_JSON))
+
+        results = list(Broadcaster(client, max_attempts=3).send([1], text='msg'))
+
+        assert results[0].error_code == ErrorCode.CONVERSATION_NOT_FOUND
+        assert results[0].attempts == 1
+        assert req.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+class TestAsyncBroadcaster:
+    @pytest.mark.asyncio
+    async def test_send_to_conversations(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response(SUCCESS_JSON))
+
+        results = [r async for r in client.messages.broadcast([1, 2, 3], text='msg', concurrency=2)]
+
+        assert sorted(r.recipient for r in results) == [1, 2, 3]
+        assert all(r.success for r in results)
+        assert sorted(call.kwargs['data'] for call in req.call_args_list)[0] == b'{"conversation_id": 1, "text": "msg"}'
+
+    @pytest.mark.asyncio
+    async def test_send_to_users(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch(
+            'aiosonic.HTTPClient.request',
+            side_effect=[_async_response(CONVERSATION_JSON), _async_response(NOT_FOUND_JSON)],
+        )
+
+        results = [r async for r in client.messages.broadcast([10], text='msg', recipient_type=RecipientType.USER)]
+
+        assert results[0].success is False
+        assert results[0].error_code == ErrorCode.CONVERSATION_NOT_FOUND
+        assert req.call_args_list[1].kwargs['data'] == b'{"conversation_id": 7, "text": "msg"}'
+
+    @pytest.mark.asyncio
+    async def test_send_with_exceptions(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        mock_sleep = mocker.patch('asyncio.sleep', side_effect=lambda *args: _async_return(None))
+        mocker.patch('aiosonic.HTTPClient.request', side_effect=ConnectionResetError('reset'))
+
+        results = [r async for r in AsyncBroadcaster(client, max_attempts=2).send([1], text='msg')]
+        assert (results[0].success, results[0].attempts) == (False, 2)
+        assert mock_sleep.call_count == 1
+
+        results = [r async for r in AsyncBroadcaster(client, max_attempts=2).send(['abc'], text='msg', recipient_type=RecipientType.USER)]
+        assert (results[0].success, results[0].attempts) == (False, 1)
+        assert mock_sleep.call_count == 1
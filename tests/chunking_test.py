@@ -0,0 +1,145 @@
+import json
+from datetime import datetime
+
+import pytest
+import urllib3
+from pytz import utc
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.models import ErrorCode, WorkTimeField
+from kakaowork.chunking import ChunkLimit, ChunkedResponse, Chunker, AsyncChunker, split_chunks
+from tests import SUCCESS_JSON, _response, _async_response
+
+FAILURE_JSON = '{"success": false, "error": {"code": "invalid_parameter", "message": "invalid"}}'
+CONVERSATION_JSON = '{"success": true, "error": null, "conversation": {"id": "1", "type": "group", "users_count": 2}}'
+START = datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc)
+END = datetime(2021, 4, 8, 14, 39, 30, tzinfo=utc)
+
+
+class TestSplitChunks:
+    def test_max_items(self):
+        assert split_chunks(list(range(5)), ChunkLimit(max_items=2)) == [[0, 1], [2, 3], [4]]
+        assert split_chunks([], ChunkLimit()) == []
+
+    def test_max_bytes(self):
+        items = [WorkTimeField(user_id=i, work_start_time=START, work_end_time=END) for i in range(3)]
+        chunks = split_chunks(items, ChunkLimit(max_bytes=200), overhead=32)
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    def test_oversized_item(self):
+        assert split_chunks([123456], ChunkLimit(max_bytes=1)) == [[123456]]
+
+
+class TestChunkedResponse:
+    def test_plain(self):
+        resp = ChunkedResponse(success=True, chunks=[{'index': 0, 'size': 1, 'success': True}])
+        assert resp.plain() == 'OK (1 chunks)'
+        assert resp.failed_chunks == []
+
+
+class TestChunker:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            Chunker(Kakaowork(app_key='dummy'), concurrency=0)
+
+    def test_set_work_time(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        chunker = Chunker(client, limits={'batch.users.set_work_time': ChunkLimit(max_items=2)})
+        resp = chunker.set_work_time([WorkTimeField(user_id=i, work_start_time=START, work_end_time=END) for i in range(5)])
+
+        assert resp.success is True
+        assert [chunk.size for chunk in resp.chunks] == [2, 2, 1]
+        assert req.call_count == 3
+        user_ids = sorted(item['user_id'] for call in req.call_args_list for item in json.loads(call.kwargs['body'])['user_work_times'])
+        assert user_ids == list(range(5))
+
+    def test_default_limit(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        resp = Chunker(client).kick(conversation_id=1, user_ids=list(range(150)))
+
+        assert [chunk.size for chunk in resp.chunks] == [100, 50]
+        assert req.call_count == 2
+
+    def test_failures(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+
+        def _request(method, url, body):
+            if json.loads(body)['user_ids'] == [3]:
+                raise urllib3.exceptions.HTTPError('boom')
+            if json.loads(body)['user_ids'] == [2]:
+                return _response(FAILURE_JSON)
+            return _response()
+
+        mocker.patch('urllib3.PoolManager.request', side_effect=_request)
+
+        chunker = Chunker(client, limits={'conversations.kick': ChunkLimit(max_items=1)})
+        resp = chunker.kick(conversation_id=1, user_ids=[1, 2, 3])
+
+        assert resp.success is False
+        assert resp.error is not None
+        assert resp.error.code == ErrorCode.INVALID_PARAMETER
+        assert [(chunk.index, chunk.error and chunk.error.code) for chunk in resp.failed_chunks] == [(1, ErrorCode.INVALID_PARAMETER), (2, ErrorCode.UNKNOWN)]
+
+    def test_open(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch(
+            'urllib3.PoolManager.request',
+            side_effect=lambda method, url, body: _response(CONVERSATION_JSON if url.endswith('open') else SUCCESS_JSON),
+        )
+
+        chunker = Chunker(client, limits={'conversations.open': ChunkLimit(max_items=2), 'conversations.invite': ChunkLimit(max_items=2)})
+        resp = chunker.open(user_ids=[1, 2, 3, 4, 5])
+
+        assert resp.success is True
+        assert resp.conversation is not None
+        assert resp.conversation.id == '1'
+        req.assert_any_call('POST', 'https://api.kakaowork.com/v1/conversations.open', body=b'{"user_ids": [1, 2]}')
+        req.assert_any_call('POST', 'https://api.kakaowork.com/v1/conversations/1/invite', body=b'{"user_ids": [3, 4]}')
+        req.assert_any_call('POST', 'https://api.kakaowork.com/v1/conversations/1/invite', body=b'{"user_ids": [5]}')
+
+    def test_open_failure(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(FAILURE_JSON))
+
+        chunker = Chunker(client, limits={'conversations.open': ChunkLimit(max_items=2)})
+        resp = chunker.open(user_ids=[1, 2, 3])
+
+        assert resp.success is False
+        assert resp.conversation is None
+        assert req.call_count == 1
+
+
+class TestAsyncChunker:
+    @pytest.mark.asyncio
+    async def test_reset_vacation_time(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        chunker = AsyncChunker(client, concurrency=2, limits={'batch.users.reset_vacation_time': ChunkLimit(max_items=2)})
+        resp = await chunker.reset_vacation_time(user_ids=[1, 2, 3])
+
+        assert resp.success is True
+        assert len(resp.chunks) == 2
+        assert req.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_open(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch(
+            'aiosonic.HTTPClient.request',
+            side_effect=lambda *args, **kwargs: _async_response(CONVERSATION_JSON if kwargs['url'].endswith('open') else FAILURE_JSON),
+        )
+
+        chunker = AsyncChunker(client, limits={'conversations.open': ChunkLimit(max_items=2)})
+        resp = await chunker.open(user_ids=[1, 2, 3])
+
+        assert resp.success is False
+        assert resp.conversation is not None
+        assert resp.conversation.id == '1'
+        assert [chunk.index for chunk in resp.failed_chunks] == [1]
+        assert req.call_count == 2
@@ -8,6 +8,7 @@ import aiosonic
 from pytz import utc
 from pytest_mock import MockerFixture
 
+from kakaowork.blockkit import DividerBlock, BlockKitPayload
 from kakaowork.client import (Kakaowork, AsyncKakaowork)
 from kakaowork.models import (
     ProfileNameFormat,
@@ -28,6 +29,8 @@ from kakaowork.models import (
 from kakaowork.utils import to_kst
 from tests import _async_return
 
+PAYLOAD = BlockKitPayload.encode(text='msg', blocks=[DividerBlock()])
+
 
 class TestKakaowork:
     def test_properties(self):
@@ -396,6 +399,7 @@ class TestKakaoworkMessages:
         [
             (dict(conversation_id=1, text='msg'), b'{"conversation_id": 1, "text": "msg"}'),
             (dict(conversation_id=1, text='msg', blocks=[]), b'{"conversation_id": 1, "text": "msg", "blocks": []}'),
+            (dict(conversation_id=1, text=PAYLOAD), b'{"conversation_id": 1, "text": "msg", "blocks": [{"type": "divider"}]}'),
         ],
     )
     def test_send(self, kwargs, body, mocker: MockerFixture):
@@ -425,6 +429,8 @@ class TestKakaoworkMessages:
             (dict(text='msg', email='nobody@email.com', blocks=[]), b'{"email": "nobody@email.com", "text": "msg", "blocks": []}', does_not_raise()),
             (dict(text='msg', key='mykey'), b'{"key": "mykey", "text": "msg"}', does_not_raise()),
             (dict(text='msg', key='mykey', blocks=[]), b'{"key": "mykey", "text": "msg", "blocks": []}', does_not_raise()),
+            (dict(text=PAYLOAD, key='mykey'), b'{"key": "mykey", "text": "msg", "blocks": [{"type": "divider"}]}', does_not_raise()),
+            (dict(text=PAYLOAD, key='mykey', blocks=[]), b'', pytest.raises(ValueError)),
         ],
     )
     def test_send_by(self, kwargs, body, raises, mocker: MockerFixture):
@@ -456,6 +462,7 @@ class TestKakaoworkMessages:
         [
             (dict(text='msg', email='nobody@email.com'), b'{"email": "nobody@email.com", "text": "msg"}'),
             (dict(text='msg', email='nobody@email.com', blocks=[]), b'{"email": "nobody@email.com", "text": "msg", "blocks": []}'),
+            (dict(text=PAYLOAD, email='nobody@email.com'), b'{"email": "nobody@email.com", "text": "msg", "blocks": [{"type": "divider"}]}'),
         ],
     )
     def test_send_by_email(self, kwargs, body, mocker: MockerFixture):
@@ -1094,6 +1101,7 @@ class TestAsyncKakaoworkMessages:
         [
             (dict(conversation_id=1, text='msg'), b'{"conversation_id": 1, "text": "msg"}'),
             (dict(conversation_id=1, text='msg', blocks=[]), b'{"conversation_id": 1, "text": "msg", "blocks": []}'),
+            (dict(conversation_id=1, text=PAYLOAD), b'{"conversation_id": 1, "text": "msg", "blocks": [{"type": "divider"}]}'),
         ],
     )
     async def test_send(self, kwargs, data, mocker: MockerFixture):
@@ -1124,6 +1132,8 @@ class TestAsyncKakaoworkMessages:
             (dict(text='msg', email='nobody@email.com', blocks=[]), b'{"email": "nobody@email.com", "text": "msg", "blocks": []}', does_not_raise()),
             (dict(text='msg', key='mykey'), b'{"key": "mykey", "text": "msg"}', does_not_raise()),
             (dict(text='msg', key='mykey', blocks=[]), b'{"key": "mykey", "text": "msg", "blocks": []}', does_not_raise()),
+            (dict(text=PAYLOAD, key='mykey'), b'{"key": "mykey", "text": "msg", "blocks": [{"type": "divider"}]}', does_not_raise()),
+            (dict(text=PAYLOAD, key='mykey', blocks=[]), b'', pytest.raises(ValueError)),
         ],
     )
     async def test_send_by(self, kwargs, data, raises, mocker: MockerFixture):
@@ -1156,6 +1166,7 @@ class TestAsyncKakaoworkMessages:
         [
             (dict(text='msg', email='nobody@email.com'), b'{"email": "nobody@email.com", "text": "msg"}'),
             (dict(text='msg', email='nobody@email.com', blocks=[]), b'{"email": "nobody@email.com", "text": "msg", "blocks": []}'),
+            (dict(text=PAYLOAD, email='nobody@email.com'), b'{"email": "nobody@email.com", "text": "msg", "blocks": [{"type": "divider"}]}'),
         ],
     )
     async def test_send_by_email(self, kwargs, data, mocker: MockerFixture):
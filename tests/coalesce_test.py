@@ -0,0 +1,176 @@
+import json
+import asyncio
+import threading
+from typing import Set
+
+import pytest
+import urllib3
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.blockkit import DividerBlock
+from kakaowork.coalesce import CoalescerStats, MessageCoalescer, AsyncMessageCoalescer
+from tests import _response, _http_response, _async_response
+
+
+class TestCoalescerStats:
+    def test_saved_calls(self):
+        assert CoalescerStats(received=10, api_calls=3).saved_calls == 7
+
+
+class TestMessageCoalescer:
+    def test_invalid_options(self):
+        client = Kakaowork(app_key='dummy')
+        with pytest.raises(ValueError):
+            MessageCoalescer(client, window=-1.0)
+        with pytest.raises(ValueError):
+            MessageCoalescer(client, max_messages=0)
+
+    def test_flush(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+        flushed = []
+
+        with MessageCoalescer(client, window=60.0, on_flush=lambda cid, count, resp: flushed.append((cid, count, resp.success))) as coalescer:
+            f1 = coalescer.send(conversation_id=1, text='a')
+            f2 = coalescer.send(conversation_id=1, text='b', blocks=[DividerBlock()])
+            f3 = coalescer.send(conversation_id=2, text='c')
+            req.assert_not_called()
+
+            coalescer.flush(1)
+            req.assert_called_once_with(
+                'POST',
+                'https://api.kakaowork.com/v1/messages.send',
+                body=b'{"conversation_id": 1, "text": "a\\nb", "blocks": [{"type": "divider"}]}',
+            )
+            assert f1.result() is f2.result()
+            assert not f3.done()
+
+        assert f3.result().success is True
+        assert flushed == [(1, 2, True), (2, 1, True)]
+        assert coalescer.stats == CoalescerStats(received=3, api_calls=2)
+        assert coalescer.stats.saved_calls == 1
+
+    def test_max_messages(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        coalescer = MessageCoalescer(client, window=60.0, max_messages=2)
+        coalescer.send(conversation_id=1, text='a')
+        future = coalescer.send(conversation_id=1, text='b')
+
+        assert future.done()
+        assert json.loads(req.call_args.kwargs['body'])['text'] == 'a\nb'
+
+    def test_limits(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        coalescer = MessageCoalescer(client, window=60.0, max_text_len=3, max_blocks=1)
+        coalescer.send(conversation_id=1, text='a')
+        coalescer.send(conversation_id=1, text='bc')
+        assert json.loads(req.call_args.kwargs['body']) == {'conversation_id': 1, 'text': 'a'}
+
+        coalescer.send(conversation_id=1, text='d', blocks=[DividerBlock()])
+        assert json.loads(req.call_args.kwargs['body']) == {'conversation_id': 1, 'text': 'bc'}
+        coalescer.close()
+        assert coalescer.stats.api_calls == 3
+
+    def test_window(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response())
+
+        coalescer = MessageCoalescer(client, window=0.01)
+        future = coalescer.send(conversation_id=1, text='a')
+        assert future.result(timeout=5).success is True
+
+    def test_order(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        entered, proceed = threading.Event(), threading.Event()
+        texts = []
+
+        def _request(*args, **kwargs):
+            texts.append(json.loads(kwargs['body'])['text'])
+            entered.set()
+            proceed.wait(5)
+            return _response()
+
+        mocker.patch('urllib3.PoolManager.request', side_effect=_request)
+        coalescer = MessageCoalescer(client, window=0)
+        thread = threading.Thread(target=coalescer.send, kwargs={'conversation_id': 1, 'text': 'a'})
+        thread.start()
+        assert entered.wait(5)
+
+        future = coalescer.send(conversation_id=1, text='b')
+        assert not future.done()
+        assert texts == ['a']
+
+        proceed.set()
+        thread.join(5)
+        assert future.result(timeout=5).success is True
+        assert texts == ['a', 'b']
+        assert coalescer._queues == {}
+
+    def test_failure(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=urllib3.exceptions.HTTPError('boom'))
+
+        coalescer = MessageCoalescer(client, window=0)
+        future = coalescer.send(conversation_id=1, text='a')
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            future.result()
+        assert coalescer.stats.failed_calls == 1
+
+
+class TestAsyncMessageCoalescer:
+    @pytest.mark.asyncio
+    async def test_flush(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        async with AsyncMessageCoalescer(client, window=60.0) as coalescer:
+            f1 = coalescer.send(conversation_id=1, text='a')
+            f2 = coalescer.send(conversation_id=1, text='b')
+            req.assert_not_called()
+
+        assert (await f1).success is True
+        assert (await f2) is (await f1)
+        assert req.call_args.kwargs['data'] == b'{"conversation_id": 1, "text": "a\\nb"}'
+        assert coalescer.stats == CoalescerStats(received=2, api_calls=1)
+
+    @pytest.mark.asyncio
+    async def test_window_and_max_messages(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        coalescer = AsyncMessageCoalescer(client, window=0.01, max_messages=2)
+        futures = [coalescer.send(conversation_id=1, text=text) for text in 'abc']
+        await futures[0]
+        assert req.call_args.kwargs['data'] == b'{"conversation_id": 1, "text": "a\\nb"}'
+        await futures[2]
+        assert req.call_args.kwargs['data'] == b'{"conversation_id": 1, "text": "c"}'
+        assert coalescer.stats.saved_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_order(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        texts = []
+        in_flight: Set[int] = set()
+
+        async def _request(*args, **kwargs):
+            data = json.loads(kwargs['data'])
+            assert data['conversation_id'] not in in_flight
+            in_flight.add(data['conversation_id'])
+            texts.append(data['text'])
+            await asyncio.sleep(0.01 if len(texts) == 1 else 0)
+            in_flight.remove(data['conversation_id'])
+            return _http_response()
+
+        mocker.patch('aiosonic.HTTPClient.request', side_effect=_request)
+        async with AsyncMessageCoalescer(client, window=0) as coalescer:
+            futures = [coalescer.send(conversation_id=1, text=text) for text in 'abc']
+            futures.append(coalescer.send(conversation_id=2, text='d'))
+
+        assert all(resp.success for resp in await asyncio.gather(*futures))
+        assert [text for text in texts if text != 'd'] == ['a', 'b', 'c']
+        assert coalescer._queues == {}
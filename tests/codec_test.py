@@ -0,0 +1,88 @@
+import json
+from datetime import datetime
+
+import pytest
+import urllib3
+from pytz import utc
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.blockkit import TextBlock, DividerBlock
+from kakaowork.models import BaseResponse, ErrorCode
+from kakaowork.codec import Codec, OrjsonCodec, get_codec
+
+PAYLOAD = {
+    'conversation_id': 1,
+    'text': '안녕하세요',
+    'blocks': [TextBlock(text='msg'), DividerBlock()],
+    'sent_at': datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc),
+}
+EXPECTED = {
+    'conversation_id': 1,
+    'text': '안녕하세요',
+    'blocks': [{'type': 'text', 'text': 'msg'}, {'type': 'divider'}],
+    'sent_at': 1617889170,
+}
+ERROR_JSON = b'{"success": false, "error": {"code": "invalid_parameter", "message": "invalid"}}'
+
+
+class TestCodec:
+    def test_encode(self):
+        assert json.loads(Codec().encode(PAYLOAD)) == EXPECTED
+        with pytest.raises(TypeError):
+            Codec().encode({'value': object()})
+
+    def test_parse(self):
+        resp = Codec().parse(BaseResponse, ERROR_JSON)
+        assert resp.error.code == ErrorCode.INVALID_PARAMETER
+        with pytest.raises(ValidationError):
+            Codec().parse(BaseResponse, b'<html>')
+
+
+class TestOrjsonCodec:
+    @pytest.fixture(autouse=True)
+    def orjson(self):
+        return pytest.importorskip('orjson')
+
+    def test_encode(self):
+        data = OrjsonCodec().encode(PAYLOAD)
+        assert isinstance(data, bytes)
+        assert json.loads(data) == EXPECTED
+        assert OrjsonCodec().encode({'user_ids': [1, 2]}) == b'{"user_ids":[1,2]}'
+        with pytest.raises(TypeError):
+            OrjsonCodec().encode({'value': object()})
+
+    def test_decode(self):
+        assert OrjsonCodec().decode(Codec().encode(PAYLOAD)) == EXPECTED
+        assert OrjsonCodec().parse(BaseResponse, ERROR_JSON) == Codec().parse(BaseResponse, ERROR_JSON)
+        with pytest.raises(ValidationError):
+            OrjsonCodec().parse(BaseResponse, b'<html>')
+
+    def test_client(self, mocker: MockerFixture):
+        req = mocker.patch(
+            'urllib3.PoolManager.request',
+            return_value=urllib3.HTTPResponse(body=b'{"success": true, "error": null}', status=200, headers={'ratelimit-limit': '0'}),
+        )
+
+        client = Kakaowork(app_key='dummy', codec='orjson')
+        assert client.messages.send(conversation_id=1, text='msg').success is True
+        req.assert_called_once_with('POST', 'https://api.kakaowork.com/v1/messages.send', body=b'{"conversation_id":1,"text":"msg"}')
+
+
+class TestGetCodec:
+    def test_get_codec(self):
+        codec = Codec()
+        assert get_codec(codec) is codec
+        assert type(get_codec()) is Codec
+        assert get_codec('auto').name in ('json', 'orjson')
+        assert type(Kakaowork(app_key='dummy').codec) is Codec
+        assert type(AsyncKakaowork(app_key='dummy').codec) is Codec
+        with pytest.raises(ValueError):
+            get_codec('unknown')
+
+    def test_missing_orjson(self, mocker: MockerFixture):
+        mocker.patch('kakaowork.codec.orjson', None)
+        assert get_codec('auto').name == 'json'
+        with pytest.raises(ImportError):
+            get_codec('orjson')
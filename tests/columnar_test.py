@@ -0,0 +1,97 @@
+import io
+import json
+
+import pytest
+
+from kakaowork.codec import Codec
+from kakaowork.models import UserField, UserListResponse, ConversationField, DepartmentField
+from kakaowork.columnar import ColumnarAccumulator
+
+PAGE = {
+    'success': True,
+    'cursor': 'next',
+    'users': [{
+        'id': '1',
+        'space_id': '1',
+        'name': 'kim',
+        'tels': ['02-000-0000'],
+        'work_start_time': 1617889170,
+    }, {
+        'id': '2',
+        'space_id': '1',
+        'name': 'lee',
+    }],
+}
+COLUMNS = ['id', 'name', 'tels', 'work_start_time']
+EXPECTED = {
+    'id': ['1', '2'],
+    'name': ['kim', 'lee'],
+    'tels': [['02-000-0000'], None],
+    'work_start_time': [1617889170, None],
+}
+
+
+class TestColumnarAccumulator:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ColumnarAccumulator(UserListResponse)
+        with pytest.raises(ValueError):
+            ColumnarAccumulator(UserField, columns=['id', 'unknown'])
+        assert ColumnarAccumulator(ConversationField).columns == list(ConversationField.__fields__)
+
+    @pytest.mark.parametrize('page', [
+        PAGE,
+        json.dumps(PAGE).encode('utf-8'),
+        json.dumps(PAGE),
+        UserListResponse.parse_obj(PAGE),
+        Codec(lazy=True).parse(UserListResponse, json.dumps(PAGE).encode('utf-8')),
+    ])
+    def test_append(self, page):
+        acc = ColumnarAccumulator(UserField, columns=COLUMNS)
+        assert acc.append(page) == 'next'
+        assert len(acc) == 2
+        assert acc.to_dict() == EXPECTED
+
+    def test_lazy_not_materialized(self):
+        resp = Codec(lazy=True).parse(UserListResponse, json.dumps(PAGE).encode('utf-8'))
+        ColumnarAccumulator(UserField).append(resp)
+        assert 'users' not in resp.__dict__
+
+    def test_pages(self):
+        acc = ColumnarAccumulator(DepartmentField, columns=['id'])
+        assert acc.append({'departments': [{'id': '1'}]}) is None
+        acc.extend(iter([{'id': '2'}]))
+        assert acc.to_dict() == {'id': ['1', '2']}
+        acc.clear()
+        assert len(acc) == 0
+
+    def test_to_csv(self, tmp_path):
+        acc = ColumnarAccumulator(UserField, columns=COLUMNS)
+        acc.append(PAGE)
+        f = io.StringIO()
+        acc.to_csv(f)
+        assert f.getvalue().splitlines() == [
+            'id,name,tels,work_start_time',
+            '1,kim,"[""02-000-0000""]",1617889170',
+            '2,lee,,',
+        ]
+        path = tmp_path / 'users.csv'
+        acc.to_csv(str(path))
+        assert path.read_bytes().decode('utf-8') == f.getvalue()
+
+    def test_to_numpy(self):
+        np = pytest.importorskip('numpy')
+        acc = ColumnarAccumulator(UserField, columns=['id', 'work_start_time'])
+        acc.append({'users': [{'id': '1', 'work_start_time': 1}, {'id': '2', 'work_start_time': 2}]})
+        arrays = acc.to_numpy()
+        assert arrays['work_start_time'].dtype == np.int64
+        assert arrays['id'].dtype == object
+
+    def test_to_parquet(self, tmp_path):
+        pq = pytest.importorskip('pyarrow.parquet')
+        acc = ColumnarAccumulator(UserField, columns=COLUMNS)
+        acc.append(PAGE)
+        assert acc.to_arrow().num_rows == 2
+        path = str(tmp_path / 'users.parquet')
+        acc.to_parquet(path)
+        assert pq.read_table(path).to_pydict() == EXPECTED
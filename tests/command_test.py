@@ -41,6 +41,7 @@ from kakaowork.command import (
     departments,
     spaces,
     bots,
+    validate,
 )
 from kakaowork.utils import to_kst
 
@@ -365,3 +366,27 @@ class TestBotsCommand:
         mocker.patch('kakaowork.client.Kakaowork.Bots.info', return_value=bot_response)
         res = cli_runner.invoke(bots, args)
         assert res.exit_code == exit_code
+
+
+class TestValidateCommand:
+    def test_validate(self, cli_runner_isolated: CliRunner):
+        with open('valid.json', 'w') as f:
+            f.write('{"type": "message", "text": "msg", "blocks": [{"type": "divider"}]}')
+        with open('invalid.jsonl', 'w') as f:
+            f.write('{"type": "message", "blocks": [{"type": "header", "text": ""}]}\n')
+
+        res = cli_runner_isolated.invoke(validate, ['-p', '1', 'valid.json'])
+        assert res.exit_code == 0
+        assert res.output == 'valid.json: OK (1 payloads)\n1 passed, 0 failed\n'
+
+        res = cli_runner_isolated.invoke(validate, ['-p', '1', '--quiet', 'valid.json', 'invalid.jsonl'])
+        assert res.exit_code == 1
+        assert res.output == "invalid.jsonl:1: blocks.0.text: The 'text' property should be exists\n1 passed, 1 failed\n"
+
+        assert cli_runner_isolated.invoke(validate, ['missing.json']).exit_code == 2
+
+    def test_no_app_key(self, cli_runner_isolated: CliRunner, monkeypatch):
+        monkeypatch.delenv('KAKAOWORK_APP_KEY', raising=False)
+        with open('valid.json', 'w') as f:
+            f.write('{"type": "message", "text": "msg"}')
+        assert cli_runner_isolated.invoke(cli, ['validate', '-p', '1', 'valid.json']).exit_code == 0
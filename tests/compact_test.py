@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from pytz import utc
+
+from kakaowork.models import UserField, UserListResponse
+from kakaowork.compact import CompactUser, UserDirectory
+
+USER = {
+    'id': '1',
+    'space_id': '1234',
+    'name': 'kim',
+    'display_name': 'kim',
+    'identifications': [{
+        'type': 'email',
+        'value': 'kim@localhost'
+    }],
+    'department': 'Engineering',
+    'position': 'Staff',
+    'tels': [],
+    'mobiles': ['010-0000-0000'],
+    'work_start_time': 1617889170,
+    'work_end_time': 1617892770,
+}
+
+
+class TestCompactUser:
+    def test_from_dict(self):
+        user = CompactUser.from_dict(USER)
+        assert user.identifications == (('email', 'kim@localhost'), )
+        assert user.tels == ()
+        assert user.mobiles == ('010-0000-0000', )
+        assert user.work_start_time == 1617889170
+        assert user.vacation_start_time is None
+        assert user.to_dict() == USER
+        assert not hasattr(user, '__dict__')
+
+    def test_field_round_trip(self):
+        field = UserField(**USER)
+        user = CompactUser.from_field(field)
+        assert user == CompactUser.from_dict(USER)
+        assert hash(user) == hash(CompactUser.from_dict(USER))
+        assert user.to_field() == field
+        assert user != CompactUser(id='2', space_id='1234', name='lee')
+        assert repr(user) == "CompactUser(id='1', name='kim')"
+
+    def test_timestamps(self):
+        user = CompactUser(id='1', space_id='1', name='kim', work_start_time=datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc), work_end_time=0)
+        assert user.work_start_time == 1617889170
+        assert user.work_end_time is None
+
+    def test_interning(self):
+        first = CompactUser.from_dict({**USER, 'department': ''.join('Engineering')})
+        second = CompactUser.from_dict({**USER, 'department': ''.join('Engineering')})
+        assert first.department is second.department
+
+
+class TestUserDirectory:
+    def test_update(self):
+        directory = UserDirectory()
+        directory.update(UserListResponse(users=[UserField(**USER)]))
+        directory.update([{**USER, 'id': '2'}, CompactUser(id='3', space_id='1234', name='lee')])
+
+        assert len(directory) == 3
+        assert '2' in directory
+        assert [user.id for user in directory] == ['1', '2', '3']
+        assert directory.get('4') is None
+        assert directory.get_field('1') == UserField(**USER)
+        assert directory.get_field('4') is None
+
+        directory.remove('1')
+        directory.remove('1')
+        assert [field.id for field in directory.to_fields()] == ['2', '3']
@@ -0,0 +1,111 @@
+import json
+import time
+import asyncio
+import threading
+
+import pytest
+import urllib3
+import aiosonic
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.dispatch import Dispatcher, AsyncDispatcher
+from tests import _response, _http_response, _async_response
+
+
+class TestDispatcher:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            Dispatcher(Kakaowork(app_key='dummy'), concurrency=0)
+
+    def test_shard(self):
+        dispatcher = Dispatcher(Kakaowork(app_key='dummy'), concurrency=4)
+        assert dispatcher.shard(1) == dispatcher.shard(5) == 1
+        assert dispatcher.shard(2) == 2
+
+    def test_order(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        sent = []
+
+        def _request(method, url, body):
+            payload = json.loads(body)
+            time.sleep(0.001 * (payload['conversation_id'] % 3))
+            sent.append((payload['conversation_id'], payload['text']))
+            return _response()
+
+        mocker.patch('urllib3.PoolManager.request', side_effect=_request)
+
+        with Dispatcher(client, concurrency=3) as dispatcher:
+            futures = [dispatcher.send(conversation_id=cid, text=str(i)) for i in range(10) for cid in (1, 2, 3)]
+
+        assert all(future.result().success for future in futures)
+        for cid in (1, 2, 3):
+            assert [text for each, text in sent if each == cid] == [str(i) for i in range(10)]
+
+    def test_parallel(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _request(*args, **kwargs):
+            barrier.wait()
+            return _response()
+
+        mocker.patch('urllib3.PoolManager.request', side_effect=_request)
+
+        with Dispatcher(client, concurrency=2) as dispatcher:
+            f1 = dispatcher.send(conversation_id=1, text='a')
+            f2 = dispatcher.send(conversation_id=2, text='b')
+
+        assert f1.result().success and f2.result().success
+
+    def test_failure_and_closed(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=[urllib3.exceptions.HTTPError('boom'), _response()])
+
+        dispatcher = Dispatcher(client, concurrency=1)
+        f1 = dispatcher.send(conversation_id=1, text='a')
+        f2 = dispatcher.send(conversation_id=1, text='b')
+        dispatcher.close()
+
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            f1.result()
+        assert f2.result().success is True
+        with pytest.raises(RuntimeError):
+            dispatcher.send(conversation_id=1, text='c')
+
+
+class TestAsyncDispatcher:
+    @pytest.mark.asyncio
+    async def test_order(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        sent = []
+
+        async def _request(*args, **kwargs):
+            payload = json.loads(kwargs['data'])
+            await asyncio.sleep(0.001 * (payload['conversation_id'] % 3))
+            sent.append((payload['conversation_id'], payload['text']))
+            return _http_response()
+
+        mocker.patch('aiosonic.HTTPClient.request', side_effect=_request)
+
+        async with AsyncDispatcher(client, concurrency=3) as dispatcher:
+            futures = [dispatcher.send(conversation_id=cid, text=str(i)) for i in range(10) for cid in (1, 2, 3)]
+
+        assert all(future.result().success for future in futures)
+        for cid in (1, 2, 3):
+            assert [text for each, text in sent if each == cid] == [str(i) for i in range(10)]
+        with pytest.raises(RuntimeError):
+            dispatcher.send(conversation_id=1, text='c')
+
+    @pytest.mark.asyncio
+    async def test_failure(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        mocker.patch('aiosonic.HTTPClient.request', side_effect=[aiosonic.exceptions.RequestTimeout(), _async_response()])
+
+        async with AsyncDispatcher(client, concurrency=1) as dispatcher:
+            f1 = dispatcher.send(conversation_id=1, text='a')
+            f2 = dispatcher.send(conversation_id=1, text='b')
+
+        with pytest.raises(aiosonic.exceptions.RequestTimeout):
+            await f1
+        assert (await f2).success is True
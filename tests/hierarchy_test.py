@@ -0,0 +1,75 @@
+from kakaowork.hierarchy import DepartmentTree
+from kakaowork.models import DepartmentField, DepartmentListResponse
+
+
+def _department(id: str, parent_id: str, *, users_ids=None, leader_ids=None) -> DepartmentField:
+    return DepartmentField(
+        id=id,
+        ids_path=id,
+        parent_id=parent_id,
+        space_id='1',
+        name=f'dep{id}',
+        code=f'code{id}',
+        user_count=len(users_ids or []),
+        users_ids=users_ids,
+        leader_ids=leader_ids,
+    )
+
+
+class TestDepartmentTree:
+    departments = [
+        _department('1', '', users_ids=[1], leader_ids=[1]),
+        _department('2', '1', users_ids=[2, 3], leader_ids=[2]),
+        _department('3', '1', users_ids=[4]),
+        _department('4', '2', users_ids=[5, 6], leader_ids=[5, 1]),
+    ]
+
+    def test_subtree(self):
+        tree = DepartmentTree(self.departments)
+        assert len(tree) == 4
+        assert '4' in tree
+        assert [d.id for d in tree.subtree('1')] == ['1', '2', '3', '4']
+        assert [d.id for d in tree.subtree('2')] == ['2', '4']
+        assert tree.subtree('unknown') == []
+        assert [d.id for d in tree.children('1')] == ['2', '3']
+        assert [d.id for d in tree.roots()] == ['1']
+
+    def test_ancestors(self):
+        tree = DepartmentTree(self.departments)
+        assert [d.id for d in tree.ancestors('4')] == ['2', '1']
+        assert tree.ancestors('1') == []
+        assert tree.ancestors('unknown') == []
+
+    def test_user_ids(self):
+        tree = DepartmentTree(self.departments)
+        assert tree.user_ids('1') == {1, 2, 3, 4, 5, 6}
+        assert tree.user_ids('2') == {2, 3, 5, 6}
+        assert tree.user_ids('unknown') == set()
+
+    def test_leader_ids(self):
+        tree = DepartmentTree(self.departments)
+        assert tree.leader_ids('4') == [5, 1, 2]
+        assert tree.leader_ids('3') == [1]
+        assert tree.leader_ids('unknown') == []
+
+    def test_update_incrementally(self):
+        tree = DepartmentTree()
+        tree.update(DepartmentListResponse(success=True, departments=self.departments[:2]))
+        tree.update(DepartmentListResponse(success=True, departments=self.departments[2:]))
+        assert [d.id for d in tree.subtree('1')] == ['1', '2', '3', '4']
+
+        # Move the department '4' under the department '3'
+        tree.update([_department('4', '3', users_ids=[7])])
+        assert [d.id for d in tree.subtree('2')] == ['2']
+        assert [d.id for d in tree.subtree('3')] == ['3', '4']
+        assert tree.user_ids('3') == {4, 7}
+
+    def test_remove(self):
+        tree = DepartmentTree(self.departments)
+        tree.remove('2')
+        assert '2' not in tree
+        assert [d.id for d in tree.subtree('1')] == ['1', '3']
+        assert sorted(d.id for d in tree.roots()) == ['1', '4']
+
+        tree.clear()
+        assert len(tree) == 0
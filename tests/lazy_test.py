@@ -0,0 +1,95 @@
+import copy
+import pickle
+
+import pytest
+import urllib3
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork
+from kakaowork.codec import Codec
+from kakaowork.models import ErrorCode, BaseResponse, MessageResponse
+from kakaowork.lazy import lazy_response, raw_json
+
+MESSAGE = {
+    'success': True,
+    'message': {
+        'id': '1',
+        'text': 'msg',
+        'user_id': '1',
+        'conversation_id': 1,
+        'send_time': 1617889170,
+        'update_time': 1617889170,
+        'blocks': [{
+            'type': 'divider'
+        }],
+    },
+}
+
+
+class TestLazyResponse:
+    def test_parse_on_access(self, mocker: MockerFixture):
+        parse = mocker.Mock(side_effect=lambda model, obj: model.parse_obj(obj))
+
+        resp = lazy_response(MessageResponse, MESSAGE, parse, b'raw')
+        assert isinstance(resp, MessageResponse)
+        assert resp.success is True
+        assert resp.error is None
+        assert raw_json(resp) == b'raw'
+        parse.assert_not_called()
+
+        assert resp.message is not None and resp.message.blocks is not None
+        assert resp.message.id == '1'
+        assert resp.message.blocks[0].type == 'divider'
+        assert resp.message is resp.message
+        parse.assert_called_once()
+
+    def test_compatible(self):
+        resp = lazy_response(MessageResponse, MESSAGE, lambda model, obj: model.parse_obj(obj))
+        validated = MessageResponse.parse_obj(MESSAGE)
+        assert resp == validated
+        assert resp.dict() == validated.dict()
+        assert resp.json() == validated.json()
+        assert repr(resp) == repr(validated)
+        assert resp.plain() == validated.plain()
+        assert type(pickle.loads(pickle.dumps(resp))) is MessageResponse
+        assert copy.copy(resp) == validated
+        assert resp.copy() == validated
+        with pytest.raises(AttributeError):
+            resp.unknown
+
+    def test_error(self):
+        resp = lazy_response(BaseResponse, {'success': False, 'error': {'code': 'invalid_parameter', 'message': 'invalid'}}, None)
+        assert resp.error.code == ErrorCode.INVALID_PARAMETER
+        assert resp.plain() == BaseResponse(success=False, error={'code': 'invalid_parameter', 'message': 'invalid'}).plain()
+
+        with pytest.raises(ValidationError):
+            lazy_response(BaseResponse, {'success': 'maybe'}, None)
+
+
+class TestLazyCodec:
+    def test_parse(self):
+        codec = Codec(lazy=True)
+        resp = codec.parse(MessageResponse, b'{"success": true, "message": {"id": "1"}}')
+        assert resp.success is True
+        assert raw_json(resp) == b'{"success": true, "message": {"id": "1"}}'
+        with pytest.raises(ValidationError):
+            resp.message
+        with pytest.raises(ValidationError):
+            resp.message
+
+    def test_trusted(self):
+        codec = Codec(lazy=True, trusted=True)
+        resp = codec.parse(MessageResponse, b'{"success": true, "message": {"id": "1"}}')
+        assert resp.message.id == '1'
+
+    def test_client(self, mocker: MockerFixture):
+        mocker.patch(
+            'urllib3.PoolManager.request',
+            return_value=urllib3.HTTPResponse(body=b'{"success": true, "error": null}', status=200, headers={'ratelimit-limit': '0'}),
+        )
+
+        client = Kakaowork(app_key='dummy', lazy=True)
+        resp = client.messages.send(conversation_id=1, text='msg')
+        assert resp.success is True
+        assert resp.message is None
@@ -0,0 +1,187 @@
+import time
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.outbox import OutboxStatus, Outbox, OutboxWorker, AsyncOutboxWorker
+from tests import SUCCESS_JSON, Clock, _response, _async_response
+
+TOO_MANY_JSON = '{"success": false, "error": {"code": "too_many_requests", "message": "slow down"}}'
+NOT_FOUND_JSON = '{"success": false, "error": {"code": "conversation_not_found", "message": "not found"}}'
+
+
+@pytest.fixture(scope='function')
+def outbox(timer: Clock):
+    timer.tick(1000.0)
+    with Outbox(':memory:', backoff=10.0, max_attempts=2) as outbox:
+        outbox._timer = timer
+        yield outbox
+
+
+class TestOutbox:
+    def test_enqueue(self, outbox: Outbox):
+        assert outbox.send(conversation_id=1, text='msg', dedupe_key='a') == 1
+        assert outbox.send(conversation_id=1, text='msg', dedupe_key='a') is None
+        assert outbox.send_by(text='msg', key='mykey') == 3
+        assert outbox.send_by_email('nobody@localhost', text='msg') == 4
+        assert outbox.enqueue_many([('send', b'{}', 'b'), ('send', b'{}', 'a')]) == [5, None]
+        assert outbox.stats() == {'pending': 4, 'inflight': 0, 'sent': 0, 'failed': 0}
+
+        with pytest.raises(ValueError):
+            outbox.send_by(text='msg')
+
+    def test_claim_and_ack(self, outbox: Outbox, timer: Clock):
+        outbox.send(conversation_id=1, text='msg')
+        outbox.send(conversation_id=2, text='msg', send_at=timer() + 10.0)
+
+        messages = outbox.claim(10)
+        assert len(messages) == 1
+        assert messages[0].endpoint == 'send'
+        assert messages[0].body == b'{"conversation_id": 1, "text": "msg"}'
+        assert messages[0].attempts == 1
+        assert outbox.claim(10) == []
+        assert outbox.next_available_at() == timer() + 10.0
+
+        outbox.ack(messages[0])
+        assert outbox.stats()['sent'] == 1
+
+        timer.tick(10.0)
+        assert [m.body for m in outbox.claim(10)] == [b'{"conversation_id": 2, "text": "msg"}']
+
+    def test_expired_lease(self, outbox: Outbox, timer: Clock):
+        outbox.send(conversation_id=1, text='msg')
+        first = outbox.claim()
+        assert outbox.claim() == []
+
+        timer.tick(outbox.lease_timeout)
+        second = outbox.claim()
+        assert second[0].id == first[0].id
+        assert second[0].attempts == 2
+
+    def test_claim_ids(self, outbox: Outbox, timer: Clock):
+        outbox.send(conversation_id=1, text='msg')
+        outbox.send(conversation_id=2, text='msg', send_at=timer() + 10.0)
+        outbox.send(conversation_id=3, text='msg', send_at=timer() + 20.0)
+        assert outbox.available_until(timer() + 15.0) == [(1, timer()), (2, timer() + 10.0)]
+
+        assert [m.id for m in outbox.claim_ids([1, 2])] == [1]
+        assert outbox.claim_ids([1]) == []
+        timer.tick(10.0)
+        assert [m.id for m in outbox.claim_ids([2, 3])] == [2]
+
+    def test_nack(self, outbox: Outbox, timer: Clock):
+        outbox.send(conversation_id=1, text='msg')
+
+        outbox.nack(outbox.claim()[0], error_code='too_many_requests')
+        assert outbox.stats()['pending'] == 1
+        assert outbox.claim() == []
+
+        timer.tick(10.0)
+        outbox.nack(outbox.claim()[0], error_code='too_many_requests')
+        assert outbox.stats()['failed'] == 1
+
+        assert outbox.retry_failed() == 1
+        outbox.nack(outbox.claim()[0], error_code='conversation_not_found', retryable=False)
+        assert outbox.stats()['failed'] == 1
+
+    def test_purge(self, outbox: Outbox, timer: Clock):
+        outbox.send(conversation_id=1, text='msg')
+        outbox.ack(outbox.claim()[0])
+        timer.tick(1.0)
+        assert outbox.purge() == 1
+        assert outbox.stats() == {status.value: 0 for status in OutboxStatus}
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / 'outbox.db')
+        with Outbox(path) as outbox:
+            outbox.send(conversation_id=1, text='msg')
+            outbox.claim()
+
+        with Outbox(path, lease_timeout=0.0) as outbox:
+            assert outbox.stats()['inflight'] == 1
+            outbox._timer = lambda: 1e12
+            assert len(outbox.claim()) == 1
+
+
+class TestOutboxWorker:
+    def test_drain(self, outbox: Outbox, timer: Clock, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=[_response(SUCCESS_JSON), _response(TOO_MANY_JSON), _response(NOT_FOUND_JSON)])
+        outbox.send(conversation_id=1, text='msg')
+        outbox.send_by_email('nobody@localhost', text='msg')
+
+        worker = OutboxWorker(outbox, client)
+        assert worker.drain() == 1
+        req.assert_any_call('POST', 'https://api.kakaowork.com/v1/messages.send', body=b'{"conversation_id": 1, "text": "msg"}')
+        assert outbox.stats() == {'pending': 1, 'inflight': 0, 'sent': 1, 'failed': 0}
+
+        timer.tick(10.0)
+        assert worker.drain() == 0
+        assert outbox.stats() == {'pending': 0, 'inflight': 0, 'sent': 1, 'failed': 1}
+
+    def test_start_and_stop(self, tmp_path, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(SUCCESS_JSON))
+        with Outbox(str(tmp_path / 'outbox.db')) as outbox:
+            outbox.enqueue_many([('send', b'{"conversation_id": 1, "text": "msg"}', None)] * 20)
+
+            worker = OutboxWorker(outbox, client, concurrency=4, poll_interval=0.01)
+            worker.start()
+            while outbox.stats()['sent'] < 20:
+                worker._stop.wait(0.01)
+            worker.stop()
+            assert worker._threads == []
+
+
+class TestAsyncOutboxWorker:
+    @pytest.mark.asyncio
+    async def test_drain(self, outbox: Outbox, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+        outbox.send(conversation_id=1, text='msg')
+        outbox.send(conversation_id=2, text='msg')
+
+        claim = mocker.spy(outbox, 'claim')
+        settle = mocker.spy(outbox, 'settle')
+        threads = set()
+
+        def _timer() -> float:
+            threads.add(threading.current_thread())
+            return 1000.0
+
+        mocker.patch.object(outbox, '_timer', side_effect=_timer)
+
+        worker = AsyncOutboxWorker(outbox, client, concurrency=2)
+        assert await worker.drain() == 2
+        assert req.call_count == 2
+        assert outbox.stats()['sent'] == 2
+        assert claim.call_count == 2 and settle.call_count == 2
+        assert threads and threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, outbox: Outbox, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        worker = AsyncOutboxWorker(outbox, client, concurrency=2, poll_interval=0.01)
+        worker.start()
+        assert len(worker._tasks) == 2
+        await worker.stop()
+        assert worker._tasks == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_next_message(self, tmp_path, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+        with Outbox(str(tmp_path / 'outbox.db')) as outbox:
+            outbox.send(conversation_id=1, text='msg', send_at=outbox._timer() + 0.05)
+
+            worker = AsyncOutboxWorker(outbox, client, concurrency=1, poll_interval=60.0)
+            worker.start()
+            deadline = time.monotonic() + 5
+            while outbox.stats()['sent'] < 1 and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            await worker.stop()
+            assert outbox.stats()['sent'] == 1
+            assert req.call_count == 1
@@ -0,0 +1,145 @@
+import pytest
+import urllib3
+import aiosonic
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.blockkit import (
+    TextInlineType,
+    TextInline,
+    TextBlock,
+    ButtonBlock,
+    DividerBlock,
+    ActionBlock,
+    DescriptionBlock,
+    SelectBlockOption,
+    SelectBlock,
+    BlockKitPayload,
+    BlockKitBuilder,
+    BlockKitType,
+)
+from kakaowork.exceptions import InvalidBlock, PreflightError
+from kakaowork.models import ErrorCode
+from kakaowork.preflight import PreflightIssue, PreflightStats, Preflight
+from tests import _async_return
+
+SUCCESS_JSON = '{"success": true, "error": null}'
+
+
+class TestPreflight:
+    def test_valid(self):
+        preflight = Preflight()
+        preflight.check(text='msg', blocks=[DividerBlock(), ActionBlock(elements=[ButtonBlock(text='msg')])])
+        preflight.check()
+        assert preflight.stats == PreflightStats(checked=2, avoided=0)
+
+    def test_text_too_long(self):
+        preflight = Preflight()
+        with pytest.raises(PreflightError) as e:
+            preflight.check(text='t' * 2001)
+        assert e.value.code == ErrorCode.TEXT_TOO_LONG
+        assert e.value.issues == [
+            PreflightIssue(code=ErrorCode.TEXT_TOO_LONG, loc='text', message="The 'text' property's length should be less than or equal to 2000"),
+        ]
+        assert preflight.stats == PreflightStats(checked=1, avoided=1)
+
+    def test_invalid_blocks(self):
+        action = ActionBlock(elements=[ButtonBlock(text='msg')])
+        action.elements.extend([ButtonBlock(text='msg')] * 3)
+        text = TextBlock(text='msg', inlines=[TextInline(type=TextInlineType.STYLED, text='i' * 300)])
+        text.inlines.append(TextInline(type=TextInlineType.STYLED, text='i' * 300))
+        description = DescriptionBlock(term='term', content=TextBlock(text='msg'))
+        description.content.__dict__['text'] = 't' * 501
+        select = SelectBlock(name='name', options=[SelectBlockOption(text='text', value='value')])
+        select.options.clear()
+
+        with pytest.raises(PreflightError) as e:
+            Preflight().check(text='t' * 2001, blocks=[action, text, description, select, 'divider'] + [DividerBlock()] * 46)  # type: ignore
+        assert e.value.code == ErrorCode.INVALID_BLOCKS
+        assert [str(issue) for issue in e.value.issues] == [
+            "text: The 'text' property's length should be less than or equal to 2000",
+            "blocks: The 'blocks' property's length should be less than or equal to 50",
+            "blocks.0.elements: The 'elements' property's length should be less than or equal to 3",
+            "blocks.1.inlines: The 'inlines' property's all texts should be less than or equal to 500",
+            "blocks.2.content.text: The 'text' property's length should be less than or equal to 500",
+            "blocks.3.options: The 'options' property should be exists",
+            'blocks.4: The block should be a Block or an object, not str',
+        ]
+
+
+class TestClientPreflight:
+    def test_send(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy', preflight=True)
+        req = mocker.patch('urllib3.PoolManager.request', return_value=urllib3.HTTPResponse(body=SUCCESS_JSON, status=200))
+        limiter = mocker.spy(client.limiter, 'limit')
+        client.limiter.reset(capacity=10)
+
+        with pytest.raises(PreflightError):
+            client.messages.send(conversation_id=1, text='t' * 2001)
+        with pytest.raises(PreflightError):
+            client.messages.send_by_email('nobody@localhost', text='msg', blocks=[DividerBlock()] * 51)
+        req.assert_not_called()
+        limiter.assert_not_called()
+
+        assert client.messages.send_by(key='mykey', text='msg').success is True
+        assert client.messages.send(conversation_id=1, text=BlockKitPayload.encode(text='t' * 2001)).success is True
+        assert client.preflight is not None
+        assert client.preflight.stats == PreflightStats(checked=3, avoided=2)
+
+    def test_broadcast(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy', preflight=True)
+        req = mocker.patch('urllib3.PoolManager.request', return_value=urllib3.HTTPResponse(body=SUCCESS_JSON, status=200))
+
+        with pytest.raises(PreflightError):
+            client.messages.broadcast([1, 2], text='t' * 2001)
+        req.assert_not_called()
+
+        assert all(result.success for result in client.messages.broadcast([1, 2], text='msg'))
+        assert client.preflight is not None
+        assert client.preflight.stats == PreflightStats(checked=2, avoided=1)
+
+    def test_payloads(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy', preflight=True)
+        req = mocker.patch('urllib3.PoolManager.request', return_value=urllib3.HTTPResponse(body=SUCCESS_JSON, status=200))
+        template = BlockKitBuilder(type=BlockKitType.MESSAGE, text='{text}').compile()
+
+        with pytest.raises(InvalidBlock):
+            client.messages.send(conversation_id=1, text=template.render(text='t' * 5000))
+        with pytest.raises(ValueError):
+            client.messages.send(conversation_id=1, text=BlockKitBuilder(type=BlockKitType.MESSAGE, text='t' * 5000).freeze())
+        req.assert_not_called()
+
+        assert client.messages.send(conversation_id=1, text=template.render(text='msg')).success is True
+
+    def test_shared_preflight(self):
+        preflight = Preflight()
+        assert Kakaowork(app_key='dummy', preflight=preflight).preflight is preflight
+        assert AsyncKakaowork(app_key='dummy', preflight=preflight).preflight is preflight
+        assert Kakaowork(app_key='dummy').preflight is None
+
+    @pytest.mark.asyncio
+    async def test_async_send(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy', preflight=True)
+        resp = aiosonic.HttpResponse()
+        resp.body = SUCCESS_JSON.encode('utf-8')
+        resp.response_initial = {'version': 1.1, 'code': 200, 'reason': 'OK'}
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_return(resp))
+
+        with pytest.raises(PreflightError):
+            await client.messages.send_by(email='nobody@localhost', text='msg', blocks=[ActionBlock(elements=[ButtonBlock(text='msg')] * 3)] * 51)
+        req.assert_not_called()
+
+        assert (await client.messages.send(conversation_id=1, text='msg')).success is True
+        assert client.preflight is not None
+        assert client.preflight.stats == PreflightStats(checked=2, avoided=1)
+
+    @pytest.mark.asyncio
+    async def test_async_broadcast(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy', preflight=True)
+        req = mocker.patch('aiosonic.HTTPClient.request')
+
+        with pytest.raises(PreflightError):
+            client.messages.broadcast([1, 2], text='msg', blocks=[DividerBlock()] * 51)
+        req.assert_not_called()
+        assert client.preflight is not None
+        assert client.preflight.stats == PreflightStats(checked=1, avoided=1)
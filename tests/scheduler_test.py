@@ -0,0 +1,141 @@
+import threading
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kakaowork.client import Kakaowork, AsyncKakaowork
+from kakaowork.outbox import Outbox
+from kakaowork.scheduler import TimerWheel, Scheduler, AsyncScheduler
+from tests import SUCCESS_JSON, Clock, _response, _async_response
+
+TOO_MANY_JSON = '{"success": false, "error": {"code": "too_many_requests", "message": "slow down"}}'
+
+
+@pytest.fixture(scope='function')
+def outbox(timer: Clock):
+    timer.tick(1000.0)
+    with Outbox(':memory:', backoff=2.0, max_attempts=2) as outbox:
+        outbox._timer = timer
+        yield outbox
+
+
+class TestTimerWheel:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(slots=0)
+
+    def test_advance(self):
+        wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=4, start=100.0)
+        wheel.schedule(99.0, 'overdue')
+        wheel.schedule(101.5, 'b')
+        wheel.schedule(101.2, 'a')
+        wheel.schedule(110.0, 'far')
+        assert len(wheel) == 4
+        assert wheel.horizon == 4.0
+
+        assert wheel.advance(100.0) == ['overdue']
+        assert wheel.advance(101.9) == []
+        assert wheel.advance(102.0) == ['b', 'a']
+        assert wheel.advance(109.0) == []
+        assert wheel.advance(200.0) == ['far']
+        assert len(wheel) == 0
+
+    def test_schedule_past_tick(self):
+        wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=4, start=0.0)
+        wheel.advance(10.0)
+        wheel.schedule(5.0, 'late')
+        assert wheel.advance(10.0) == ['late']
+
+
+class TestScheduler:
+    def test_invalid_options(self, outbox: Outbox):
+        with pytest.raises(ValueError):
+            Scheduler(outbox, Kakaowork(app_key='dummy'), concurrency=0)
+
+    def test_run_pending(self, mocker: MockerFixture, outbox: Outbox, timer: Clock):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(SUCCESS_JSON))
+
+        scheduler = Scheduler(outbox, client, tick=1.0, slots=10)
+        assert scheduler.send(conversation_id=1, text='now') == 1
+        assert scheduler.send_by_email('nobody@localhost', text='soon', send_at=datetime.fromtimestamp(timer() + 5.0)) == 2
+        assert scheduler.send_by(key='mykey', text='later', send_at=timer() + 60.0) == 3
+
+        assert scheduler.run_pending() == 1
+        req.assert_called_once_with('POST', 'https://api.kakaowork.com/v1/messages.send', body=b'{"conversation_id": 1, "text": "now"}')
+        assert len(scheduler.wheel) == 1
+
+        timer.tick(5.0)
+        assert scheduler.run_pending() == 1
+        assert req.call_args.kwargs['body'] == b'{"email": "nobody@localhost", "text": "soon"}'
+
+        timer.tick(54.0)
+        assert scheduler.run_pending() == 0
+        timer.tick(1.0)
+        assert scheduler.run_pending() == 1
+        assert outbox.stats() == {'pending': 0, 'inflight': 0, 'sent': 3, 'failed': 0}
+
+    def test_retry(self, mocker: MockerFixture, outbox: Outbox, timer: Clock):
+        client = Kakaowork(app_key='dummy')
+        mocker.patch('urllib3.PoolManager.request', side_effect=[_response(TOO_MANY_JSON), _response(SUCCESS_JSON)])
+
+        scheduler = Scheduler(outbox, client, tick=1.0, slots=10)
+        scheduler.send(conversation_id=1, text='msg')
+        assert scheduler.run_pending() == 0
+        assert outbox.stats()['pending'] == 1
+
+        timer.tick(2.0)
+        assert scheduler.run_pending() == 1
+
+    def test_start_and_stop(self, mocker: MockerFixture):
+        client = Kakaowork(app_key='dummy')
+        req = mocker.patch('urllib3.PoolManager.request', side_effect=lambda *args, **kwargs: _response(SUCCESS_JSON))
+
+        with Outbox(':memory:') as outbox:
+            scheduler = Scheduler(outbox, client, tick=0.01)
+            scheduler.start()
+            scheduler.send(conversation_id=1, text='msg')
+            for _ in range(500):
+                if req.called:
+                    break
+                scheduler._stop.wait(0.01)
+            scheduler.stop()
+        assert req.call_count == 1
+
+
+class TestAsyncScheduler:
+    @pytest.mark.asyncio
+    async def test_run_pending(self, mocker: MockerFixture, outbox: Outbox, timer: Clock):
+        client = AsyncKakaowork(app_key='dummy')
+        req = mocker.patch('aiosonic.HTTPClient.request', side_effect=lambda *args, **kwargs: _async_response())
+
+        claim_ids = mocker.spy(outbox, 'claim_ids')
+        threads = []
+
+        def _timer() -> float:
+            threads.append(threading.current_thread())
+            return timer()
+
+        mocker.patch.object(outbox, '_timer', side_effect=_timer)
+
+        scheduler = AsyncScheduler(outbox, client, tick=1.0, slots=10)
+        scheduler.send(conversation_id=1, text='a', send_at=timer() + 1.0)
+        scheduler.send(conversation_id=2, text='b', send_at=datetime.fromtimestamp(timer() + 1.0))
+        assert await scheduler.run_pending() == 0
+
+        timer.tick(1.0)
+        threads.clear()
+        assert await scheduler.run_pending() == 2
+        assert req.call_count == 2
+        assert claim_ids.call_count == 1
+        assert threads and threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, outbox: Outbox):
+        scheduler = AsyncScheduler(outbox, AsyncKakaowork(app_key='dummy'), tick=0.01)
+        scheduler.start()
+        await scheduler.stop()
+        assert scheduler._task is None
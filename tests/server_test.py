@@ -0,0 +1,281 @@
+import json
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kakaowork.blockkit import TextBlock
+from kakaowork.client import AsyncKakaowork
+from kakaowork.models import ModalReactiveView, RequestModalReactiveResponse
+from kakaowork.reactive import (
+    BaseReactiveActionHandler,
+    BaseReactiveModalHandler,
+    BaseAsyncReactiveActionHandler,
+    BaseAsyncReactiveModalHandler,
+)
+from kakaowork.server import ReactiveServer
+from tests import _http_response
+
+MESSAGE = {'id': '1', 'text': 'msg', 'user_id': '1', 'conversation_id': 1, 'send_time': 1617889170, 'update_time': 1617889170}
+RESPONSE = RequestModalReactiveResponse(
+    view=ModalReactiveView(title='title', accept='accept', decline='decline', blocks=[TextBlock(text='block')], value='value'))
+
+
+def _body(type: str, **kwargs) -> bytes:
+    data = {'type': type, 'action_time': '2021-01-01', 'message': MESSAGE, 'value': 'value', 'react_user_id': 1, **kwargs}
+    return json.dumps(data).encode('utf-8')
+
+
+class ActionHandler(BaseReactiveActionHandler):
+    def __init__(self, event: Optional[threading.Event] = None) -> None:
+        self.event = event
+        self.started = threading.Semaphore(0)
+
+    def handle_submit(self, body):
+        self.started.release()
+        if self.event is not None:
+            self.event.wait(5)
+        if body.action_name == 'error':
+            raise RuntimeError('error')
+        return body.action_name == 'confirm'
+
+
+class ModalHandler(BaseReactiveModalHandler):
+    def handle_request(self, body):
+        return RESPONSE
+
+    def handle_submit(self, body):
+        return body.actions.get('answer') == 'yes'
+
+
+class AsyncActionHandler(BaseAsyncReactiveActionHandler):
+    async def handle_submit(self, body):
+        conversation_id = body.message.conversation_id
+        responses = await asyncio.gather(
+            self.client.messages.send(conversation_id=conversation_id, text='Thanks for your response'),
+            self.client.messages.send(conversation_id=conversation_id, text=f'{body.action_name} is submitted'),
+        )
+        return all(resp.success for resp in responses)
+
+
+class AsyncModalHandler(BaseAsyncReactiveModalHandler):
+    async def handle_request(self, body):
+        return RESPONSE
+
+    async def handle_submit(self, body):
+        resp = await self.client.messages.send(conversation_id=body.message.conversation_id, text=body.actions['answer'])
+        return resp.success
+
+
+async def _request(address: Tuple[str, int], data: bytes = b'', method: str = 'POST',
+                   headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+    reader, writer = await asyncio.open_connection(*address)
+    try:
+        await _send(writer, data, method, {'Connection': 'close', **(headers or {})})
+        return await _receive(reader)
+    finally:
+        writer.close()
+
+
+async def _send(writer: asyncio.StreamWriter, data: bytes, method: str = 'POST', headers: Optional[Dict[str, str]] = None) -> None:
+    headers = {'Content-Length': str(len(data)), **(headers or {})}
+    head = ''.join(f'{name}: {value}\r\n' for name, value in headers.items() if value is not None)
+    writer.write(f'{method} /callback HTTP/1.1\r\nHost: localhost\r\n{head}\r\n'.encode('latin-1') + data)
+    await writer.drain()
+
+
+async def _receive(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+    lines = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if line:
+            name, value = line.split(':', 1)
+            headers[name.strip()] = value.strip()
+    return int(lines[0].split(' ')[1]), headers, await reader.readexactly(int(headers['Content-Length']))
+
+
+class TestReactiveServer:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ReactiveServer(concurrency=0)
+        with pytest.raises(ValueError):
+            ReactiveServer(queue_size=-1)
+
+    @pytest.mark.asyncio
+    async def test_dispatch(self):
+        server = ReactiveServer(action_handler=ActionHandler(), modal_handler=ModalHandler())
+        await server.start('127.0.0.1', 0)
+        try:
+            assert await server.dispatch(_body('submit_action', action_name='confirm')) == (200, b'{}')
+            assert (await server.dispatch(_body('submit_action', action_name='cancel')))[0] == 400
+            assert await server.dispatch(_body('request_modal')) == (200, RESPONSE.json(exclude_none=True).encode('utf-8'))
+            assert (await server.dispatch(_body('submission', actions={'answer': 'yes'})))[0] == 200
+            assert (await server.dispatch(_body('submission', actions={'answer': 'no'})))[0] == 400
+            assert (await server.dispatch(_body('unknown')))[0] == 400
+            assert (await server.dispatch(_body('submit_action')))[0] == 400
+            assert (await server.dispatch(b'{"type": '))[0] == 400
+            assert (await server.dispatch(b'[]'))[0] == 400
+
+            status, data = await server.dispatch(_body('submit_action', action_name='error'))
+            assert status == 500
+            assert json.loads(data) == {'error': 'RuntimeError: error'}
+            assert server.stats.handled == 6
+            assert server.stats.failed == 1
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_no_handler(self):
+        server = ReactiveServer()
+        assert (await server.dispatch(_body('submit_action', action_name='confirm')))[0] == 404
+        assert (await server.dispatch(_body('request_modal')))[0] == 404
+
+    @pytest.mark.asyncio
+    async def test_http(self):
+        async with ReactiveServer(action_handler=ActionHandler(), max_body_size=1024) as server:
+            await server.start('127.0.0.1', 0)
+            status, headers, data = await _request(server.address, _body('submit_action', action_name='confirm'))
+            assert (status, data) == (200, b'{}')
+            assert headers['Content-Type'] == 'application/json'
+            assert headers['Connection'] == 'close'
+
+            assert (await _request(server.address, method='GET'))[0] == 405
+            assert (await _request(server.address, b'{}', headers={'Content-Length': None}))[0] == 411
+            assert (await _request(server.address, b'{}', headers={'Content-Length': 'abc'}))[0] == 400
+            assert (await _request(server.address, b'{}', headers={'Content-Length': '2048'}))[0] == 413
+            with pytest.raises(RuntimeError):
+                await server.start('127.0.0.1', 0)
+
+    @pytest.mark.asyncio
+    async def test_keep_alive(self):
+        async with ReactiveServer(action_handler=ActionHandler()) as server:
+            await server.start('127.0.0.1', 0)
+            reader, writer = await asyncio.open_connection(*server.address)
+            for action_name, expected in (('confirm', 200), ('cancel', 400), ('confirm', 200)):
+                await _send(writer, _body('submit_action', action_name=action_name))
+                status, headers, _ = await _receive(reader)
+                assert status == expected
+                assert headers['Connection'] == 'keep-alive'
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_overload(self):
+        event = threading.Event()
+        handler = ActionHandler(event)
+        loop = asyncio.get_running_loop()
+        async with ReactiveServer(action_handler=handler, concurrency=1, queue_size=1) as server:
+            await server.start('127.0.0.1', 0)
+            running = asyncio.ensure_future(_request(server.address, _body('submit_action', action_name='confirm')))
+            await loop.run_in_executor(None, handler.started.acquire)
+            queued = asyncio.ensure_future(_request(server.address, _body('submit_action', action_name='confirm')))
+            while server.pending < 2:
+                await asyncio.sleep(0.001)
+
+            status, headers, _ = await _request(server.address, _body('submit_action', action_name='confirm'))
+            assert status == 503
+            assert headers['Retry-After'] == '1'
+            assert server.stats.rejected == 1
+
+            event.set()
+            assert (await running)[0] == 200
+            assert (await queued)[0] == 200
+            assert server.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_graceful_shutdown(self):
+        event = threading.Event()
+        handler = ActionHandler(event)
+        loop = asyncio.get_running_loop()
+        server = ReactiveServer(action_handler=handler)
+        await server.start('127.0.0.1', 0)
+        address = server.address
+
+        idle_reader, idle_writer = await asyncio.open_connection(*address)
+        reader, writer = await asyncio.open_connection(*address)
+        await _send(writer, _body('submit_action', action_name='confirm'))
+        await loop.run_in_executor(None, handler.started.acquire)
+
+        closing = asyncio.ensure_future(server.close())
+        await asyncio.sleep(0.01)
+        assert await idle_reader.read() == b''
+        assert not closing.done()
+
+        event.set()
+        status, headers, _ = await _receive(reader)
+        assert status == 200
+        assert headers['Connection'] == 'close'
+        await closing
+        with pytest.raises(OSError):
+            await asyncio.open_connection(*address)
+        idle_writer.close()
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_timeout(self):
+        event = threading.Event()
+        handler = ActionHandler(event)
+        loop = asyncio.get_running_loop()
+        server = ReactiveServer(action_handler=handler)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection(*server.address)
+        await _send(writer, _body('submit_action', action_name='confirm'))
+        await loop.run_in_executor(None, handler.started.acquire)
+
+        await server.close(timeout=0.01)
+        assert await reader.read() == b''
+        event.set()
+        writer.close()
+
+
+class TestAsyncReactiveHandlers:
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            BaseAsyncReactiveActionHandler(AsyncKakaowork(app_key='dummy'))  # type: ignore
+        with pytest.raises(TypeError):
+            BaseAsyncReactiveModalHandler(AsyncKakaowork(app_key='dummy'))  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_dispatch(self, mocker: MockerFixture):
+        client = AsyncKakaowork(app_key='dummy')
+        sent = []
+
+        async def _request(*args, **kwargs):
+            sent.append(json.loads(kwargs['data'])['text'])
+            return _http_response()
+
+        mock = mocker.patch('aiosonic.HTTPClient.request', side_effect=_request)
+        action_handler, modal_handler = AsyncActionHandler(client), AsyncModalHandler(client)
+        assert action_handler.client is modal_handler.client
+
+        server = ReactiveServer(action_handler=action_handler, modal_handler=modal_handler)
+        assert await server.dispatch(_body('submit_action', action_name='confirm')) == (200, b'{}')
+        assert await server.dispatch(_body('request_modal')) == (200, RESPONSE.json(exclude_none=True).encode('utf-8'))
+        assert (await server.dispatch(_body('submission', actions={'answer': 'yes'})))[0] == 200
+        assert (await server.dispatch(_body('submission', actions={})))[0] == 500
+        assert sorted(sent) == ['Thanks for your response', 'confirm is submitted', 'yes']
+        assert mock.call_count == 3
+        assert server.stats.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency(self):
+        event = asyncio.Event()
+        running = []
+
+        class Handler(BaseAsyncReactiveActionHandler):
+            async def handle_submit(self, body):
+                running.append(threading.current_thread())
+                await event.wait()
+                return True
+
+        async with ReactiveServer(action_handler=Handler(AsyncKakaowork(app_key='dummy')), concurrency=2, queue_size=0) as server:
+            await server.start('127.0.0.1', 0)
+            requests = [asyncio.ensure_future(_request(server.address, _body('submit_action', action_name='confirm'))) for _ in range(2)]
+            while len(running) < 2:
+                await asyncio.sleep(0.001)
+            assert running == [threading.current_thread()] * 2
+            assert (await _request(server.address, _body('submit_action', action_name='confirm')))[0] == 503
+
+            event.set()
+            assert [status for status, _, _ in await asyncio.gather(*requests)] == [200, 200]
@@ -0,0 +1,108 @@
+import os
+import json
+import time
+
+import pytest
+
+from kakaowork.blockkit import BlockKitType, BlockKitPayload, TextBlock
+from kakaowork.templates import TemplateRegistry
+
+
+def _write(path, data, mtime_ns: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(scope='function')
+def directory(tmp_path):
+    _write(tmp_path / 'welcome.json', {'type': 'message', 'text': 'Welcome', 'blocks': [{'type': 'text', 'text': 'hello'}]}, 1)
+    _write(tmp_path / 'hr' / 'survey.json', {'type': 'modal', 'title': 'title', 'accept': 'accept', 'decline': 'decline', 'value': 'value'}, 1)
+    _write(tmp_path / 'README.md', '# templates', 1)
+    return tmp_path
+
+
+class TestTemplateRegistry:
+    def test_load(self, directory):
+        registry = TemplateRegistry(str(directory))
+        assert sorted(registry) == ['hr/survey', 'welcome']
+        assert len(registry) == 2
+        assert 'welcome' in registry
+        assert registry.get('welcome').blocks == [TextBlock(text='hello')]
+        assert registry.get('hr/survey').type == BlockKitType.MODAL
+        assert registry.get('welcome') is registry.get('welcome')
+
+        payload = registry.payload('welcome')
+        assert payload == BlockKitPayload.encode(text='Welcome', blocks=[TextBlock(text='hello')])
+        assert registry.payload('welcome') is payload
+        with pytest.raises(ValueError):
+            registry.payload('hr/survey')
+        with pytest.raises(KeyError):
+            registry.get('unknown')
+
+    def test_reload_on_mtime(self, directory):
+        registry = TemplateRegistry(str(directory))
+        builder = registry.get('welcome')
+        payload = registry.payload('welcome')
+
+        _write(directory / 'welcome.json', {'type': 'message', 'text': 'Hello'}, 1)
+        assert registry.get('welcome').text == 'Hello'
+        assert registry.payload('welcome') != payload
+
+        _write(directory / 'welcome.json', {'type': 'message', 'text': 'Howdy'}, 2)
+        registry.check_mtime = False
+        assert registry.get('welcome').text == 'Hello'
+        registry.check_mtime = True
+        assert registry.get('welcome').text == 'Howdy'
+        assert builder.text == 'Welcome'
+
+    def test_invalid_file(self, directory):
+        _write(directory / 'broken.json', '{"type": "message", ', 1)
+        registry = TemplateRegistry(str(directory))
+        assert 'broken' not in registry
+        assert isinstance(registry.errors['broken'], ValueError)
+        with pytest.raises(KeyError):
+            registry.get('broken')
+
+        _write(directory / 'welcome.json', {'type': 'unknown'}, 2)
+        assert registry.get('welcome').text == 'Welcome'
+        assert 'welcome' in registry.errors
+        error = registry.errors['welcome']
+        assert registry.refresh() == []
+        assert registry.refresh() == []
+        assert registry.errors['welcome'] is error
+        assert registry.get('welcome').text == 'Welcome'
+
+        _write(directory / 'welcome.json', {'type': 'message', 'text': 'Hello'}, 3)
+        assert registry.refresh() == ['welcome']
+        assert 'welcome' not in registry.errors
+
+    def test_invalid_change_on_refresh(self, directory):
+        registry = TemplateRegistry(str(directory), check_mtime=False)
+        _write(directory / 'welcome.json', '{"type": ', 2)
+        assert registry.refresh() == []
+        assert registry.refresh() == []
+        assert isinstance(registry.errors['welcome'], ValueError)
+        assert registry.get('welcome').text == 'Welcome'
+
+    def test_refresh(self, directory):
+        registry = TemplateRegistry(str(directory))
+        assert registry.refresh() == []
+
+        _write(directory / 'welcome.json', {'type': 'message', 'text': 'Hello'}, 2)
+        _write(directory / 'goodbye.json', {'type': 'message', 'text': 'Goodbye'}, 1)
+        os.remove(directory / 'hr' / 'survey.json')
+        assert sorted(registry.refresh()) == ['goodbye', 'hr/survey', 'welcome']
+        assert sorted(registry) == ['goodbye', 'welcome']
+        assert registry.get('welcome').text == 'Hello'
+
+    def test_watch(self, directory):
+        with TemplateRegistry(str(directory)) as registry:
+            registry.start(interval=0.01)
+            assert registry.watching
+            _write(directory / 'welcome.json', {'type': 'message', 'text': 'Hello'}, 2)
+            deadline = time.monotonic() + 5
+            while registry.get('welcome').text != 'Hello' and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert registry.get('welcome').text == 'Hello'
+        assert not registry.watching
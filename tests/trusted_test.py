@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from kakaowork.blockkit import TextBlock
+from kakaowork.codec import Codec
+from kakaowork.client import Kakaowork
+from kakaowork.models import (
+    ErrorCode,
+    BaseResponse,
+    UserListResponse,
+    MessageResponse,
+    SpaceResponse,
+    DepartmentListResponse,
+)
+from kakaowork.trusted import construct
+
+USERS = {
+    'success': True,
+    'error': None,
+    'cursor': None,
+    'users': [{
+        'id': str(i),
+        'space_id': '1',
+        'name': 'kim',
+        'identifications': [{
+            'type': 'email',
+            'value': 'kim@localhost'
+        }],
+        'tels': [],
+        'work_start_time': 1617889170,
+        'work_end_time': 0,
+        'vacation_start_time': '2021-04-08T13:39:30+00:00',
+        'unknown': 'ignored',
+    } for i in range(3)],
+}
+MESSAGE = {
+    'success': True,
+    'message': {
+        'id': '1',
+        'text': 'msg',
+        'user_id': '1',
+        'conversation_id': 1,
+        'send_time': 1617889170,
+        'update_time': 1617889170,
+        'blocks': [{
+            'type': 'text',
+            'text': 'msg'
+        }],
+    },
+}
+SPACE = {
+    'success': True,
+    'space': {
+        'id': 1,
+        'kakaoi_org_id': 1,
+        'name': 'space',
+        'color_code': 'default',
+        'color_tone': 'light',
+        'permitted_ext': ['*'],
+        'profile_name_format': 'name_only',
+        'profile_position_format': 'responsibility',
+        'logo_url': '',
+    },
+}
+DEPARTMENTS = {
+    'success': True,
+    'departments': [{
+        'id': '1',
+        'ids_path': '1',
+        'parent_id': '0',
+        'space_id': '1',
+        'name': 'dev',
+        'code': 'dev',
+        'user_count': 1,
+        'users_ids': [1],
+    }],
+}
+
+
+class TestConstruct:
+    @pytest.mark.parametrize('model, obj', [
+        (UserListResponse, USERS),
+        (MessageResponse, MESSAGE),
+        (SpaceResponse, SPACE),
+        (DepartmentListResponse, DEPARTMENTS),
+    ])
+    def test_same_as_validated(self, model, obj):
+        resp = construct(model, obj)
+        assert resp == model.parse_obj(obj)
+        assert resp.dict() == model.parse_obj(obj).dict()
+
+    def test_types(self):
+        resp = construct(UserListResponse, USERS)
+        user = resp.users[0]
+        assert isinstance(user.work_start_time, datetime)
+        assert user.work_start_time.utcoffset() == timedelta(hours=9)
+        assert user.work_end_time is None
+        assert user.vacation_end_time is None
+        assert user.identifications[0].value == 'kim@localhost'
+        assert user.__fields_set__ >= {'id', 'work_start_time'}
+        assert not hasattr(user, 'unknown')
+
+        message = construct(MessageResponse, MESSAGE).message
+        assert message.blocks == [TextBlock(text='msg')]
+
+    def test_error(self):
+        resp = construct(BaseResponse, {'success': False, 'error': {'code': 'unsupported_code', 'message': 'error'}})
+        assert resp.error.code == ErrorCode.UNKNOWN
+
+    def test_not_validated(self):
+        assert construct(BaseResponse, {'success': 'maybe'}).success == 'maybe'
+        with pytest.raises(ValidationError):
+            construct(BaseResponse, ['not', 'a', 'dict'])
+
+
+class TestTrustedCodec:
+    def test_sample_rate(self):
+        with pytest.raises(ValueError):
+            Codec(trusted=True, sample_rate=1.5)
+
+        data = b'{"success": "maybe"}'
+        assert Codec(trusted=True).parse(BaseResponse, data).success == 'maybe'
+        with pytest.raises(ValidationError):
+            Codec(trusted=True, sample_rate=1.0).parse(BaseResponse, data)
+        with pytest.raises(ValidationError):
+            Codec().parse(BaseResponse, data)
+
+    def test_client(self):
+        client = Kakaowork(app_key='dummy', trusted=True, sample_rate=0.01)
+        assert client.codec.trusted is True
+        assert client.codec.sample_rate == 0.01
@@ -1,11 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from pytz import utc
 
 from kakaowork.blockkit import DividerBlock
-from kakaowork.consts import KST
-from kakaowork.utils import (is_bool, is_int, is_float, text2bool, to_kst, normalize_token, parse_kv_pairs, json_default, drop_none)
+from kakaowork.consts import KST, KST_FIXED
+from kakaowork.utils import (is_bool, is_int, is_float, text2bool, to_kst, to_kst_many, normalize_token, parse_kv_pairs, json_default, drop_none)
 
 
 def test_is_bool():
@@ -56,6 +56,27 @@ def test_to_kst():
     assert to_kst(datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc)) == KST.localize(datetime(2021, 4, 8, 22, 39, 30))
 
 
+def test_to_kst_fixed_offset():
+    assert to_kst(1617889170).tzinfo is KST_FIXED
+    assert to_kst(datetime(2021, 4, 8, 22, 39, 30)).tzinfo is KST_FIXED
+    assert to_kst(datetime(2021, 4, 8, 13, 39, 30, tzinfo=utc)).tzinfo is KST_FIXED
+    # KST had DST in 1988, which only pytz knows.
+    assert to_kst(579052800).utcoffset() == timedelta(hours=10)
+    assert to_kst(datetime(1988, 5, 8, 3, 0, 0)).utcoffset() == timedelta(hours=10)
+    assert to_kst(datetime(1988, 5, 7, 18, 0, 0, tzinfo=utc)).utcoffset() == timedelta(hours=10)
+    for timestamp in (599583599, 599583600, 1617889170):
+        assert to_kst(timestamp) == datetime.fromtimestamp(timestamp, tz=utc)
+        assert to_kst(timestamp).replace(tzinfo=None) == datetime.fromtimestamp(timestamp, tz=utc).astimezone(KST).replace(tzinfo=None)
+    with pytest.raises(ValueError):
+        to_kst('1617889170')
+
+
+def test_to_kst_many():
+    converted = to_kst_many([1617889170, 1617892770, 1617889170])
+    assert converted == [to_kst(1617889170), to_kst(1617892770), to_kst(1617889170)]
+    assert converted[0] is converted[2]
+
+
 def test_normalize_token():
     assert normalize_token('') == ''
     assert normalize_token('--to-str') == '--to-str'
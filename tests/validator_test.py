@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from kakaowork.validator import BlockKitIssue, validate_blockkit, validate_file, validate_files, expand_paths
+
+VALID = {'type': 'message', 'text': 'msg', 'blocks': [{'type': 'text', 'text': 'msg'}, {'type': 'divider'}]}
+
+
+@pytest.fixture(scope='function')
+def corpus(tmp_path):
+    (tmp_path / 'valid.json').write_text(json.dumps(VALID))
+    (tmp_path / 'list.json').write_text(json.dumps([VALID, {'type': 'message', 'blocks': [{'type': 'button', 'text': 'b' * 21}]}]))
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'sends.jsonl').write_text('\n'.join([
+        json.dumps({'conversation_id': 1, **VALID}),
+        '',
+        '{"type": "message",',
+        json.dumps({'type': 'message', 'blocks': [{'text': 'msg'}]}),
+    ]))
+    (tmp_path / 'sub' / 'notes.txt').write_text('not a payload')
+    return tmp_path
+
+
+class TestValidateBlockkit:
+    @pytest.mark.parametrize(
+        'data,expectation',
+        [
+            (VALID, []),
+            ({'email': 'nobody@localhost', **VALID}, []),
+            ([], ['The payload should be an object']),
+            ({'text': 'msg'}, ['type: field required']),
+            ({'type': 'message', 'text': 't' * 2001}, ["text: The 'text' property's length should be less than or equal to 2000"]),
+            ({'type': 'message', 'blocks': [{'type': 'divider'}] * 51}, ["blocks: The 'blocks' property's length should be less than or equal to 50"]),
+            ({'type': 'message', 'blocks': {}}, ['blocks: The blocks should be a list']),
+            ({'type': 'message', 'blocks': [{'type': 'unknown'}]}, ["blocks.0: Unknown block type: 'unknown'"]),
+            ({'type': 'message', 'blocks': [{'text': 'msg'}]}, ["blocks.0: There is no 'type' from the block"]),
+            ({'type': 'message', 'blocks': ['abc']}, ['blocks.0: The block should be a Block or an object, not str']),
+            ({'type': 'message', 'blocks': [{'type': 'action', 'elements': [{'type': 'button', 'text': 'msg'}] * 4}]},
+             ["blocks.0.elements: The 'elements' property's length should be less than or equal to 3"]),
+            ({'type': 'modal', 'text': 'msg', 'blocks': [{'type': 'select', 'name': 'name', 'options': []}]},
+             ["The 'text' property can be set only for message type", "blocks.0.options: The 'options' property should be exists"]),
+        ],
+    )
+    def test_validate_blockkit(self, data, expectation):
+        assert [str(issue) for issue in validate_blockkit(data)] == expectation
+
+
+class TestValidateFiles:
+    def test_validate_file(self, corpus):
+        report = validate_file(str(corpus / 'sub' / 'sends.jsonl'))
+        assert report.payloads == 3
+        assert not report.success
+        assert [issue.line for issue in report.issues] == [3, 4]
+        assert report.issues[1] == BlockKitIssue(line=4, loc='blocks.0', message="There is no 'type' from the block")
+        assert list(report.lines())[1] == f"{corpus / 'sub' / 'sends.jsonl'}:4: blocks.0: There is no 'type' from the block"
+
+        assert validate_file(str(corpus / 'valid.json')).success
+        report = validate_file(str(corpus / 'list.json'))
+        assert report.issues == [
+            BlockKitIssue(index=1, loc='blocks.0.text', message="The 'text' property's length should be less than or equal to 20"),
+        ]
+        assert list(report.lines()) == [
+            f"{corpus / 'list.json'}[1]:blocks.0.text: The 'text' property's length should be less than or equal to 20",
+        ]
+        assert validate_file(str(corpus / 'missing.json')).issues[0].message.startswith('FileNotFoundError')
+
+    def test_expand_paths(self, corpus):
+        paths = list(expand_paths([str(corpus), str(corpus / 'sub' / 'notes.txt')]))
+        assert paths == [str(corpus / name) for name in ('list.json', 'valid.json', 'sub/sends.jsonl', 'sub/notes.txt')]
+
+    @pytest.mark.parametrize('processes', [1, 2])
+    def test_validate_files(self, corpus, processes):
+        reports = list(validate_files([str(corpus)], processes=processes, chunksize=1))
+        assert [(report.path, report.success, report.payloads) for report in reports] == [
+            (str(corpus / 'list.json'), False, 2),
+            (str(corpus / 'valid.json'), True, 1),
+            (str(corpus / 'sub' / 'sends.jsonl'), False, 3),
+        ]